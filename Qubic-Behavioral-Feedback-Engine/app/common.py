@@ -0,0 +1,760 @@
+"""Shared state, navigation and layout helpers for app.py and page templates.
+
+Streamlit re-executes app.py on every interaction, but modules it imports
+run once per process: the page templates (page_templates/) and the page
+catalog import these helpers instead of living in the script. Nothing here
+calls Streamlit at import time, so `st.set_page_config` in app.py still
+comes first.
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from page_registry import Page, PageRegistry
+from qubic_rpc import QUBIC_PUBLIC_RPC, get_client
+from storage import (
+    WriteBehind,
+    authenticate,
+    get_backend,
+    load_user_state,
+    register_account,
+    save_user_state,
+)
+from user_state import ActivityDays, AttemptIndex, DerivedState, XPLedger
+
+
+
+# ============================================================
+
+# USER STATE & BEHAVIOR ENGINE HELPERS (DEMO)
+
+# ============================================================
+
+
+def init_user_state():
+
+    if "user_state" not in st.session_state:
+
+        # Keep history beyond the ring buffer only if signing in can save it.
+        xp_ledger = XPLedger(keep_evicted=get_backend() is not None)
+        st.session_state.user_state = {
+
+            "username": "Guest",      # simple "login"
+
+            "xp": 0,                  # total XP
+
+            "coins": 0,               # soft currency, earned from XP
+
+            "gems": 0,                # reserved for future use
+
+            "tests_taken": 0,
+            "test_history": [],       # list of dicts with test attempts (append-only)
+            "test_index": AttemptIndex(),  # latest attempt per test, XP/tests per subject
+            "xp_ledger": xp_ledger,   # per-day / per-source XP totals over all events
+            "xp_events": xp_ledger.events,  # ring buffer of the most recent XP events
+            "days_active": ActivityDays(),  # sorted ISO dates when user did something, with streaks
+            "daily_tasks_done": {},   # mapping of YYYY-MM-DD -> list of completed task ids
+            "token_balance": 0.0,     # simulated token holdings
+            "token_trades": [],       # list of token buy/sell events
+            "ai_chat_history": [],    # session-only AI helper conversation
+            "derived": DerivedState(),  # cached values derived from the fields above
+        }
+
+    _upgrade_user_state(st.session_state.user_state)
+
+
+def _upgrade_user_state(state):
+    """Bring a state dict created by an older app version up to date."""
+    if "xp_ledger" not in state:
+        state["xp_ledger"] = XPLedger.from_events(
+            state.get("xp_events", []), keep_evicted=get_backend() is not None
+        )
+        state["xp_events"] = state["xp_ledger"].events
+    if not isinstance(state.get("days_active"), ActivityDays):
+        state["days_active"] = ActivityDays(state.get("days_active", []))
+    if "derived" not in state:
+        state["derived"] = DerivedState()
+    if "test_index" not in state:
+        state["test_index"] = AttemptIndex.from_history(state.get("test_history", []))
+
+
+# Placeholder display names (anonymous visitors, the demo Google button, a
+# sign-up without a username). They identify nobody, so choosing one leaves
+# the session's stored state and keeps it session-only.
+GUEST_USERNAMES = frozenset({"Guest", "Member", "Google User"})
+
+
+def account_id(email: str) -> str:
+    """Key of a user's stored state: the normalized email address."""
+    return (email or "").strip().lower()
+
+
+def _state_writer() -> Optional[WriteBehind]:
+    """Write-behind buffer of the signed-in user, or None for session-only state."""
+    return st.session_state.get("state_writer")
+
+
+def _detach_user():
+    """Flush and stop writing the session's stored state; it stays session-only."""
+    if _state_writer() is not None:
+        flush_user_state()
+        st.session_state["state_writer"] = None
+
+
+def _switch_user(user_id: str, username: str):
+    """Attach the session to the stored state of an authenticated `user_id`.
+
+    A known user's state is loaded from the backend; a new user keeps the
+    session's progress so far, saved as their initial state under the
+    display name `username`.
+    """
+    writer = _state_writer()
+    if writer is not None and writer.user_id == user_id:
+        return
+    _detach_user()
+    backend = get_backend()
+    stored = load_user_state(backend, user_id)
+    if stored is None:
+        state = get_user_state()
+        state["username"] = username
+        state["email"] = user_id
+        save_user_state(backend, user_id, state)
+        state["xp_ledger"].drop_evicted()  # stored now; keep only the ring buffer
+    else:
+        st.session_state.user_state = stored
+    st.session_state["state_writer"] = WriteBehind(backend, user_id, baseline=get_user_state())
+
+
+def sign_in(email: str, password: str) -> bool:
+    """Sign in with email and password; False if the credentials do not match.
+
+    With the state store disabled (storage.get_backend) this only sets the
+    session's profile, as nothing is loaded or saved.
+    """
+    user_id = account_id(email)
+    backend = get_backend()
+    if backend is None:
+        set_user_profile(email.strip() or "Guest", email.strip())
+        return True
+    if not user_id or not authenticate(backend, user_id, password):
+        return False
+    _switch_user(user_id, user_id)
+    record_activity_day()
+    return True
+
+
+def sign_up(username: str, email: str, password: str) -> bool:
+    """Create an account keyed by email and sign in to it.
+
+    False if the email is missing or already registered with another
+    password. The session's progress so far becomes the new account's state.
+    """
+    user_id = account_id(email)
+    backend = get_backend()
+    if backend is None:
+        set_user_profile(username.strip() or email.strip() or "Member", email.strip())
+        return True
+    if not user_id or not password:
+        return False
+    if not register_account(backend, user_id, password) and not authenticate(backend, user_id, password):
+        return False
+    _switch_user(user_id, username.strip() or user_id)
+    record_activity_day()
+    return True
+
+
+def sync_user_state():
+    """Stage the signed-in user's changed fields; writes only if a batch is due."""
+    writer = _state_writer()
+    if writer is not None:
+        writer.sync(get_user_state())
+        writer.maybe_flush()
+
+
+def flush_user_state():
+    """Write everything buffered for the signed-in user now."""
+    writer = _state_writer()
+    if writer is not None:
+        writer.sync(get_user_state())
+        writer.flush()
+
+
+
+
+def get_user_state():
+
+    init_user_state()
+
+    return st.session_state.user_state
+
+
+
+
+
+def level_from_xp(xp: int) -> int:
+
+    """Very simple level curve: 1000 XP per level."""
+
+    return xp // 1000 + 1
+
+
+
+
+
+def record_activity_day():
+
+    """Mark that the user was active today (for streak computation)."""
+
+    state = get_user_state()
+
+    today = date.today().isoformat()
+
+    if state["days_active"].add(today):
+
+        state["derived"].bump()
+
+        writer = _state_writer()
+
+        if writer is not None:
+
+            writer.active_day(today)
+
+
+
+
+
+def compute_streak(days_active):
+
+    """Compute a simple 'current streak in days' from the active dates.
+
+    Constant time for the `ActivityDays` in user state; a plain list of ISO
+    dates is indexed first.
+    """
+
+    if not isinstance(days_active, ActivityDays):
+
+        days_active = ActivityDays(days_active)
+
+    return days_active.current_streak()
+
+
+
+
+
+
+
+def grant_xp(amount: int, source: str, description: str):
+
+    """Add XP, derive some coins, and log an XP event."""
+
+    if amount <= 0:
+
+        return
+
+    state = get_user_state()
+
+    state["xp"] += amount
+
+    # Simple rule: earn 1 coin per 10 XP
+
+    state["coins"] += amount // 10
+
+    event = {
+
+        "ts": datetime.utcnow().isoformat(timespec="seconds"),
+
+        "source": source,
+
+        "amount": int(amount),
+
+        "description": description,
+
+    }
+
+    state["xp_ledger"].record(event)
+
+    state["derived"].bump()
+
+    writer = _state_writer()
+
+    if writer is not None:
+
+        writer.xp_event(event)
+
+    record_activity_day()
+
+
+
+
+
+def record_test_attempt(test_id: str, name: str, subject: str, correct: int, total: int, time_sec: int):
+
+    """Store a test attempt and award XP based on percentage (up to 200 XP)."""
+
+    state = get_user_state()
+
+    total = max(total, 1)
+
+    correct = max(0, min(correct, total))
+
+    percent = round((correct / total) * 100.0, 1)
+
+
+
+    # XP rule: up to 200 XP per test based on percent
+
+    xp_gain = int(percent * 2)
+
+    grant_xp(xp_gain, "Test", f"{name} ({subject})")
+
+
+
+    attempt = {
+
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+
+        "test_id": test_id,
+
+        "name": name,
+
+        "subject": subject,
+
+        "correct": correct,
+
+        "total": total,
+
+        "percent": percent,
+
+        "time_sec": int(time_sec),
+
+        "xp_gained": xp_gain,
+
+    }
+
+    state["test_history"].append(attempt)
+
+    state["test_index"].record(attempt)
+
+    state["tests_taken"] += 1
+
+    state["derived"].bump()
+
+    writer = _state_writer()
+
+    if writer is not None:
+
+        writer.test_attempt(attempt)
+
+    record_activity_day()
+
+
+
+def set_current_scenario(page_id: str, name: str, subject: str):
+    """Remember the active scenario/test metadata for simulation."""
+    st.session_state.current_test_id = page_id
+    st.session_state.current_test_name = name
+    st.session_state.current_test_subject = subject
+    record_activity_day()
+
+
+def log_token_trade(action: str, amount: float, price: float, coin_delta: int, token_delta: float):
+    """Log a token trade into state."""
+    state = get_user_state()
+    entry = {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "action": action,
+        "amount": round(amount, 2),
+        "price": round(price, 2),
+        "coin_delta": int(coin_delta),
+        "token_delta": round(token_delta, 2),
+    }
+    state["token_trades"].append(entry)
+    writer = _state_writer()
+    if writer is not None:
+        writer.token_trade(entry)
+
+
+def set_user_profile(username: str, email: str = None):
+    """Set the session's display name and email.
+
+    This never loads stored state (see sign_in); choosing a placeholder name
+    from GUEST_USERNAMES leaves the signed-in account's state.
+    """
+    if username in GUEST_USERNAMES:
+        _detach_user()
+    state = get_user_state()
+    if username:
+        state["username"] = username
+    if email:
+        state["email"] = email
+    record_activity_day()
+
+
+def ensure_chat_history():
+    """Make sure the lightweight AI chat buffer exists."""
+    state = get_user_state()
+    history = state.get("ai_chat_history")
+    if not isinstance(history, list):
+        history = []
+        state["ai_chat_history"] = history
+    return history
+
+
+
+
+def get_last_test_attempt():
+
+    state = get_user_state()
+
+    if not state["test_history"]:
+
+        return None
+
+    return state["test_history"][-1]
+
+
+
+
+
+def get_last_attempt_for_test(test_id: str):
+
+    state = get_user_state()
+
+    return state["test_index"].latest.get(test_id)
+
+
+
+
+
+def get_xp_by_day():
+
+    """Return dict { 'YYYY-MM-DD': total_xp } over all XP events (read-only).
+
+    Maintained incrementally by `grant_xp`, so this is a lookup, not a scan.
+    """
+
+    state = get_user_state()
+
+    return state["xp_ledger"].by_day
+
+
+
+
+
+def get_subject_xp_breakdown():
+
+    """Use 'subject' in test_history as behavior channels for now.
+
+    Running totals kept by `record_test_attempt`; treat as read-only.
+    """
+
+    state = get_user_state()
+
+    return state["test_index"].by_subject
+
+
+# ============================================================
+# QUBIC PUBLIC TESTNET RPC (OPTION 2: LIGHTWEIGHT INTEGRATION)
+# ============================================================
+# Calls go through the pooled, process-wide client in `qubic_rpc`
+# (keep-alive connections, per-endpoint timeouts, retries with backoff).
+
+def fetch_qubic_status(rpc_endpoint: str = QUBIC_PUBLIC_RPC):
+    """
+    Call /v1/status on a Qubic RPC endpoint.
+    Default: public testnet at https://testnet-rpc.qubicdev.com
+    """
+    return get_client().status(rpc_endpoint)
+
+
+def fetch_qubic_tick(rpc_endpoint: str = QUBIC_PUBLIC_RPC):
+    """
+    Try to read a 'tick' or height-like value from the RPC.
+
+    NOTE: The public testnet RPC at qubicdev.com does NOT expose /v1/tick,
+    so we treat 404 specially and return a friendly error.
+    """
+    return get_client().tick(rpc_endpoint)
+
+
+def fetch_qubic_balance(identity: str, rpc_endpoint: str = QUBIC_PUBLIC_RPC):
+    """
+    Call /v1/balances/{identity} for a given address ID on Qubic.
+    """
+    return get_client().balance(identity, rpc_endpoint)
+
+
+def fetch_qubic_network(rpc_endpoint: str = QUBIC_PUBLIC_RPC):
+    """Status and tick fetched concurrently: {"status": ..., "tick": ...}."""
+    return get_client().network_snapshot(rpc_endpoint)
+
+
+
+def compute_best_streak(days_active):
+    """Longest streak of consecutive active days (see `compute_streak`)."""
+    if not isinstance(days_active, ActivityDays):
+        days_active = ActivityDays(days_active)
+    return days_active.best_streak()
+
+
+def ensure_daily_task_state():
+    """Guarantee the per-day mission tracking structure exists."""
+    state = get_user_state()
+    if "daily_tasks_done" not in state or not isinstance(state["daily_tasks_done"], dict):
+        state["daily_tasks_done"] = {}
+    return state["daily_tasks_done"]
+
+
+def render_demo_disclaimer(note: str = None):
+    """Consistent session notice for behavior-like stats and rewards."""
+    message = note or (
+        "All scores, XP, coins, and missions shown here are simulated. Guest progress resets "
+        "on refresh; signed-in progress is saved between visits."
+    )
+    st.markdown(f"*{message}*")
+
+
+def compute_achievements_catalog(state):
+    """
+    Build a simple achievements list from XP, tests taken and streak.
+    Returns (achievements, best_streak).
+
+    Cached in state["derived"] until grant_xp, record_test_attempt or
+    record_activity_day changes the inputs (or the day rolls over).
+    """
+    return state["derived"].get(
+        "achievements_catalog", lambda: _build_achievements_catalog(state), date.today()
+    )
+
+
+def _build_achievements_catalog(state):
+    xp = state["xp"]
+    tests = state["tests_taken"]
+    days = state["days_active"]
+    streak_current = compute_streak(days)
+    streak_best = compute_best_streak(days)
+    xp_by_day = get_xp_by_day()
+
+    achievements = []
+
+
+    def _achievement(id_, name, desc, unlocked, progress):
+
+        achievements.append(
+
+            {
+
+                "id": id_,
+
+                "name": name,
+
+                "description": desc,
+
+                "unlocked": unlocked,
+
+                "progress": progress,
+
+            }
+
+        )
+
+
+
+    # XP-based achievements
+
+    _achievement(
+
+        "xp_1000",
+
+        "First 1,000 Behavior XP",
+
+        "Reach 1,000 XP from simulated behavior runs.",
+
+        xp >= 1000,
+
+        f"{xp}/1000 XP",
+
+    )
+
+
+
+    _achievement(
+
+        "xp_5000",
+
+        "Serious Behavior Grinder",
+
+        "Reach 5,000 XP in this session.",
+
+        xp >= 5000,
+
+        f"{xp}/5000 XP",
+
+    )
+
+
+
+    # Test/scenario count achievements
+
+    _achievement(
+
+        "tests_3",
+
+        "Tried 3 Scenarios",
+
+        "Record results for at least 3 scenarios.",
+
+        tests >= 3,
+
+        f"{tests}/3 scenarios",
+
+    )
+
+    _achievement(
+
+        "tests_10",
+
+        "Scenario Explorer",
+
+        "Record results for at least 10 scenarios.",
+
+        tests >= 10,
+
+        f"{tests}/10 scenarios",
+
+    )
+
+
+
+    # Streak achievements
+
+    _achievement(
+
+        "streak_3",
+
+        "3-Day Discipline Streak",
+
+        "Be active on 3 consecutive days.",
+
+        streak_best >= 3,
+
+        f"Best streak: {streak_best}/3 days",
+
+    )
+
+    _achievement(
+        "streak_7",
+        "7-Day Commitment",
+        "Be active on 7 consecutive days.",
+        streak_best >= 7,
+        f"Best streak: {streak_best}/7 days",
+    )
+
+    # Weekend activity achievement
+    active_dates = [date.fromisoformat(d) for d in days]
+    active_set = set(active_dates)
+    weekend_unlocked = any(
+        d.weekday() == 5 and (d + timedelta(days=1)) in active_set for d in active_dates
+    )
+    weekend_progress = "Seen Sat+Sun active day pair" if weekend_unlocked else "No Sat+Sun pair yet"
+    _achievement(
+        "weekend_warrior",
+        "Weekend Warrior",
+        "Be active on both Saturday and Sunday (streak marker).",
+        weekend_unlocked,
+        weekend_progress,
+    )
+
+    # Momentum builder: XP on 5 of last 7 days
+    today = date.today()
+    active_days_last7 = 0
+    for offset in range(7):
+        d_str = (today - timedelta(days=offset)).isoformat()
+        if xp_by_day.get(d_str, 0) > 0 or d_str in days:
+            active_days_last7 += 1
+    _achievement(
+        "momentum_builder",
+        "Momentum Builder",
+        "Gain XP on 5 out of the last 7 days.",
+        active_days_last7 >= 5,
+        f"{active_days_last7}/5 active days in last 7",
+    )
+
+    return achievements, streak_best
+
+
+# ============================================================
+# PAGE REGISTRY
+# ============================================================
+
+PAGE_REGISTRY = PageRegistry()
+
+PAGES: List[Page] = PAGE_REGISTRY.pages  # registration order; register through add_page
+
+
+
+def add_page(id: str, label: str, section: str, template: str, meta: Dict[str, str] = None):
+
+    PAGE_REGISTRY.add(Page(id=id, label=label, section=section, template=template, meta=meta or {}))
+
+
+# Simple navigation helper so in-page buttons can jump to other views
+def get_page_by_id(page_id: str) -> Optional[Page]:
+    return PAGE_REGISTRY.get(page_id)
+
+
+def navigate_to(page_id: str):
+    """Schedule navigation to a page on the next rerun (unknown ids are ignored)."""
+    if page_id in PAGE_REGISTRY:
+        st.session_state["pending_nav_page_id"] = page_id
+
+
+# ============================================================
+# TOP BAR
+# ============================================================
+
+def render_top_bar(active_page_label: str):
+
+    st.markdown(
+
+        f"""
+
+<div class="top-bar">
+
+  <div class="top-bar-left">
+
+    Qubic Behavioral Feedback Engine
+
+  </div>
+
+  <div class="top-bar-right">
+
+    <div class="chip">{active_page_label}</div>
+
+  </div>
+
+</div>
+
+        """,
+
+        unsafe_allow_html=True,
+
+    )
+
+    nav_items = [
+        ("Landing", "landing_public"),
+        ("Home", "home_dashboard"),
+        ("Daily Tasks", "daily_tasks"),
+        ("XP & Achievements", "achievements_list"),
+        ("Wallet", "wallet_dashboard"),
+        ("Shop", "shop_home"),
+        ("Notifications", "notifications_center"),
+        ("Invest", "invest_case"),
+        ("Qubic testnet", "qubic_network"),
+
+    ]
+    nav_items = [(label, target) for label, target in nav_items if target in PAGE_REGISTRY]
+    cols = st.columns(len(nav_items))
+    for (label, target), col in zip(nav_items, cols):
+        col.button(label, on_click=navigate_to, args=(target,), use_container_width=True, key=f"topnav_{label}")
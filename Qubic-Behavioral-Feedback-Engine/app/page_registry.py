@@ -0,0 +1,108 @@
+"""Indexed registry of the app's pages, and lazy template dispatch.
+
+The sidebar, `navigate_to` and the top bar look pages up by id, by section
+and by label on every Streamlit rerun. `PageRegistry` builds those maps as
+pages are registered, so each lookup is a dict access instead of a scan
+over the whole catalog.
+
+`TemplateDispatch` maps template keys to renderers by name, so a page's
+template module is imported the first time the page is shown rather than
+when the app starts.
+"""
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
+
+
+@dataclass
+class Page:
+    id: str
+    label: str
+    section: str
+    template: str
+    meta: Dict[str, str] = None
+
+
+class PageRegistry:
+    """Pages in registration order, indexed by id, section and label.
+
+    Ids and labels must be unique: the sidebar selects a page by its label.
+    """
+
+    def __init__(self):
+        self.pages: List[Page] = []
+        self.by_id: Dict[str, Page] = {}
+        self.by_section: Dict[str, List[Page]] = {}
+        self.by_label: Dict[str, Page] = {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __iter__(self) -> Iterator[Page]:
+        return iter(self.pages)
+
+    def __contains__(self, page_id) -> bool:
+        return page_id in self.by_id
+
+    def add(self, page: Page) -> Page:
+        if page.id in self.by_id:
+            raise ValueError(f"Duplicate page id: {page.id!r}")
+        if page.label in self.by_label:
+            raise ValueError(f"Duplicate page label: {page.label!r}")
+        self.pages.append(page)
+        self.by_id[page.id] = page
+        self.by_section.setdefault(page.section, []).append(page)
+        self.by_label[page.label] = page
+        return page
+
+    def get(self, page_id: str) -> Optional[Page]:
+        return self.by_id.get(page_id)
+
+    def get_by_label(self, label: str) -> Optional[Page]:
+        return self.by_label.get(label)
+
+    def section_pages(self, section: str) -> List[Page]:
+        """Pages of a section in registration order (empty for an unknown section)."""
+        return self.by_section.get(section, [])
+
+    def sections(self) -> List[str]:
+        """Sections in the order their first page was registered."""
+        return list(self.by_section)
+
+    def override_templates(self, overrides: Dict[str, str]) -> None:
+        """Point page ids at different template keys; unknown ids are ignored."""
+        for page_id, template in overrides.items():
+            page = self.by_id.get(page_id)
+            if page is not None:
+                page.template = template
+
+
+class TemplateDispatch(Mapping):
+    """Template key -> renderer, resolved from "module:function" paths on lookup.
+
+    Modules are looked up in `package` and imported on first use; later
+    lookups hit `sys.modules`. Renderers are not cached here, so a module
+    Streamlit reloads after an edit is picked up on the next rerun.
+    """
+
+    def __init__(self, paths: Dict[str, str], package: str):
+        self.paths = dict(paths)
+        self.package = package
+
+    def __getitem__(self, key: str) -> Callable:
+        module_name, _, function = self.paths[key].partition(":")
+        module = importlib.import_module(f"{self.package}.{module_name}")
+        return getattr(module, function)
+
+    def __contains__(self, key) -> bool:
+        return key in self.paths  # without importing the module
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def update(self, paths: Dict[str, str]) -> None:
+        """Add or replace template paths."""
+        self.paths.update(paths)
@@ -0,0 +1 @@
+"""Page renderers, one module per page family, imported on first use via `page_catalog.TEMPLATE_DISPATCH`."""
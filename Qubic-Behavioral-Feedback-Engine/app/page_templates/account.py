@@ -0,0 +1,66 @@
+"""Account and profile pages."""
+import streamlit as st
+
+from common import get_user_state, render_top_bar
+from page_registry import Page
+
+
+def tpl_account_overview(page: Page):
+
+    render_top_bar(page.label)
+    state = get_user_state()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### My Account Overview")
+
+    st.write("Basic summary of your account.")
+
+    st.write(f"- Username: {state.get('username', 'user')}")
+
+    st.write(f"- Email: {state.get('email', 'you@example.com')}")
+
+    st.write(f"- Token balance: {state.get('token_balance', 0.0)}")
+
+    st.write("- Joined: this session (persist once connected)")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_profile_public(page: Page):
+
+    render_top_bar(page.label)
+    state = get_user_state()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Public Profile")
+
+    st.write("This is how a public profile could look in minimal black & white.")
+
+    st.write(f"- Username: {state.get('username', 'user')}")
+
+    st.write("- Level: 7")
+
+    st.write("- Favorite subjects: Algebra, Physics")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_profile_customization(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Profile Customization Hub")
+
+    st.write("Choose your icon, banner, and other appearance options.")
+
+    st.text_input("Bio")
+
+    st.selectbox("Default subject to show", ["Algebra", "Physics", "Programming"])
+
+    st.button("Save appearance")
+
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,106 @@
+"""AI coach page and its canned reply logic."""
+from typing import Dict
+
+import streamlit as st
+
+from common import (
+    compute_streak,
+    ensure_chat_history,
+    get_last_test_attempt,
+    get_user_state,
+    navigate_to,
+    record_activity_day,
+    render_top_bar,
+)
+from page_registry import Page
+
+
+def generate_ai_reply(message: str, state: Dict) -> str:
+    """Small heuristic responder that reflects current session stats."""
+    streak = compute_streak(state["days_active"])
+    last = get_last_test_attempt()
+    xp = state["xp"]
+    coins = state["coins"]
+    tokens = state.get("token_balance", 0.0)
+
+    lower = message.lower()
+    lines = []
+    if "quest" in lower or "mission" in lower:
+        lines.append("Try this micro-quest to keep momentum:")
+        lines.append("- Run one quick scenario to keep the streak alive.")
+        lines.append("- Claim a daily task; they award fast XP.")
+        lines.append("- Log a tiny token trade to stay fluent without heavy risk.")
+    elif "xp" in lower or "level" in lower:
+        lines.append(f"You are at {xp} XP. Aim for the next 1,000 XP band.")
+        lines.append("Do one simulation in Metrics Lab, then one scenario run. Repeat daily.")
+    elif "streak" in lower or "consisten" in lower:
+        lines.append(f"Streak: {streak} day(s). Protect it with a 5-minute action today.")
+        lines.append("Schedule tomorrow's action now; streaks thrive on pre-commitment.")
+    elif "token" in lower or "trade" in lower or "wallet" in lower:
+        lines.append(f"Tokens: {round(tokens,2)} | Coins: {coins}.")
+        lines.append("Use small sizing; review recent trades and set one guardrail before your next swap.")
+    else:
+        lines.append("Snapshot of your session:")
+        lines.append(f"- XP: {xp}, Coins: {coins}, Streak: {streak} day(s).")
+        if last:
+            lines.append(f"- Last scenario: {last['name']} at {last['percent']}% (+{last['xp_gained']} XP).")
+        lines.append("Next best step: one simulation, one scenario, and log it.")
+    return "\n".join(lines)
+
+
+def tpl_ai_assistant(page: Page):
+    """AI helper (session-only) that summarizes your state and suggests next steps."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    history = ensure_chat_history()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### AI Coach")
+    st.write("Ask for quests, streak help, XP plans, or trading nudges. Responses use your session stats only (no external model).")
+    st.caption("Session data only. Refresh to clear.")
+
+    stats = st.columns(4)
+    stats[0].metric("XP", state["xp"])
+    stats[1].metric("Coins", state["coins"])
+    stats[2].metric("Streak (days)", compute_streak(state["days_active"]))
+    stats[3].metric("Tokens", round(state.get("token_balance", 0.0), 2))
+
+    st.markdown("#### Quick prompts")
+    prompts = [
+        ("Daily quest", "Give me a small quest for today"),
+        ("Keep streak", "How do I keep my streak alive?"),
+        ("XP plan", "How can I level up faster this week?"),
+        ("Trading drill", "Suggest a low-risk trading drill"),
+    ]
+    qcols = st.columns(len(prompts))
+    for (label, prompt), col in zip(prompts, qcols):
+        if col.button(label):
+            history.append({"role": "user", "text": prompt})
+            history.append({"role": "assistant", "text": generate_ai_reply(prompt, state)})
+            record_activity_day()
+
+    st.markdown("#### Chat")
+    with st.form("ai_chat_form"):
+        user_msg = st.text_input("Ask the coach", key="ai_chat_input")
+        submitted = st.form_submit_button("Send")
+        if submitted and user_msg.strip():
+            history.append({"role": "user", "text": user_msg.strip()})
+            history.append({"role": "assistant", "text": generate_ai_reply(user_msg, state)})
+            if len(history) > 40:
+                del history[: len(history) - 40]
+            record_activity_day()
+
+    if history:
+        st.markdown("##### Conversation")
+        for msg in history[-12:]:
+            role = msg.get("role", "user").capitalize()
+            st.markdown(f"**{role}:** {msg.get('text', '')}")
+    else:
+        st.info("No messages yet. Send a question to start.")
+
+    st.write("---")
+    nav = st.columns(3)
+    nav[0].button("Daily Tasks", on_click=navigate_to, args=("daily_tasks",), use_container_width=True)
+    nav[1].button("Metrics Lab", on_click=navigate_to, args=("metrics_lab",), use_container_width=True)
+    nav[2].button("Token Trading", on_click=navigate_to, args=("token_trading",), use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,183 @@
+"""Landing, login, registration and legal pages."""
+import streamlit as st
+
+from common import get_user_state, grant_xp, navigate_to, render_top_bar, set_user_profile, sign_in, sign_up
+from page_registry import Page
+
+
+def tpl_login(page: Page):
+
+    render_top_bar(page.label)
+
+    with st.container():
+
+        st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Login")
+
+    st.write("Sign in to personalize XP, coins and test history for this session.")
+
+    st.write("")
+
+    st.markdown('<div class="card-hero">', unsafe_allow_html=True)
+    if st.button("Sign in with Google"):
+        faux_email = "you@example.com"
+        set_user_profile("Google User", faux_email)
+        grant_xp(15, "Login", "Google quick sign-in bonus")
+        st.success("Signed in with Google (placeholder). XP +15.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    email = st.text_input("Email")
+
+    password = st.text_input("Password", type="password")
+
+    remember = st.checkbox("Remember me")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+
+        if st.button("Log In"):
+
+            if sign_in(email, password):
+
+                grant_xp(10, "Login", "Login bonus")
+
+                st.success(f"Logged in as {get_user_state()['username']}. XP +10 to get you started.")
+
+            else:
+
+                st.error("Email or password is incorrect.")
+
+    with col2:
+
+        st.write("")
+
+    st.write("")
+
+    action_cols = st.columns(2)
+    action_cols[0].button("Forgot password", on_click=navigate_to, args=("forgot_password",), use_container_width=True)
+    action_cols[1].button("Create an account", on_click=navigate_to, args=("register",), use_container_width=True)
+    st.button("Skip to dashboard", on_click=navigate_to, args=("home_dashboard",), use_container_width=True)
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_register(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Create an account")
+
+    st.write("Create credentials so your behavioral profile can be personalized. Progress is saved under your email and restored the next time you log in with your password.")
+
+
+
+    username = st.text_input("Username")
+
+    email = st.text_input("Email")
+
+    password = st.text_input("Password", type="password")
+
+    confirm = st.text_input("Confirm Password", type="password")
+
+    st.checkbox("I agree to the Terms and Privacy Policy")
+
+
+
+    if st.button("Sign Up"):
+        if password != confirm:
+            st.error("Passwords do not match.")
+        elif not sign_up(username, email, password):
+            st.error("Enter an email and password, or log in if this email already has an account.")
+        else:
+            st.success(f"Account created for {get_user_state()['username']}. You can jump into the dashboard now.")
+            st.button("Go to dashboard", on_click=navigate_to, args=("home_dashboard",), use_container_width=True, key="register_to_home")
+    st.markdown("---")
+    st.markdown('<div class="card-hero">', unsafe_allow_html=True)
+    if st.button("Quick start as guest"):
+        set_user_profile("Guest", email or "guest@example.com")
+        grant_xp(10, "Signup", "Guest quick start bonus")
+        st.success("Guest profile initialized. XP +10. Jump into the dashboard.")
+        st.button("Open dashboard", on_click=navigate_to, args=("home_dashboard",), use_container_width=True, key="guest_to_home")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_landing(page: Page):
+    render_top_bar(page.label)
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    # Main hero
+    st.markdown("## Understand your on-chain behavior. Shape your future.")
+    st.markdown(
+        '<div class="card-hero">Design your behavioral loop with XP, streaks, coins, and scenario feedback. Connect data when ready.</div>',
+        unsafe_allow_html=True,
+    )
+    st.write(
+        "The **Qubic Behavioral Feedback Engine** turns actions into scores, XP, and streaks so you "
+        "can see how your habits evolve and what to adjust next. This instance runs in-session; connect "
+        "a backend to persist your progress."
+    )
+
+    cta1, cta2, cta3 = st.columns(3)
+    cta1.button("Start onboarding", on_click=navigate_to, args=("onboard_subjects",), use_container_width=True)
+    cta2.button("Open dashboard", on_click=navigate_to, args=("home_dashboard",), use_container_width=True)
+    cta3.button("See XP & achievements", on_click=navigate_to, args=("achievements_list",), use_container_width=True)
+    st.button("Run a random simulation", on_click=navigate_to, args=("metrics_lab",), use_container_width=True)
+    st.button("Why invest in this engine?", on_click=navigate_to, args=("invest_case",), use_container_width=True)
+
+    st.write("---")
+    st.markdown("### How this engine thinks")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.markdown("**Behavior Metrics**")
+        st.write(
+            "We compute TES, BSS, BMS, CFS, and event-level XP so you can see both macro momentum and "
+            "micro-behavior changes."
+        )
+    with c2:
+        st.markdown("**Feedback Loop**")
+        st.write(
+            "You take actions (simulated sessions), the system logs them, and the dashboard "
+            "feeds back streaks, XP and summaries to nudge better decisions."
+        )
+    with c3:
+        st.markdown("**Engagement Layer**")
+        st.write(
+            "Streaks, XP, coins, shop items and summaries are intentionally designed to keep you committed "
+            "without dark patterns."
+        )
+
+    st.write("---")
+    st.markdown(
+        '''
+<div class="footer">
+  Prototype of the Qubic Behavioral Feedback Engine UI. Signed-in progress is saved; connect real data sources for live outcomes.
+</div>
+        ''',
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_legal(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown(f"### {page.label}")
+
+    st.write("Long-form text content would go here. This is a simple placeholder.")
+
+    for i in range(5):
+
+        st.write("Lorem ipsum dolor sit amet, consectetur adipiscing elit. Integer pretium felis ut urna.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
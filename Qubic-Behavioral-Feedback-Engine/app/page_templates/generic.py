@@ -0,0 +1,169 @@
+"""Generic renderers shared by many catalog pages (info, tables, lists, forms)."""
+import streamlit as st
+
+from common import render_top_bar
+from page_registry import Page
+
+
+def tpl_simple_info(page: Page, title: str = None, body: str = None):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown(f"### {title or page.label}")
+
+    st.write(body or "Static informational page placeholder.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_settings_form(page: Page, title: str = None):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown(f"### {title or page.label}")
+
+    st.write("Simple settings-style form placeholder.")
+
+
+
+    st.text_input("Sample text field", value="")
+
+    st.checkbox("Enable sample option")
+
+    st.selectbox("Sample mode", ["Off", "Low", "Medium", "High"])
+
+
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+
+        if st.button("Save changes"):
+
+            st.success("Settings saved for this session.")
+
+    with col2:
+
+        if st.button("Reset"):
+
+            st.info("Reset pressed.")
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_change_password(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Change Password")
+
+    old = st.text_input("Old password", type="password")
+
+    new = st.text_input("New password", type="password")
+
+    confirm = st.text_input("Confirm new password", type="password")
+
+    if st.button("Update password"):
+
+        st.info("Session-only placeholder: no password change is executed.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_danger_confirm(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Delete / Deactivate Account")
+
+    st.write("Be careful: this is a destructive action. In this session nothing actually happens.")
+
+    st.text_area("Optional: tell us why you're leaving.")
+
+    if st.button("I understand, delete my account"):
+
+        st.warning("Session-only placeholder: account deletion not yet wired up.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_simple_table(page: Page, title: str = None):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown(f"### {title or page.label}")
+
+    st.write("Simple table placeholder (demo).")
+
+    st.table(
+
+        {
+
+            "Column A": ["Row 1", "Row 2", "Row 3"],
+
+            "Column B": ["Value 1", "Value 2", "Value 3"],
+
+        }
+
+    )
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_simple_list(page: Page, title: str = None):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown(f"### {title or page.label}")
+
+    st.write("Simple list placeholder. Replace with real content.")
+
+    for i in range(1, 6):
+
+        st.write(f"- Item {i}")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_simple_graph(page: Page):
+
+    # Minimal placeholder: just show a small trend table
+
+    tpl_simple_table(page, title=page.label)
+
+
+def tpl_settings_list(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Settings")
+
+    st.write("Choose a category on the left (in a full app this would highlight sections).")
+
+    st.write("- Display")
+
+    st.write("- Notifications")
+
+    st.write("- Account")
+
+    st.write("- Security")
+
+    st.write("- Data")
+
+    st.markdown("</div>", unsafe_allow_html=True)
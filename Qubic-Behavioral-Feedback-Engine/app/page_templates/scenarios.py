@@ -0,0 +1,347 @@
+"""Behavior scenario / test library, detail, taking and results pages."""
+import random
+
+import streamlit as st
+
+from common import (
+    get_last_attempt_for_test,
+    get_last_test_attempt,
+    get_user_state,
+    navigate_to,
+    record_test_attempt,
+    render_demo_disclaimer,
+    render_top_bar,
+    set_current_scenario,
+)
+from page_registry import Page
+
+
+def tpl_test_library(page: Page):
+
+    render_top_bar(page.label)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+
+
+    st.markdown(f"### {page.label}")
+
+    st.write(
+
+        "In the full product, this would be a catalog of **behavior scenarios** you can simulate: "
+
+        "different trading styles, risk profiles, and decision patterns on Qubic."
+
+    )
+
+
+
+    st.write("Below are core scenarios you can run right now:")
+
+    scenarios = [
+        ("Calm Long-Term Holder", "Infrequent moves, strong conviction, low churn.", "Medium"),
+        ("Hyperactive Short-Term Trader", "Frequent trades, high churn, high emotional load.", "High"),
+        ("Launchpad & Airdrop Farmer", "Hopping between new tokens and opportunities.", "High"),
+        ("Governance Steward", "Proposal participation, long-horizon alignment.", "Medium"),
+        ("Social Hype Spike", "Rapid attention swings driven by social signals.", "High"),
+    ]
+
+    for idx, (title, desc, difficulty) in enumerate(scenarios):
+        cols = st.columns([5, 3, 2, 2])
+        with cols[0]:
+            st.markdown(f"**{title}**")
+            st.write(desc)
+        with cols[1]:
+            st.write(f"Difficulty: {difficulty}")
+        with cols[2]:
+            st.write("Channel: Behavior")
+        with cols[3]:
+            if st.button("Start", key=f"start_lib_{idx}"):
+                set_current_scenario(f"scenario_{idx}", title, "Behavior")
+                navigate_to("scenario_run")
+            if st.button("View detail", key=f"detail_lib_{idx}"):
+                target_id = "scenario_calibration"
+                if idx == 1:
+                    target_id = "scenario_volatility"
+                elif idx == 2:
+                    target_id = "scenario_airdrop"
+                elif idx == 3:
+                    target_id = "scenario_governance"
+                elif idx == 4:
+                    target_id = "scenario_social"
+                navigate_to(target_id)
+
+    st.write(
+        "Pick a scenario detail to see requirements, then run it via **Scenario Run (Simulated)** "
+        "to generate XP, streak days, and achievements tied to behavior rather than academics."
+    )
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_test_detail(page: Page):
+
+    render_top_bar(page.label)
+
+    meta = page.meta or {}
+
+    name = meta.get("test_name", page.label)
+
+    subject = meta.get("subject", "General")
+
+
+
+    state = get_user_state()
+
+    last_attempt = get_last_attempt_for_test(page.id)
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown(f"### Scenario: {name}")
+
+    st.write(f"Behavior channel: {subject}")
+
+    st.write("Description: Scenario parameters and prompts are simulated here for planning and reflection.")
+
+
+
+    st.write("**Info**")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+
+        st.write("Tasks/steps: 3-5 (simulated)")
+
+    with col2:
+
+        st.write("Estimated time: 10-20 min")
+
+    with col3:
+
+        st.write("Difficulty: Medium")
+
+
+
+    st.write("**Requirements**")
+
+    st.write("- Define your guardrails (risk, time, emotional budget)")
+
+    st.write("- Set a simple success criteria for this run")
+
+
+
+    st.write("**Key signals to watch**")
+
+    st.write("- Momentum vs discipline tension")
+
+    st.write("- Emotional spike triggers")
+
+    st.write("- XP gain vs churn")
+
+
+
+    st.write("---")
+
+    st.markdown("#### Your history on this test (demo)")
+
+    if last_attempt:
+
+        st.write(f"Last score: {last_attempt['correct']} / {last_attempt['total']} ({last_attempt['percent']}%)")
+
+        st.write(f"Last XP gained: {last_attempt['xp_gained']}")
+
+        st.write(f"Last taken: {last_attempt['timestamp']}")
+
+    else:
+
+        st.write("You have not recorded a result for this test yet in this session.")
+
+
+
+    st.write("---")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+
+        if st.button("Start scenario", key=f"start_{page.id}"):
+
+            # In this session, "starting" remembers which scenario is current
+
+            set_current_scenario(page.id, name, subject)
+
+            st.info(
+
+                "Scenario started. Open **Scenario Run (Simulated)** to log the outcome and XP."
+
+            )
+
+    with col2:
+
+        if st.button("Practice similar questions", key=f"practice_{page.id}"):
+
+            st.info("In a full app, this would open a tailored practice set for this topic.")
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_test_taking(page: Page):
+
+    render_top_bar(page.label)
+
+    state = get_user_state()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Scenario Run (Simulated)")
+
+
+
+    test_id = st.session_state.get("current_test_id")
+
+    test_name = st.session_state.get("current_test_name", "No test selected")
+
+    test_subject = st.session_state.get("current_test_subject", "General")
+
+
+
+    if not test_id:
+
+        st.write("No active scenario.")
+
+        st.write("Open any scenario detail page and press **Start scenario** first.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        return
+
+
+
+    st.write(f"Active scenario: **{test_name}** ({test_subject})")
+
+    st.write("Instead of step-by-step flow, this lets you simulate the final outcome for XP and streaks.")
+
+
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+
+        total = st.number_input("Total questions", min_value=1, max_value=50, value=15, step=1)
+
+        correct = st.number_input("Correct answers", min_value=0, max_value=50, value=13, step=1)
+
+        if correct > total:
+
+            st.warning("Correct cannot exceed total; it will be clipped when saved.")
+
+    with col2:
+
+        minutes = st.number_input("Time taken (minutes)", min_value=1, max_value=180, value=15, step=1)
+
+        st.write("This run will award XP based on your percentage score (up to 200 XP).")
+
+
+
+    if st.button("Save simulated result"):
+
+        record_test_attempt(
+
+            test_id=test_id,
+
+            name=test_name,
+
+            subject=test_subject,
+
+            correct=int(correct),
+
+            total=int(total),
+
+            time_sec=int(minutes * 60),
+
+        )
+
+        st.success(
+
+            "Result saved for this session. Open **Scenario Results Summary** to see the breakdown and XP gained."
+
+        )
+
+    if st.button("Quick random outcome"):
+        total_rand = random.randint(5, 20)
+        correct_rand = random.randint(0, total_rand)
+        minutes_rand = random.randint(3, 20)
+        record_test_attempt(
+            test_id=test_id,
+            name=test_name,
+            subject=test_subject,
+            correct=int(correct_rand),
+            total=int(total_rand),
+            time_sec=int(minutes_rand * 60),
+        )
+        st.success(
+            f"Random outcome saved: {correct_rand}/{total_rand} in {minutes_rand} min. XP and coins updated."
+        )
+
+    st.write("---")
+    links = st.columns(3)
+    links[0].button("View results", on_click=navigate_to, args=("test_results_summary",), use_container_width=True)
+    links[1].button("Scenario library", on_click=navigate_to, args=("scenario_library",), use_container_width=True)
+    links[2].button("Metrics lab", on_click=navigate_to, args=("metrics_lab",), use_container_width=True)
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_test_results(page: Page):
+    render_top_bar(page.label)
+    state = get_user_state()
+    last_attempt = get_last_test_attempt()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### Scenario Results Summary")
+
+    if not last_attempt:
+        st.write("No scenario results recorded in this session yet.")
+        st.write("Open a scenario detail, start it, and log a simulated result in **Scenario Run (Simulated)**.")
+        st.markdown("</div>", unsafe_allow_html=True)
+        return
+
+    st.write(f"**Last scenario:** {last_attempt['name']} ({last_attempt['subject']})")
+    st.write(f"Taken at (UTC): {last_attempt['timestamp']}")
+
+    st.write("")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.write("**Score**")
+        st.write(f"{last_attempt['correct']} / {last_attempt['total']}")
+    with col2:
+        st.write("**Percentage**")
+        st.write(f"{last_attempt['percent']}%")
+    with col3:
+        st.write("**XP earned**")
+        st.write(f"+{last_attempt['xp_gained']} XP")
+    with col4:
+        st.write("**Time taken**")
+        st.write(f"{last_attempt['time_sec']} s")
+
+    st.write("")
+    # Simple psychological messaging / near-miss feedback
+    pct = last_attempt["percent"]
+    if pct >= 95:
+        st.write("You absolutely crushed this - you're very close to mastery on this topic.")
+    elif 80 <= pct < 95:
+        st.write("So close to perfection. A bit more focused practice could push this to 100%.")
+    elif 50 <= pct < 80:
+        st.write("Solid foundation. Target a few weak areas to unlock a big jump next time.")
+    else:
+        st.write("Tough run. Treat this as a learning rep-small, calm repetitions build confidence.")
+
+    render_demo_disclaimer("Scenario results and XP are stored for this session.")
+    st.markdown("</div>", unsafe_allow_html=True)
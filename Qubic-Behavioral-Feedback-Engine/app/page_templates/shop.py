@@ -0,0 +1,218 @@
+"""Shop, token trading and wallet pages."""
+import streamlit as st
+
+from common import (
+    get_user_state,
+    log_token_trade,
+    navigate_to,
+    record_activity_day,
+    render_demo_disclaimer,
+    render_top_bar,
+)
+from page_registry import Page
+
+
+def tpl_shop_page(page: Page):
+    render_top_bar(page.label)
+    state = get_user_state()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown(f"### {page.label}")
+
+    st.markdown(
+        f"**Balance:** {state['coins']} coins | {state['gems']} gems (earned from your XP). "
+        "Cosmetic placeholder until payment rails are connected."
+    )
+
+    st.write("---")
+
+    st.write("Filters:")
+
+    categories = {
+        "All": None,
+        "Themes": "theme",
+        "Boosts": "boost",
+        "Cosmetics": "icons_pack archetype_skins banner".split(),
+        "Streak tools": "streak_freeze".split(),
+    }
+    selected_cat = st.selectbox("Category", list(categories.keys()), index=0)
+    show_affordable = st.checkbox("Show only affordable items", value=False)
+
+    st.write("---")
+    st.write("Shop items:")
+
+    items = [
+        {"id": "theme_mono", "name": "Monochrome Theme", "desc": "Strict black & white UI mode.", "price": 200, "tag": "theme"},
+        {"id": "theme_blueprint", "name": "Blueprint Theme", "desc": "Light-blue accent layout inspired by technical diagrams.", "price": 240, "tag": "theme"},
+        {"id": "boost_xp_2x", "name": "XP Boost x2 (1 day)", "desc": "Double XP from tests for 24h (placeholder).", "price": 300, "tag": "boost"},
+        {"id": "icons_pack", "name": "Custom Icon Pack", "desc": "Extra profile icons (cosmetic).", "price": 150, "tag": "cosmetic"},
+        {"id": "banner_set", "name": "Banner Set", "desc": "Header banners to personalize your profile.", "price": 180, "tag": "cosmetic"},
+        {"id": "streak_freeze", "name": "Streak Freeze", "desc": "Protect your streak once when you miss a day. Cosmetic placeholder.", "price": 220, "tag": "streak"},
+        {"id": "momentum_insight", "name": "Momentum Insight Pack", "desc": "Unlock extra textual insights on XP Overview for the next week.", "price": 180, "tag": "boost"},
+        {"id": "archetype_skins", "name": "Behavior Archetype Skins", "desc": "Cosmetic avatars: Calm Holder, Hyper Trader, Governance Steward.", "price": 260, "tag": "cosmetic"},
+    ]
+
+    for item in items:
+        if show_affordable and state["coins"] < item["price"]:
+            continue
+        tag = item["tag"]
+        if selected_cat != "All":
+            allowed = categories[selected_cat]
+            if allowed is None:
+                pass
+            elif isinstance(allowed, list):
+                if tag not in allowed and item["id"] not in allowed:
+                    continue
+            elif allowed and allowed not in item["id"] and allowed != tag:
+                continue
+
+        cols = st.columns([3, 5, 2, 2])
+
+        with cols[0]:
+
+            st.write(item["name"])
+
+        with cols[1]:
+
+            st.write(item["desc"])
+
+        with cols[2]:
+
+            st.write(item["price"])
+
+        with cols[3]:
+
+            if st.button("Buy", key=f"buy_{item['id']}"):
+                if state["coins"] >= item["price"]:
+                    state["coins"] -= item["price"]
+                    record_activity_day()
+                    st.success(f"Purchased {item['name']}.")
+                else:
+                    st.warning("Not enough coins.")
+    st.write(
+        "In a real implementation, these items would be governed by on-chain logic and Nostromo-launched tokens. "
+        "Here they're cosmetic placeholders so you can design the flow."
+    )
+    link_row = st.columns(3)
+    link_row[0].button("Back to dashboard", on_click=navigate_to, args=("home_dashboard",), use_container_width=True)
+    link_row[1].button("View XP impact", on_click=navigate_to, args=("xp_overview",), use_container_width=True)
+    link_row[2].button("Token trading desk", on_click=navigate_to, args=("token_trading",), use_container_width=True)
+    render_demo_disclaimer("Purchases adjust your session coins; connect payments to make them real.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_token_trading(page: Page):
+    """Simple token buy/sell simulation using coins."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    token_balance = state.get("token_balance", 0.0)
+    coins = state["coins"]
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### Token Trading Desk")
+    st.write(f"Coins: {coins} | Token balance: {round(token_balance, 2)}")
+
+    price = st.number_input("Current token price (coins)", min_value=1, max_value=1000, value=50, step=1)
+    st.line_chart({"price": [price * x for x in [0.9, 0.95, 1.0, 1.05, 1.1]]})
+    buy_amount = st.number_input("Amount to buy", min_value=0.0, max_value=10000.0, value=0.0, step=1.0)
+    sell_amount = st.number_input("Amount to sell", min_value=0.0, max_value=10000.0, value=0.0, step=1.0)
+
+    col_buy, col_sell = st.columns(2)
+    with col_buy:
+        if st.button("Buy tokens"):
+            cost = buy_amount * price
+            if cost <= coins and buy_amount > 0:
+                state["coins"] -= int(cost)
+                state["token_balance"] = round(token_balance + buy_amount, 2)
+                log_token_trade("buy", buy_amount, price, -int(cost), buy_amount)
+                record_activity_day()
+                st.success(f"Bought {buy_amount} tokens for {int(cost)} coins.")
+            else:
+                st.warning("Not enough coins or invalid amount.")
+    with col_sell:
+        if st.button("Sell tokens"):
+            proceeds = sell_amount * price
+            if sell_amount <= token_balance and sell_amount > 0:
+                state["coins"] += int(proceeds)
+                state["token_balance"] = round(token_balance - sell_amount, 2)
+                log_token_trade("sell", sell_amount, price, int(proceeds), -sell_amount)
+                record_activity_day()
+                st.success(f"Sold {sell_amount} tokens for {int(proceeds)} coins.")
+            else:
+                st.warning("Not enough tokens or invalid amount.")
+
+    st.write("---")
+    if state.get("token_trades"):
+        st.markdown("#### Recent trades")
+        recent = list(reversed(state["token_trades"]))[:5]
+        st.table({
+            "Time": [t["timestamp"] for t in recent],
+            "Action": [t["action"] for t in recent],
+            "Amount": [t["amount"] for t in recent],
+            "Price": [t["price"] for t in recent],
+            "Coin Δ": [t["coin_delta"] for t in recent],
+            "Token Δ": [t["token_delta"] for t in recent],
+        })
+
+    st.button("Back to shop home", on_click=navigate_to, args=("shop_home",), use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_wallet_dashboard(page: Page):
+    """Wallet overview with quick trade/swap and market hints."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### Wallet & Market Overview")
+
+    balances = st.columns(3)
+    balances[0].metric("Coins", state["coins"])
+    balances[1].metric("Tokens", round(state.get("token_balance", 0.0), 2))
+    balances[2].metric("XP", state["xp"])
+    st.write("Use swap/trade to move value; open scenarios to influence XP and streaks.")
+
+    st.write("---")
+    col_price, col_action = st.columns([2, 1])
+    with col_price:
+        st.markdown("#### Market pulse (synthetic)")
+        base = 50
+        series = [base * m for m in [0.94, 0.97, 1.0, 1.02, 1.06, 1.04, 1.08]]
+        st.line_chart({"predicted": series})
+        st.write("Simple synthetic forecast; connect real feeds for production.")
+    with col_action:
+        st.markdown("#### Quick swap")
+        swap_price = st.number_input("Swap price (coins per token)", min_value=1, max_value=1000, value=50, step=1, key="swap_price")
+        swap_amount = st.number_input("Tokens to buy via swap", min_value=0.0, max_value=10000.0, value=0.0, step=1.0, key="swap_amount")
+        if st.button("Execute swap"):
+            cost = swap_amount * swap_price
+            if cost <= state["coins"] and swap_amount > 0:
+                state["coins"] -= int(cost)
+                state["token_balance"] = round(state.get("token_balance", 0.0) + swap_amount, 2)
+                log_token_trade("swap_buy", swap_amount, swap_price, -int(cost), swap_amount)
+                record_activity_day()
+                st.success(f"Swapped {int(cost)} coins for {swap_amount} tokens.")
+            else:
+                st.warning("Not enough coins or invalid amount.")
+
+    st.write("---")
+    st.markdown("#### What people like you tried (synthetic)")
+    st.table({
+        "Action": ["Held through volatility", "Scaled in slowly", "Took partial profits", "Paused trading"],
+        "Outcome": ["Lower churn", "Moderate XP growth", "Coin increase", "Streak preserved"],
+    })
+
+    st.write("---")
+    st.markdown("#### Fast links")
+    fast = st.columns(4)
+    fast[0].button("Trading desk", on_click=navigate_to, args=("token_trading",), use_container_width=True)
+    fast[1].button("Metrics lab", on_click=navigate_to, args=("metrics_lab",), use_container_width=True)
+    fast[2].button("Scenario run", on_click=navigate_to, args=("scenario_run",), use_container_width=True)
+    fast[3].button("Invest case", on_click=navigate_to, args=("invest_case",), use_container_width=True)
+
+    st.write("---")
+    links = st.columns(3)
+    links[0].button("Open trading desk", on_click=navigate_to, args=("token_trading",), use_container_width=True)
+    links[1].button("Run metrics lab", on_click=navigate_to, args=("metrics_lab",), use_container_width=True)
+    links[2].button("Go to shop", on_click=navigate_to, args=("shop_home",), use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
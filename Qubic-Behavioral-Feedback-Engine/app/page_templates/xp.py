@@ -0,0 +1,767 @@
+"""XP, stats, achievements and metrics lab pages."""
+import random
+from datetime import date, timedelta
+
+import streamlit as st
+
+from common import (
+    compute_achievements_catalog,
+    compute_best_streak,
+    compute_streak,
+    get_subject_xp_breakdown,
+    get_user_state,
+    get_xp_by_day,
+    grant_xp,
+    level_from_xp,
+    navigate_to,
+    record_activity_day,
+    render_demo_disclaimer,
+    render_top_bar,
+)
+from page_registry import Page
+
+
+def tpl_xp_overview(page: Page):
+    render_top_bar(page.label)
+    state = get_user_state()
+    level = level_from_xp(state["xp"])
+    streak = compute_streak(state["days_active"])
+    best_streak = compute_best_streak(state["days_active"])
+    xp_by_day = get_xp_by_day()
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### XP Overview")
+
+    nav_row = st.columns(5)
+    nav_row[0].button("Overview", use_container_width=True, disabled=True)
+    nav_row[1].button("History", on_click=navigate_to, args=("xp_history",), use_container_width=True)
+    nav_row[2].button("By subject", on_click=navigate_to, args=("xp_subject_breakdown",), use_container_width=True)
+    nav_row[3].button("Weekly/Monthly", on_click=navigate_to, args=("xp_weekly_graph",), use_container_width=True)
+    nav_row[4].button("Metrics Lab", on_click=navigate_to, args=("metrics_lab",), use_container_width=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.write("**Username**")
+        st.write(state["username"])
+    with col2:
+
+        st.write("**Level**")
+
+        st.write(level)
+
+    with col3:
+
+        st.write("**Total XP**")
+
+        st.write(state["xp"])
+
+    with col4:
+        st.write("**Current streak (days)**")
+        st.write(f"{streak} (best: {best_streak})")
+
+    st.write("---")
+    st.markdown("#### XP events (latest 10)")
+    if state["xp_events"]:
+        events = state["xp_ledger"].recent(10)
+        table = {
+
+            "Time (UTC)": [e["ts"] for e in events],
+
+            "Source": [e["source"] for e in events],
+
+            "Amount": [e["amount"] for e in events],
+
+            "Description": [e["description"] for e in events],
+
+        }
+
+        st.table(table)
+
+    else:
+        st.write("No XP events yet. Take a test (using the test taking page) to generate some.")
+
+    st.write("---")
+    st.markdown("#### Behavior story")
+    active_days = len(state["days_active"])
+    story_lines = []
+    if active_days == 0:
+        story_lines.append("No active days yet. Run one short scenario to start your momentum.")
+    else:
+        story_lines.append(
+            f"Active on {active_days} day(s) with a best streak of {best_streak}."
+        )
+        # Top source insight
+        source_totals = state["xp_ledger"].by_source
+        if source_totals:
+            top_source = max(source_totals.items(), key=lambda x: x[1])[0]
+            story_lines.append(f"Most XP comes from '{top_source}' right now (behavior channel lens).")
+        # Recent momentum
+        today = date.today()
+        recent = []
+        for offset in range(3):
+            d = (today - timedelta(days=offset)).isoformat()
+            recent.append(xp_by_day.get(d, 0))
+        if all(v == 0 for v in recent):
+            story_lines.append("The last 3 days show zero XP. Try a small micro-mission to reset.")
+        elif recent[0] > recent[1] >= recent[2]:
+            story_lines.append("Your last 3 days show rising XP that's an improving momentum pattern.")
+        elif recent[0] < recent[1]:
+            story_lines.append("Yesterday outperformed today. A tiny run can keep the slope positive.")
+        else:
+            story_lines.append("Steady output. Keep compounding small wins.")
+    for line in story_lines:
+        st.write(f"- {line}")
+
+    st.write("---")
+    st.markdown("#### ASCII XP sparkline (last 7 days)")
+    spark_rows = []
+    today = date.today()
+    for offset in range(6, -1, -1):
+        d = today - timedelta(days=offset)
+        d_str = d.isoformat()
+        xp = xp_by_day.get(d_str, 0)
+        if xp == 0:
+            bucket = "."
+        elif xp <= 50:
+            bucket = "#"
+        elif xp <= 100:
+            bucket = "##"
+        elif xp <= 200:
+            bucket = "###"
+        else:
+            bucket = "####"
+        spark_rows.append(f"{d.strftime('%a')}: {bucket} ({xp} XP)")
+    if spark_rows:
+        for row in spark_rows:
+            st.text(row)
+    else:
+        st.write("No XP data yet to show a sparkline.")
+
+    link_row = st.columns(3)
+    link_row[0].button("XP history", on_click=navigate_to, args=("xp_history",), use_container_width=True)
+    link_row[1].button("XP by subject", on_click=navigate_to, args=("xp_subject_breakdown",), use_container_width=True)
+    link_row[2].button("Achievements", on_click=navigate_to, args=("achievements_list",), use_container_width=True)
+    st.button("Open shop to redeem coins", on_click=navigate_to, args=("shop_home",), use_container_width=True)
+    render_demo_disclaimer("XP values here reflect the current session until persistence is wired up.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_xp_history(page: Page):
+
+    """XP events + XP by day."""
+
+    render_top_bar(page.label)
+
+    state = get_user_state()
+
+    by_day = get_xp_by_day()
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### XP History Timeline")
+
+
+
+    if not state["xp_events"]:
+
+        st.write("No XP events yet. Log in and run a scenario to generate XP.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        return
+
+
+
+    st.markdown("#### Latest XP events")
+
+    events = state["xp_ledger"].recent(20)
+
+    table_events = {
+
+        "Time (UTC)": [e["ts"] for e in events],
+
+        "Source": [e["source"] for e in events],
+
+        "Amount": [e["amount"] for e in events],
+
+        "Description": [e["description"] for e in events],
+
+    }
+
+    st.table(table_events)
+
+
+
+    st.write("---")
+
+    st.markdown("#### XP by day (aggregated)")
+
+
+
+    days_sorted = sorted(by_day.keys())
+
+    table_days = {
+
+        "Date": days_sorted,
+
+        "XP": [by_day[d] for d in days_sorted],
+
+    }
+
+    st.table(table_days)
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_xp_subject_breakdown(page: Page):
+
+    """Treat 'subject' as a behavior channel for this session."""
+
+    render_top_bar(page.label)
+
+    state = get_user_state()
+
+    breakdown = get_subject_xp_breakdown()
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Behavior Channel XP Breakdown")
+
+
+
+    if not breakdown:
+
+        st.write("No scenario results yet. Save at least one result with the Test Taking page.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        return
+
+
+
+    rows = {
+
+        "Behavior channel (subject field)": [],
+
+        "XP": [],
+
+        "Scenarios run": [],
+
+    }
+
+    for subj, info in breakdown.items():
+
+        rows["Behavior channel (subject field)"].append(subj)
+
+        rows["XP"].append(info["xp"])
+
+        rows["Scenarios run"].append(info["tests"])
+
+
+
+    st.table(rows)
+
+    st.write(
+
+        "Right now we reuse the `subject` label as a behavior channel. "
+
+        "In the real engine these channels would be explicit dimensions like 'risk', 'frequency', 'conviction'."
+
+    )
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_xp_weekly_graph(page: Page):
+
+    """XP over the last 7 days (table style)."""
+
+    render_top_bar(page.label)
+
+    by_day = get_xp_by_day()
+
+    today = date.today()
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Weekly XP Graph")
+
+
+
+    if not by_day:
+
+        st.write("No XP data yet for this week.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        return
+
+
+
+    rows = {"Day": [], "Date": [], "XP": []}
+
+    for offset in range(6, -1, -1):
+
+        d = today - timedelta(days=offset)
+
+        d_str = d.isoformat()
+
+        rows["Day"].append(d.strftime("%a"))
+
+        rows["Date"].append(d_str)
+
+        rows["XP"].append(by_day.get(d_str, 0))
+
+
+
+    st.table(rows)
+
+    st.write(
+
+        "This is a minimal blackâ-'andâ-'white representation of XP over the last 7 days. "
+
+        "Higher XP means more behavioral activity or stronger scenario results."
+
+    )
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_xp_monthly_graph(page: Page):
+
+    """XP over the last 30 days (table style)."""
+
+    render_top_bar(page.label)
+
+    by_day = get_xp_by_day()
+
+    today = date.today()
+
+    start = today - timedelta(days=29)
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Monthly XP Graph")
+
+
+
+    if not by_day:
+
+        st.write("No XP data yet for this month.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        return
+
+
+
+    rows = {"Date": [], "XP": []}
+
+    cur = start
+
+    while cur <= today:
+
+        d_str = cur.isoformat()
+
+        rows["Date"].append(d_str)
+
+        rows["XP"].append(by_day.get(d_str, 0))
+
+        cur = cur + timedelta(days=1)
+
+
+
+    st.table(rows)
+
+    st.write(
+
+        "In a full UI this might be a line chart with tooltips; here it stays as a table to keep "
+
+        "the pure blackâ-'andâ-'white spec."
+
+    )
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_lifetime_stats(page: Page):
+    """Session lifetime stats based on your current state."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    streak_current = compute_streak(state["days_active"])
+    streak_best = compute_best_streak(state["days_active"])
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Lifetime Stats (this session)")
+
+
+
+    st.table(
+
+        {
+
+            "Metric": [
+
+                "Total XP",
+
+                "Total coins",
+
+                "Scenarios recorded",
+
+                "XP events",
+
+                "Active days",
+
+                "Current streak (days)",
+
+                "Best streak (days)",
+
+            ],
+
+            "Value": [
+
+                state["xp"],
+
+                state["coins"],
+
+                state["tests_taken"],
+
+                len(state["xp_ledger"]),
+
+                len(state["days_active"]),
+
+                streak_current,
+
+                streak_best,
+
+            ],
+
+        }
+
+    )
+
+
+
+    st.write(
+
+        "In production this would represent real Qubic behavior over months/years, not just this session. "
+
+        "Here we just show how the **feedback layer** might summarize your journey."
+    )
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_achievements(page: Page):
+    """Behavioral achievements rendered with progress and clear framing."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    catalog, best_streak = compute_achievements_catalog(state)
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### Achievements")
+    st.write(
+        "These mini-achievements turn repeated actions into visible milestones. "
+        "Inspired by streak mechanics and micro-goals from apps like Duolingo/WHOOP."
+    )
+
+    rows = {
+        "Name": [],
+        "Description": [],
+        "Status": [],
+        "Progress": [],
+    }
+    for ach in catalog:
+        rows["Name"].append(ach["name"])
+        rows["Description"].append(ach["description"])
+        rows["Status"].append("[UNLOCKED]" if ach["unlocked"] else "[LOCKED]")
+        rows["Progress"].append(ach["progress"])
+
+    st.table(rows)
+    st.write(f"Best streak seen so far: {best_streak} day(s).")
+    link_row = st.columns(3)
+    link_row[0].button("Achievement list", on_click=navigate_to, args=("achievements_list",), use_container_width=True)
+    link_row[1].button("Milestones roadmap", on_click=navigate_to, args=("milestones_roadmap",), use_container_width=True)
+    link_row[2].button("View details", on_click=navigate_to, args=("achievement_detail",), use_container_width=True)
+    st.button("Jump to invest case", on_click=navigate_to, args=("invest_case",), use_container_width=True)
+    render_demo_disclaimer("Achievements unlock based on the actions you take in this session.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_achievements_list(page: Page):
+    """Show all achievements plus their progress."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    catalog, best_streak = compute_achievements_catalog(state)
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Achievements directory")
+    st.caption(f"Best streak so far: {best_streak} day(s).")
+
+    nav_row = st.columns(3)
+    nav_row[0].button("List", use_container_width=True, disabled=True)
+    nav_row[1].button("Overview", on_click=navigate_to, args=("achievements",), use_container_width=True)
+    nav_row[2].button("Milestones", on_click=navigate_to, args=("milestones_roadmap",), use_container_width=True)
+
+
+
+    rows = {
+
+        "ID": [],
+
+        "Achievement": [],
+
+        "Status": [],
+
+        "Progress": [],
+
+    }
+
+    for ach in catalog:
+
+        rows["ID"].append(ach["id"])
+
+        rows["Achievement"].append(ach["name"])
+
+        rows["Status"].append("Unlocked" if ach["unlocked"] else "Locked")
+
+        rows["Progress"].append(ach["progress"])
+
+
+
+    st.table(rows)
+
+    ids = [a["id"] for a in catalog]
+
+    if ids:
+
+        selected = st.selectbox("View details for:", ids)
+
+        st.session_state.selected_achievement_id = selected
+
+        st.write("Now open **Achievement Detail** in the sidebar to see more.")
+
+    else:
+
+        st.write("No achievements defined (this would be unusual).")
+
+
+
+    link_row = st.columns(2)
+    link_row[0].button("Milestones roadmap", on_click=navigate_to, args=("milestones_roadmap",), use_container_width=True)
+    link_row[1].button("Achievement detail", on_click=navigate_to, args=("achievement_detail",), use_container_width=True)
+    render_demo_disclaimer("Achievements are unlocked based on what you do in this session.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_achievement_detail(page: Page):
+
+    """Detail view for a single achievement."""
+
+    render_top_bar(page.label)
+
+    state = get_user_state()
+
+    catalog, best_streak = compute_achievements_catalog(state)
+
+
+
+    selected_id = st.session_state.get("selected_achievement_id")
+
+    if not selected_id and catalog:
+
+        selected_id = catalog[0]["id"]
+
+
+
+    ach = None
+
+    for a in catalog:
+
+        if a["id"] == selected_id:
+
+            ach = a
+
+            break
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Achievement Detail")
+
+
+
+    if not ach:
+
+        st.write("No achievement selected yet. Open the Achievements List first.")
+
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        return
+
+
+
+    st.markdown(f"**{ach['name']}**")
+
+    st.write(ach["description"])
+
+    st.write("")
+
+    st.write(f"**Status:** {'Unlocked' if ach['unlocked'] else 'Locked'}")
+
+    st.write(f"**Progress:** {ach['progress']}")
+
+
+
+    st.write("")
+
+    if not ach["unlocked"]:
+
+        st.write(
+
+            "You can unlock achievements by running more scenarios, earning XP and "
+            "building streaks. Everything here reflects your current session data "
+            "until you connect live sources."
+
+        )
+
+    link_row = st.columns(2)
+    link_row[0].button("Back to list", on_click=navigate_to, args=("achievements_list",), use_container_width=True)
+    link_row[1].button("See roadmap", on_click=navigate_to, args=("milestones_roadmap",), use_container_width=True)
+    render_demo_disclaimer("Achievement detail reflects the activity in this session.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_milestones_roadmap(page: Page):
+
+    """Simple roadmap based on locked achievements."""
+
+    render_top_bar(page.label)
+
+    state = get_user_state()
+
+    catalog, best_streak = compute_achievements_catalog(state)
+
+
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+    st.markdown("### Milestones Roadmap")
+
+
+
+    st.write(
+
+        "Each locked achievement can be read as a **milestone**. This page just lists them in plain form."
+
+    )
+
+
+
+    rows = {
+
+        "Achievement": [],
+
+        "Requirement summary": [],
+
+    }
+
+
+
+    for ach in catalog:
+
+        if ach["unlocked"]:
+
+            continue
+
+        rows["Achievement"].append(ach["name"])
+
+        rows["Requirement summary"].append(ach["description"])
+
+
+
+    if rows["Achievement"]:
+
+        st.table(rows)
+
+    else:
+
+        st.write("You have unlocked all achievements available in this session.")
+
+
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def tpl_metrics_lab(page: Page):
+    """Behavior metrics and random simulation."""
+    render_top_bar(page.label)
+    state = get_user_state()
+    streak_current = compute_streak(state["days_active"])
+    streak_best = compute_best_streak(state["days_active"])
+
+    # Lightweight derived metrics (placeholders)
+    tes = round(state["xp"] / 120 + streak_current * 2, 1)  # Tension/Energy Score placeholder
+    bss = len(state["xp_ledger"]) + streak_best  # Behavior Stability Score placeholder
+    bms = round((state["tests_taken"] + streak_current) * 1.5, 1)  # Behavior Momentum Score placeholder
+    cfs = max(0, 100 - streak_current * 3)  # Cognitive fatigue surrogate placeholder
+
+    st.markdown('<div class="main-container">', unsafe_allow_html=True)
+    st.markdown("### Behavior Metrics Lab")
+    st.write("View synthetic metrics and run a random simulation that updates XP, coins, and token balance.")
+    st.write("Metrics auto-update after simulations; persist by connecting your data sources.")
+
+    metrics = {
+        "TES": tes,
+        "BSS": bss,
+        "BMS": bms,
+        "CFS": cfs,
+        "XP": state["xp"],
+        "Coins": state["coins"],
+        "Token balance": round(state.get("token_balance", 0.0), 2),
+        "Current streak": streak_current,
+        "Best streak": streak_best,
+    }
+    st.table({"Metric": list(metrics.keys()), "Value": list(metrics.values())})
+
+    if st.button("Run random simulation"):
+        xp_gain = random.randint(50, 200)
+        grant_xp(xp_gain, "Simulation", "Random behavior simulation")
+        token_delta = round(random.uniform(-20, 50), 2)
+        state["token_balance"] = round(state.get("token_balance", 0.0) + token_delta, 2)
+        record_activity_day()
+        st.success(f"Simulation complete: +{xp_gain} XP, token balance change {token_delta}.")
+
+    st.write("---")
+    actions = st.columns(6)
+    actions[0].button("Open XP Overview", on_click=navigate_to, args=("xp_overview",), use_container_width=True)
+    actions[1].button("Run scenario", on_click=navigate_to, args=("scenario_run",), use_container_width=True)
+    actions[2].button("Go to shop", on_click=navigate_to, args=("shop_home",), use_container_width=True)
+    actions[3].button("Token trading", on_click=navigate_to, args=("token_trading",), use_container_width=True)
+    actions[4].button("Invest case", on_click=navigate_to, args=("invest_case",), use_container_width=True)
+    actions[5].button("Qubic testnet", on_click=navigate_to, args=("qubic_network",), use_container_width=True)
+
+    st.markdown("</div>", unsafe_allow_html=True)
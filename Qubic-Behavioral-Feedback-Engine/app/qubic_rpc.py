@@ -0,0 +1,341 @@
+"""Pooled, concurrent client for the Qubic RPC HTTP API.
+
+The app used to open a fresh `requests.get` per call with an 8 second
+timeout, one call after another, on every Streamlit rerun. `QubicRPC` keeps
+one `requests.Session` (keep-alive connections, pooled per host) and a small
+thread pool, so independent calls such as status and tick run side by side
+and a page waits for the slowest call rather than the sum of them.
+
+Every call returns the decoded JSON dict, or {"error": "..."} on failure -
+the contract the app's `fetch_qubic_*` helpers always had.
+
+Responses are cached per (endpoint, URL) for a short, per-endpoint TTL in a
+`ResponseCache`: network status only changes at tick cadence, not on every
+widget change. Concurrent misses for the same URL share one request, and the
+"no /v1/tick on this RPC" 404 is cached for longer. Balances get a cache of
+their own, so a large batch cannot evict the status and tick entries every
+page render reads. Cached dicts are shared between callers, so treat them
+as read-only.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+
+QUBIC_PUBLIC_RPC = "https://testnet-rpc.qubicdev.com"
+
+# (connect, read) timeouts in seconds, per endpoint.
+ENDPOINT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "status": (3.05, 5.0),
+    "tick": (3.05, 3.0),
+    "balance": (3.05, 5.0),
+    "transfers": (3.05, 10.0),
+}
+DEFAULT_TIMEOUT = (3.05, 5.0)
+
+MAX_WORKERS = 8
+# Pooled connections a balance batch leaves free for page renders.
+BATCH_RESERVED_CONNECTIONS = 2
+RETRIES = 2
+BACKOFF = 0.25  # seconds; doubled after every failed attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+TICK_NOT_FOUND = "Tick endpoint /v1/tick not available on this RPC"
+
+# Seconds a successful response stays cached, per endpoint. Errors are not
+# cached, except a known-missing endpoint (404), which is kept NOT_FOUND_TTL.
+CACHE_TTLS: Dict[str, float] = {
+    "status": 5.0,
+    "tick": 1.0,
+    "balance": 10.0,
+}
+NOT_FOUND_TTL = 300.0
+CACHE_MAXSIZE = 4096
+BALANCE_CACHE_MAXSIZE = 4096
+
+
+class ResponseCache:
+    """Thread-safe TTL cache with request coalescing.
+
+    `get_or_fetch` returns a fresh cached value, waits on an identical
+    request already in flight, or runs `fetch` itself and stores the result
+    for `ttl(result)` seconds (0 means do not cache). Least recently used
+    entries are dropped beyond `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = CACHE_MAXSIZE, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any], ttl: Callable[[Any], float]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._clock() < entry[1]:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[key]
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                leader = True
+                self.misses += 1
+            else:
+                leader = False
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        seconds = ttl(value)
+        with self._lock:
+            if seconds > 0:
+                self._entries[key] = (value, self._clock() + seconds)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "size": len(self._entries),
+        }
+
+
+def _clean_identity(identity: Optional[str]) -> str:
+    """Strip an identity; None counts as blank, anything else but str is a TypeError."""
+    if identity is None:
+        return ""
+    if not isinstance(identity, str):
+        raise TypeError(f"identity must be a str, not {type(identity).__name__}")
+    return identity.strip()
+
+
+class QubicRPC:
+    """Thread-safe Qubic RPC client over a shared connection pool.
+
+    Connection failures and RETRY_STATUSES responses are retried with
+    exponential backoff. Read timeouts - waiting for the headers or while
+    reading the body - and broken chunked bodies are not retried: an
+    endpoint that is already slow would only stall the caller longer.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = QUBIC_PUBLIC_RPC,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        retries: int = RETRIES,
+        backoff: float = BACKOFF,
+        max_workers: int = MAX_WORKERS,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        cache: Optional[ResponseCache] = None,
+        balance_cache: Optional[ResponseCache] = None,
+    ):
+        self.endpoint = endpoint
+        self.timeouts = dict(ENDPOINT_TIMEOUTS, **(timeouts or {}))
+        self.cache_ttls = dict(CACHE_TTLS, **(cache_ttls or {}))
+        self.cache = cache if cache is not None else ResponseCache()
+        self.balance_cache = (
+            balance_cache if balance_cache is not None else ResponseCache(maxsize=BALANCE_CACHE_MAXSIZE)
+        )
+        self.retries = retries
+        self.backoff = backoff
+        self.max_workers = max_workers
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="qubic-rpc")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self) -> "QubicRPC":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _url(self, path: str, endpoint: Optional[str]) -> str:
+        return (endpoint or self.endpoint).rstrip("/") + path
+
+    def get_json(
+        self,
+        name: str,
+        path: str,
+        endpoint: Optional[str] = None,
+        not_found: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """GET `path` with `name`'s timeout and cache TTL; {"error": ...} on failure.
+
+        not_found: error message to return for a 404 instead of the HTTP
+        error; that answer is cached for NOT_FOUND_TTL.
+        """
+        url = self._url(path, endpoint)
+        found = self.cache_ttls.get(name, 0.0)
+
+        def ttl(result: Tuple[Dict[str, Any], str]) -> float:
+            kind = result[1]
+            if kind == "ok":
+                return found
+            return NOT_FOUND_TTL if kind == "not_found" and found > 0 else 0.0
+
+        fetch = partial(self._request, name, url, not_found)
+        cache = self.balance_cache if name == "balance" else self.cache
+        return cache.get_or_fetch((name, url), fetch, ttl)[0]
+
+    def _request(self, name: str, url: str, not_found: Optional[str]) -> Tuple[Dict[str, Any], str]:
+        """(payload, kind) with kind "ok", "not_found" or "error"; retries per class docs."""
+        timeout = self.timeouts.get(name, DEFAULT_TIMEOUT)
+        attempt = 0
+        while True:
+            try:
+                resp = self.session.get(url, timeout=timeout)
+                if resp.status_code == 404 and not_found is not None:
+                    return {"error": not_found}, "not_found"
+                if resp.status_code in RETRY_STATUSES and attempt < self.retries:
+                    resp.close()
+                else:
+                    resp.raise_for_status()
+                    return resp.json(), "ok"
+            except (requests.ReadTimeout, requests.exceptions.ChunkedEncodingError) as e:
+                return {"error": str(e)}, "error"
+            except requests.ConnectionError as e:
+                # Includes ConnectTimeout. requests reports a read timeout
+                # while downloading the body as a ConnectionError.
+                if attempt >= self.retries or any(isinstance(a, ReadTimeoutError) for a in e.args):
+                    return {"error": str(e)}, "error"
+            except Exception as e:
+                return {"error": str(e)}, "error"
+            time.sleep(self.backoff * (2 ** attempt))
+            attempt += 1
+
+    # -------- Endpoints --------
+
+    def status(self, endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """/v1/status: supply, active addresses, price, market cap."""
+        return self.get_json("status", "/v1/status", endpoint)
+
+    def tick(self, endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """/v1/tick; a 404 (the public testnet has no such endpoint) becomes a friendly error."""
+        return self.get_json("tick", "/v1/tick", endpoint, not_found=TICK_NOT_FOUND)
+
+    def balance(self, identity: str, endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """/v1/balances/{identity}."""
+        identity = _clean_identity(identity)
+        if not identity:
+            return {"error": "No identity provided"}
+        return self.get_json("balance", f"/v1/balances/{identity}", endpoint)
+
+    def transfers(
+        self,
+        identity: str,
+        start_tick: int,
+        end_tick: int,
+        endpoint: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """/v2/identities/{identity}/transfers for ticks start_tick..end_tick (not cached)."""
+        identity = _clean_identity(identity)
+        if not identity:
+            return {"error": "No identity provided"}
+        path = f"/v2/identities/{identity}/transfers?startTick={int(start_tick)}&endTick={int(end_tick)}"
+        return self.get_json("transfers", path, endpoint)
+
+    # -------- Concurrency --------
+
+    def submit(self, fn: Callable[..., Dict[str, Any]], *args, **kwargs) -> Future:
+        """Run one call on the client's bounded thread pool."""
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def balances(
+        self,
+        identities: Iterable[str],
+        endpoint: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Balances for many identities: {"results": {id: payload}, "errors": {id: message}}.
+
+        Identities are stripped and de-duplicated (blank ones and None are
+        ignored), then fetched by at most `concurrency` threads through the
+        balance cache. The batch gets its own workers, capped at the
+        connection pool size minus BATCH_RESERVED_CONNECTIONS (at least one),
+        so it cannot hold every pooled connection that page renders use.
+        Raises TypeError for a single string or a non-str identity.
+        """
+        if isinstance(identities, str):
+            raise TypeError("identities must be an iterable of str, not a single str")
+        cleaned = (_clean_identity(i) for i in identities)
+        unique: List[str] = list(dict.fromkeys(i for i in cleaned if i))
+        limit = max(1, self.max_workers - BATCH_RESERVED_CONNECTIONS)
+        workers = max(1, min(concurrency or limit, limit, len(unique) or 1))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qubic-rpc-batch") as pool:
+            for identity, payload in zip(unique, pool.map(lambda i: self.balance(i, endpoint), unique)):
+                if "error" in payload:
+                    errors[identity] = payload["error"]
+                else:
+                    results[identity] = payload
+        return {"results": results, "errors": errors}
+
+    def network_snapshot(self, endpoint: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Status and tick fetched concurrently: {"status": ..., "tick": ...}."""
+        futures = {
+            "status": self.submit(self.status, endpoint),
+            "tick": self.submit(self.tick, endpoint),
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+_client: Optional[QubicRPC] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> QubicRPC:
+    """Process-wide client shared by every Streamlit session."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = QubicRPC()
+    return _client
@@ -0,0 +1,577 @@
+"""Persistent storage for per-user app state.
+
+`st.session_state` only lives as long as the browser tab, so a signed-in
+user's XP, tests, trades and active days are also written to a
+`StateBackend`. `SQLiteBackend` is the local implementation; a server
+database only needs to implement the same methods to be shared across app
+replicas.
+
+Writes are batched: `WriteBehind` buffers one user's appends
+(`grant_xp`, `record_test_attempt`, `log_token_trade`, new active days) and
+applies them in a single transaction when the buffer fills or gets old -
+a timer writes an idle session's buffer once it is `max_delay` old -
+and whatever is left is written when the session ends. Reads are narrow:
+`load_user_state` builds a session's state from aggregate and recent-window
+queries (XP per day, latest attempt per test, last N events) instead of
+whole histories.
+
+Stored state is only attached to a session that has authenticated:
+`register_account` and `authenticate` keep a salted password hash per
+user_id, apart from the profile so it never reaches session state.
+"""
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from user_state import ActivityDays, AttemptIndex, DerivedState, RECENT_XP_EVENTS, XPLedger
+
+# Fields of the user state stored as the profile record (last write wins).
+PROFILE_FIELDS = ("username", "email", "daily_tasks_done")
+# Balances stored as sums of per-session deltas, so concurrent sessions of
+# the same user (tabs, app replicas) add up instead of overwriting each other.
+# "xp" and "tests_taken" are not stored at all: they are derived from the
+# append-only xp_events and test_attempts tables.
+COUNTER_FIELDS = ("coins", "gems", "token_balance")
+# History rows loaded into a session; older rows stay in the backend.
+RECENT_TEST_ATTEMPTS = 200
+RECENT_TOKEN_TRADES = 200
+
+WRITE_BATCH_SIZE = 50
+WRITE_MAX_DELAY = 5.0  # seconds a buffered write may wait (enforced by a timer)
+
+PASSWORD_HASH_ITERATIONS = 200_000  # PBKDF2-HMAC-SHA256
+
+
+class PendingWrites:
+    """One user's buffered writes, applied together by `StateBackend.write`."""
+
+    __slots__ = ("profile", "counters", "xp_events", "test_attempts", "token_trades", "active_days")
+
+    def __init__(self):
+        self.profile: Optional[Dict[str, Any]] = None
+        self.counters: Dict[str, float] = {}  # field -> delta to add
+        self.xp_events: List[Dict[str, Any]] = []
+        self.test_attempts: List[Dict[str, Any]] = []
+        self.token_trades: List[Dict[str, Any]] = []
+        self.active_days: List[str] = []
+
+    def __len__(self) -> int:
+        return (
+            (self.profile is not None)
+            + len(self.counters)
+            + len(self.xp_events)
+            + len(self.test_attempts)
+            + len(self.token_trades)
+            + len(self.active_days)
+        )
+
+
+class StateBackend(ABC):
+    """Storage interface for user state; every method is keyed by user_id."""
+
+    @abstractmethod
+    def write(self, user_id: str, batch: PendingWrites) -> None:
+        """Apply a batch atomically: upsert the profile, add the counter deltas, append the rest."""
+        ...
+
+    @abstractmethod
+    def load_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def counters(self, user_id: str) -> Dict[str, float]:
+        """COUNTER_FIELDS values: the sum of every delta written."""
+        ...
+
+    @abstractmethod
+    def xp_totals(self, user_id: str) -> Tuple[Dict[str, int], Dict[str, int], int, int]:
+        """(XP by day, XP by source, event count, total XP)."""
+        ...
+
+    @abstractmethod
+    def recent_xp_events(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Up to `limit` most recent XP events, oldest first."""
+        ...
+
+    @abstractmethod
+    def active_days(self, user_id: str) -> List[str]:
+        ...
+
+    @abstractmethod
+    def latest_attempts(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        """Most recent attempt per test_id."""
+        ...
+
+    @abstractmethod
+    def subject_totals(self, user_id: str) -> Dict[str, Dict[str, int]]:
+        """subject -> {"xp", "tests"} over all attempts."""
+        ...
+
+    @abstractmethod
+    def recent_test_attempts(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def recent_token_trades(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def add_credential(self, user_id: str, salt: bytes, digest: bytes) -> bool:
+        """Store a password hash for a new user_id; False if it already has one."""
+        ...
+
+    @abstractmethod
+    def credential(self, user_id: str) -> Optional[Tuple[bytes, bytes]]:
+        """(salt, digest) stored for user_id, or None."""
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    user_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (user_id, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS xp_events (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    source TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS xp_events_user ON xp_events (user_id);
+CREATE INDEX IF NOT EXISTS xp_events_user_day ON xp_events (user_id, day, amount);
+CREATE TABLE IF NOT EXISTS test_attempts (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    xp_gained INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_attempts_user ON test_attempts (user_id);
+CREATE INDEX IF NOT EXISTS test_attempts_user_test ON test_attempts (user_id, test_id);
+CREATE TABLE IF NOT EXISTS token_trades (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS token_trades_user ON token_trades (user_id);
+CREATE TABLE IF NOT EXISTS active_days (
+    user_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (user_id, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS credentials (
+    user_id TEXT PRIMARY KEY,
+    salt BLOB NOT NULL,
+    digest BLOB NOT NULL
+);
+"""
+
+
+class SQLiteBackend(StateBackend):
+    """`StateBackend` in a local SQLite file (WAL mode, one shared connection)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, args: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def write(self, user_id: str, batch: PendingWrites) -> None:
+        with self._lock, self._conn:
+            if batch.profile is not None:
+                self._conn.execute(
+                    "INSERT INTO profiles (user_id, data, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(user_id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                    (user_id, json.dumps(batch.profile), time.time()),
+                )
+            self._conn.executemany(
+                "INSERT INTO counters (user_id, name, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(user_id, name) DO UPDATE SET value = value + excluded.value",
+                [(user_id, name, delta) for name, delta in batch.counters.items()],
+            )
+            self._conn.executemany(
+                "INSERT INTO xp_events (user_id, ts, day, source, amount, description) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (user_id, e["ts"], e["ts"][:10], e.get("source", ""), int(e.get("amount", 0)),
+                     e.get("description", ""))
+                    for e in batch.xp_events
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO test_attempts (user_id, test_id, subject, xp_gained, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (user_id, a["test_id"], a.get("subject", "General behavior"), int(a.get("xp_gained", 0)),
+                     json.dumps(a))
+                    for a in batch.test_attempts
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO token_trades (user_id, data) VALUES (?, ?)",
+                [(user_id, json.dumps(t)) for t in batch.token_trades],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO active_days (user_id, day) VALUES (?, ?)",
+                [(user_id, day) for day in batch.active_days],
+            )
+
+    def load_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT data FROM profiles WHERE user_id = ?", (user_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def counters(self, user_id: str) -> Dict[str, float]:
+        return dict(self._query("SELECT name, value FROM counters WHERE user_id = ?", (user_id,)))
+
+    def xp_totals(self, user_id: str) -> Tuple[Dict[str, int], Dict[str, int], int, int]:
+        by_day = dict(self._query(
+            "SELECT day, SUM(amount) FROM xp_events WHERE user_id = ? GROUP BY day ORDER BY day", (user_id,)
+        ))
+        by_source = dict(self._query(
+            "SELECT source, SUM(amount) FROM xp_events WHERE user_id = ? GROUP BY source", (user_id,)
+        ))
+        count, total = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(amount), 0) FROM xp_events WHERE user_id = ?", (user_id,)
+        )[0]
+        return by_day, by_source, count, total
+
+    def recent_xp_events(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        rows = self._query(
+            "SELECT ts, source, amount, description FROM xp_events WHERE user_id = ? ORDER BY id DESC LIMIT ?",
+            (user_id, limit),
+        )
+        return [
+            {"ts": ts, "source": source, "amount": amount, "description": description}
+            for ts, source, amount, description in reversed(rows)
+        ]
+
+    def active_days(self, user_id: str) -> List[str]:
+        return [day for (day,) in self._query(
+            "SELECT day FROM active_days WHERE user_id = ? ORDER BY day", (user_id,)
+        )]
+
+    def latest_attempts(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._query(
+            "SELECT test_id, data FROM test_attempts WHERE id IN "
+            "(SELECT MAX(id) FROM test_attempts WHERE user_id = ? GROUP BY test_id)",
+            (user_id,),
+        )
+        return {test_id: json.loads(data) for test_id, data in rows}
+
+    def subject_totals(self, user_id: str) -> Dict[str, Dict[str, int]]:
+        rows = self._query(
+            "SELECT subject, SUM(xp_gained), COUNT(*) FROM test_attempts WHERE user_id = ? GROUP BY subject",
+            (user_id,),
+        )
+        return {subject: {"xp": xp, "tests": tests} for subject, xp, tests in rows}
+
+    def _recent_json(self, table: str, user_id: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        sql = f"SELECT data FROM {table} WHERE user_id = ? ORDER BY id DESC"
+        args: Tuple = (user_id,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            args = (user_id, limit)
+        return [json.loads(data) for (data,) in reversed(self._query(sql, args))]
+
+    def recent_test_attempts(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        return self._recent_json("test_attempts", user_id, limit)
+
+    def recent_token_trades(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
+        return self._recent_json("token_trades", user_id, limit)
+
+    def add_credential(self, user_id: str, salt: bytes, digest: bytes) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO credentials (user_id, salt, digest) VALUES (?, ?, ?)",
+                (user_id, salt, digest),
+            )
+            return cursor.rowcount == 1
+
+    def credential(self, user_id: str) -> Optional[Tuple[bytes, bytes]]:
+        rows = self._query("SELECT salt, digest FROM credentials WHERE user_id = ?", (user_id,))
+        return (bytes(rows[0][0]), bytes(rows[0][1])) if rows else None
+
+
+class _Outbox:
+    """A writer's pending batch, kept apart so it can be flushed after the writer is gone."""
+
+    def __init__(self):
+        self.pending = PendingWrites()
+        self.since: Optional[float] = None  # clock time of the oldest pending record
+        self.timer: Optional[threading.Timer] = None  # drains the batch once it is due
+        self.lock = threading.RLock()  # the timer drains from its own thread
+
+    def drain(self, backend: "StateBackend", user_id: str) -> int:
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            batch = self.pending
+            n = len(batch)
+            if n:
+                self.pending = PendingWrites()
+                self.since = None
+                backend.write(user_id, batch)
+            return n
+
+
+class WriteBehind:
+    """Buffers one user's writes and applies them to the backend in batches.
+
+    A batch is written when it reaches `batch_size` records or when its
+    oldest record is `max_delay` seconds old - checked on every write and on
+    `maybe_flush`, and with flush_timer by a background timer, so an idle
+    session's writes do not wait for its next rerun - on an explicit
+    `flush()`, and finally when the writer is garbage collected (its session
+    ended) or the process exits.
+
+    `baseline` is the session state as it was last loaded or saved; `sync`
+    stages only what changed since then: COUNTER_FIELDS as deltas, and the
+    profile fields if they differ.
+    """
+
+    def __init__(
+        self,
+        backend: StateBackend,
+        user_id: str,
+        batch_size: int = WRITE_BATCH_SIZE,
+        max_delay: float = WRITE_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+        baseline: Optional[Dict[str, Any]] = None,
+        flush_timer: bool = True,
+    ):
+        self.backend = backend
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.flush_timer = flush_timer
+        self._clock = clock
+        baseline = baseline or {}
+        self._synced = {field: baseline.get(field, 0) for field in COUNTER_FIELDS}
+        self._synced_profile = _profile_key(profile_of(baseline))
+        self._outbox = _Outbox()
+        self.batches_written = 0
+        weakref.finalize(self, self._outbox.drain, backend, user_id)
+
+    def __len__(self) -> int:
+        return len(self._outbox.pending)
+
+    def _added(self) -> None:
+        outbox = self._outbox
+        if outbox.since is None:
+            outbox.since = self._clock()
+            if self.flush_timer:
+                # Holds the outbox, not the writer, so the writer can still be collected.
+                outbox.timer = threading.Timer(self.max_delay, outbox.drain, (self.backend, self.user_id))
+                outbox.timer.daemon = True
+                outbox.timer.start()
+        self.maybe_flush()
+
+    def maybe_flush(self) -> int:
+        """Flush if the batch is full or its oldest record is due; returns records written."""
+        outbox = self._outbox
+        with outbox.lock:
+            if outbox.since is None:
+                return 0
+            if len(outbox.pending) >= self.batch_size or self._clock() - outbox.since >= self.max_delay:
+                return self.flush()
+            return 0
+
+    def xp_event(self, event: Dict[str, Any]) -> None:
+        with self._outbox.lock:
+            self._outbox.pending.xp_events.append(event)
+            self._added()
+
+    def test_attempt(self, attempt: Dict[str, Any]) -> None:
+        with self._outbox.lock:
+            self._outbox.pending.test_attempts.append(attempt)
+            self._added()
+
+    def token_trade(self, trade: Dict[str, Any]) -> None:
+        with self._outbox.lock:
+            self._outbox.pending.token_trades.append(trade)
+            self._added()
+
+    def active_day(self, day: str) -> None:
+        with self._outbox.lock:
+            self._outbox.pending.active_days.append(day)
+            self._added()
+
+    def sync(self, state: Dict[str, Any]) -> bool:
+        """Stage what changed in `state` since the last sync; returns False if nothing did."""
+        with self._outbox.lock:
+            return self._sync(state)
+
+    def _sync(self, state: Dict[str, Any]) -> bool:
+        pending = self._outbox.pending
+        changed = False
+        for field in COUNTER_FIELDS:
+            value = state.get(field, 0)
+            delta = value - self._synced[field]
+            if delta:
+                pending.counters[field] = pending.counters.get(field, 0) + delta
+                self._synced[field] = value
+                changed = True
+        profile = profile_of(state)
+        key = _profile_key(profile)
+        if key != self._synced_profile:
+            pending.profile = json.loads(key)  # a copy: state dicts are mutated in place
+            self._synced_profile = key
+            changed = True
+        if changed:
+            self._added()
+        return changed
+
+    def flush(self) -> int:
+        """Write everything buffered; returns the number of records written."""
+        n = self._outbox.drain(self.backend, self.user_id)
+        if n:
+            self.batches_written += 1
+        return n
+
+
+def _password_digest(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, PASSWORD_HASH_ITERATIONS)
+
+
+def register_account(backend: StateBackend, user_id: str, password: str) -> bool:
+    """Create credentials for user_id; False if the account already exists."""
+    salt = os.urandom(16)
+    return backend.add_credential(user_id, salt, _password_digest(password, salt))
+
+
+def authenticate(backend: StateBackend, user_id: str, password: str) -> bool:
+    """True if `password` matches the stored credentials of user_id."""
+    stored = backend.credential(user_id)
+    if stored is None:
+        return False
+    salt, digest = stored
+    return hmac.compare_digest(_password_digest(password, salt), digest)
+
+
+def _profile_key(profile: Dict[str, Any]) -> str:
+    return json.dumps(profile, sort_keys=True)
+
+
+def profile_of(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: state[field] for field in PROFILE_FIELDS if field in state}
+
+
+def save_user_state(backend: StateBackend, user_id: str, state: Dict[str, Any]) -> None:
+    """Write a whole session state for a new account (e.g. a guest signing up).
+
+    XP events come from `XPLedger.all_events`, so a ledger created with
+    keep_evicted is saved in full, not just its ring buffer.
+    """
+    batch = PendingWrites()
+    batch.profile = profile_of(state)
+    batch.counters = {field: state[field] for field in COUNTER_FIELDS if state.get(field)}
+    batch.xp_events = state["xp_ledger"].all_events()
+    batch.test_attempts = list(state["test_history"])
+    batch.token_trades = list(state["token_trades"])
+    batch.active_days = list(state["days_active"])
+    backend.write(user_id, batch)
+
+
+def load_user_state(backend: StateBackend, user_id: str) -> Optional[Dict[str, Any]]:
+    """Session state for a stored user, or None if the user is unknown.
+
+    Callers must have authenticated user_id first. "username" is the stored
+    display name, which need not equal user_id.
+
+    Aggregates (XP per day/source, latest attempt per test, subject totals)
+    come from grouped queries; the raw lists hold only the most recent rows.
+    xp and tests_taken are totals over the stored events and attempts.
+    """
+    profile = backend.load_profile(user_id)
+    if profile is None:
+        return None
+
+    by_day, by_source, count, total = backend.xp_totals(user_id)
+    xp_ledger = XPLedger.from_totals(
+        by_day, by_source, count, total, backend.recent_xp_events(user_id, RECENT_XP_EVENTS)
+    )
+    test_index = AttemptIndex()
+    test_index.latest = backend.latest_attempts(user_id)
+    test_index.by_subject = backend.subject_totals(user_id)
+
+    state = {
+        "username": user_id,
+        "xp": 0,
+        "coins": 0,
+        "gems": 0,
+        "tests_taken": 0,
+        "daily_tasks_done": {},
+        "token_balance": 0.0,
+        "ai_chat_history": [],
+    }
+    state.update(profile_of(profile))
+    counters = backend.counters(user_id)
+    state.update({
+        "xp": total,
+        "tests_taken": sum(totals["tests"] for totals in test_index.by_subject.values()),
+        "coins": int(counters.get("coins", 0)),
+        "gems": int(counters.get("gems", 0)),
+        "token_balance": round(counters.get("token_balance", 0.0), 2),
+        "test_history": backend.recent_test_attempts(user_id, RECENT_TEST_ATTEMPTS),
+        "test_index": test_index,
+        "xp_ledger": xp_ledger,
+        "xp_events": xp_ledger.events,
+        "days_active": ActivityDays(backend.active_days(user_id)),
+        "token_trades": backend.recent_token_trades(user_id, RECENT_TOKEN_TRADES),
+        "derived": DerivedState(),
+    })
+    return state
+
+
+_backend: Optional[StateBackend] = None
+_backend_lock = threading.Lock()
+
+# QBFE_STATE_DB: path of the SQLite file, or "off" for session-only state.
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "user_state.sqlite3")
+
+
+def get_backend() -> Optional[StateBackend]:
+    """Process-wide backend shared by every session, or None when disabled."""
+    global _backend
+    path = os.environ.get("QBFE_STATE_DB", DEFAULT_DB_PATH)
+    if path.lower() in ("", "off", "none"):
+        return None
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = SQLiteBackend(path)
+    return _backend
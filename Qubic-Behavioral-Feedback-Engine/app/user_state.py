@@ -0,0 +1,251 @@
+"""Incrementally maintained structures behind the app's per-user state.
+
+Pages read the same derived values (XP per day, streaks, ...) on every
+Streamlit rerun. The classes here keep those values up to date as events are
+recorded, so reads do no scanning. They are plain Python with no Streamlit
+dependency, so they can be tested directly.
+"""
+from bisect import insort
+from collections import deque
+from datetime import date
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+# Raw XP events kept for the "latest events" tables; older ones survive only
+# in the ledger's aggregates.
+RECENT_XP_EVENTS = 500
+
+# Evicted raw events a keep_evicted ledger holds before folding them into one
+# summary event per (day, source); see XPLedger._compact_evicted.
+MAX_EVICTED_XP_EVENTS = 5000
+
+
+class XPLedger:
+    """XP events with running per-day and per-source totals.
+
+    `events` is a ring buffer of the most recent `maxlen` raw events (oldest
+    first). `by_day` ('YYYY-MM-DD' -> XP) and `by_source` (source -> XP)
+    cover every event ever recorded; treat them as read-only.
+
+    With keep_evicted, events pushed out of the ring buffer are kept in
+    `evicted` so `all_events()` can still return the full history - used by
+    session-only (guest) state until it is saved to a storage backend. Past
+    `max_evicted` they are folded into per-(day, source) summary events, which
+    keep the XP totals exact but not the event count.
+    """
+
+    def __init__(
+        self,
+        maxlen: int = RECENT_XP_EVENTS,
+        keep_evicted: bool = False,
+        max_evicted: int = MAX_EVICTED_XP_EVENTS,
+    ):
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self.keep_evicted = keep_evicted
+        self.max_evicted = max_evicted
+        self.evicted: List[Dict[str, Any]] = []
+        self.by_day: Dict[str, int] = {}
+        self.by_source: Dict[str, int] = {}
+        self.total_events = 0
+        self.total_xp = 0
+
+    def __len__(self) -> int:
+        return self.total_events
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Add one {"ts", "source", "amount", "description"} event."""
+        amount = int(event.get("amount", 0))
+        day = event["ts"][:10]
+        self.by_day[day] = self.by_day.get(day, 0) + amount
+        source = event.get("source", "")
+        self.by_source[source] = self.by_source.get(source, 0) + amount
+        self.total_events += 1
+        self.total_xp += amount
+        if self.keep_evicted and len(self.events) == self.events.maxlen:
+            self.evicted.append(self.events[0])
+            if len(self.evicted) > self.max_evicted:
+                self._compact_evicted()
+        self.events.append(event)
+
+    def _compact_evicted(self) -> None:
+        """Fold evicted events into one summary event per (day, source).
+
+        If even the summaries exceed half the cap, the oldest are dropped;
+        their XP then lives only in this ledger's aggregates.
+        """
+        totals: Dict[Tuple[str, str], int] = {}
+        for event in self.evicted:
+            key = (event["ts"][:10], event.get("source", ""))
+            totals[key] = totals.get(key, 0) + int(event.get("amount", 0))
+        self.evicted = [
+            {"ts": f"{day}T00:00:00", "source": source, "amount": amount, "description": "Earlier XP (combined)"}
+            for (day, source), amount in sorted(totals.items())
+        ]
+        keep = self.max_evicted // 2
+        if len(self.evicted) > keep:
+            del self.evicted[: len(self.evicted) - keep]
+
+    def all_events(self) -> List[Dict[str, Any]]:
+        """Every retained raw event, oldest first (complete only with keep_evicted)."""
+        return self.evicted + list(self.events)
+
+    def drop_evicted(self) -> None:
+        """Stop retaining evicted events, e.g. once they are stored elsewhere."""
+        self.keep_evicted = False
+        self.evicted = []
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[Dict[str, Any]],
+        maxlen: int = RECENT_XP_EVENTS,
+        keep_evicted: bool = False,
+        max_evicted: int = MAX_EVICTED_XP_EVENTS,
+    ) -> "XPLedger":
+        """Rebuild a ledger from a plain list of XP events, oldest first."""
+        ledger = cls(maxlen=maxlen, keep_evicted=keep_evicted, max_evicted=max_evicted)
+        for event in events:
+            ledger.record(event)
+        return ledger
+
+    @classmethod
+    def from_totals(
+        cls,
+        by_day: Dict[str, int],
+        by_source: Dict[str, int],
+        total_events: int,
+        total_xp: int,
+        recent_events: Iterable[Dict[str, Any]],
+        maxlen: int = RECENT_XP_EVENTS,
+    ) -> "XPLedger":
+        """Restore a ledger from stored aggregates plus its recent events, oldest first."""
+        ledger = cls(maxlen=maxlen)
+        ledger.by_day = dict(by_day)
+        ledger.by_source = dict(by_source)
+        ledger.total_events = total_events
+        ledger.total_xp = total_xp
+        ledger.events.extend(recent_events)
+        return ledger
+
+    def recent(self, n: int):
+        """Up to n most recent events, newest first."""
+        out = []
+        for event in reversed(self.events):
+            if len(out) >= n:
+                break
+            out.append(event)
+        return out
+
+
+class ActivityDays:
+    """Set of active days with streaks maintained on insert.
+
+    Days are stored as date ordinals together with the maximal runs of
+    consecutive days (run start <-> run end), so adding a day merges at most
+    two runs and both `current_streak` and `best_streak` are lookups. It also
+    reads like the sorted list of ISO dates it replaces: len(), iteration,
+    `in` and indexing (e.g. [-1] for the latest day) all work.
+    """
+
+    def __init__(self, days: Iterable[str] = ()):
+        self._ordinals = set()
+        self._sorted: List[str] = []
+        self._starts: Dict[int, int] = {}  # run start -> run end
+        self._ends: Dict[int, int] = {}    # run end -> run start
+        self.best = 0
+        for day in days:
+            self.add(day)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sorted)
+
+    def __getitem__(self, index):
+        return self._sorted[index]
+
+    def __contains__(self, day) -> bool:
+        return date.fromisoformat(day).toordinal() in self._ordinals
+
+    def add(self, day: str) -> bool:
+        """Mark an ISO day active; returns False if it already was."""
+        d = date.fromisoformat(day).toordinal()
+        if d in self._ordinals:
+            return False
+        self._ordinals.add(d)
+        if not self._sorted or day > self._sorted[-1]:
+            self._sorted.append(day)
+        else:
+            insort(self._sorted, day)
+
+        start = self._ends.pop(d - 1, d)
+        end = self._starts.pop(d + 1, d)
+        self._starts[start] = end
+        self._ends[end] = start
+        self.best = max(self.best, end - start + 1)
+        return True
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """Consecutive active days ending today (0 if today is not active)."""
+        t = (today or date.today()).toordinal()
+        start = self._ends.get(t)
+        return t - start + 1 if start is not None else 0
+
+    def best_streak(self) -> int:
+        return self.best
+
+
+class AttemptIndex:
+    """Secondary indexes over the append-only test history.
+
+    `latest` maps test_id -> most recent attempt; `by_subject` maps subject ->
+    {"xp", "tests"} running totals. Both are updated by `record`, in the
+    same order attempts are appended to the history.
+    """
+
+    def __init__(self):
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        self.by_subject: Dict[str, Dict[str, int]] = {}
+
+    def record(self, attempt: Dict[str, Any]) -> None:
+        self.latest[attempt["test_id"]] = attempt
+        subject = attempt.get("subject", "General behavior")
+        totals = self.by_subject.get(subject)
+        if totals is None:
+            totals = self.by_subject[subject] = {"xp": 0, "tests": 0}
+        totals["xp"] += int(attempt.get("xp_gained", 0))
+        totals["tests"] += 1
+
+    @classmethod
+    def from_history(cls, history: Iterable[Dict[str, Any]]) -> "AttemptIndex":
+        index = cls()
+        for attempt in history:
+            index.record(attempt)
+        return index
+
+
+class DerivedState:
+    """Values computed from user state, cached until that state changes.
+
+    Every mutation of the inputs (XP, tests, active days, XP events) calls
+    `bump()`. A cached value is reused while the version it was computed at
+    - and any extra key, such as today's date for streak-based values - is
+    unchanged. Cached values are shared between callers: treat them as
+    read-only.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._values: Dict[str, Tuple[Tuple, Any]] = {}
+
+    def bump(self) -> None:
+        self.version += 1
+
+    def get(self, name: str, compute: Callable[[], Any], *key: Hashable) -> Any:
+        stamp = (self.version,) + key
+        cached = self._values.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        value = compute()
+        self._values[name] = (stamp, value)
+        return value
@@ -0,0 +1,136 @@
+"""Streamlit cold start and rerun cost of app/app.py, optionally against a git ref.
+
+Each measurement runs the app headless through `streamlit.testing`'s
+`AppTest`, in a fresh subprocess so module caches start empty:
+
+    cold start - first run of the script (imports, page catalog, home page)
+    first visit - one rerun per page in --pages, each page opened once
+    rerun      - repeated reruns of one page, as after a widget interaction
+
+With --baseline the app directory at that git ref (e.g. the commit before a
+change) is exported to a temporary directory and measured the same way, so
+the report shows before and after side by side. AppTest's own overhead is
+included in every number.
+
+Run from the project root:
+
+    python -m benchmarks.bench_app_rerun --baseline HEAD~1 --reruns 50
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app", "app.py")
+
+DEFAULT_PAGES = [
+    "home_dashboard", "daily_tasks", "xp_history", "achievements_list",
+    "tests_all", "shop_home", "wallet_dashboard", "ai_assistant", "login",
+]
+
+
+def _worker(app_path: str, pages: List[str], reruns: int) -> Dict:
+    """Timings for one app, measured in this (fresh) process."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.session_state["auth_done"] = True
+    at.session_state["intro_done"] = True
+    at.session_state["pending_nav_page_id"] = "home_dashboard"
+    start = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - start
+
+    visits = []
+    for page_id in pages:
+        at.session_state["pending_nav_page_id"] = page_id
+        start = time.perf_counter()
+        at.run()
+        visits.append(time.perf_counter() - start)
+
+    at.session_state["pending_nav_page_id"] = pages[0]
+    at.run()
+    repeats = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        repeats.append(time.perf_counter() - start)
+
+    return {
+        "cold_start": cold,
+        "first_visit_mean": statistics.mean(visits),
+        "first_visit_max": max(visits),
+        "rerun_mean": statistics.mean(repeats),
+        "rerun_median": statistics.median(repeats),
+        "errors": [e.message for e in at.exception],
+    }
+
+
+def _measure(app_path: str, pages: List[str], reruns: int) -> Dict:
+    env = dict(os.environ, QBFE_STATE_DB="off")
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_app_rerun", "--worker", app_path,
+         "--pages", *pages, "--reruns", str(reruns)],
+        cwd=ROOT, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _export_app(ref: str, directory: str) -> str:
+    """Extract app/ as of `ref` into directory; returns the exported app.py path."""
+    def git(*args: str) -> bytes:
+        return subprocess.run(["git", *args], cwd=ROOT, check=True, capture_output=True).stdout
+
+    # `git archive` resolves paths from the top of the work tree.
+    toplevel = git("rev-parse", "--show-toplevel").decode().strip()
+    prefix = git("rev-parse", "--show-prefix").decode().strip()
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", f"{ref}:{prefix}app"], cwd=toplevel, check=True, capture_output=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+    return os.path.join(directory, "app.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", help="git ref to compare against (e.g. HEAD~1)")
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES)
+    parser.add_argument("--reruns", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per app; best run is reported")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.pages, args.reruns)))
+        return
+
+    apps = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.baseline:
+            apps[args.baseline] = _export_app(args.baseline, tmp)
+        apps["working tree"] = APP
+
+        print(f"{len(args.pages)} pages, {args.reruns} reruns, best of {args.repeat} processes")
+        print(f"{'app':>14} {'cold start':>11} {'visit mean':>11} {'visit max':>10} {'rerun mean':>11} {'rerun p50':>10}")
+        for name, path in apps.items():
+            runs = [_measure(path, args.pages, args.reruns) for _ in range(args.repeat)]
+            best = {key: min(r[key] for r in runs) for key in runs[0] if key != "errors"}
+            errors = sum(len(r["errors"]) for r in runs)
+            print(
+                f"{name:>14} {best['cold_start'] * 1000:9.1f}ms {best['first_visit_mean'] * 1000:9.1f}ms"
+                f" {best['first_visit_max'] * 1000:8.1f}ms {best['rerun_mean'] * 1000:9.1f}ms"
+                f" {best['rerun_median'] * 1000:8.1f}ms" + (f"  ({errors} page errors)" if errors else "")
+            )
+
+
+if __name__ == "__main__":
+    main()
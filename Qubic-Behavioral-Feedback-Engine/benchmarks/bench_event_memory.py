@@ -0,0 +1,50 @@
+"""Memory per event: dict events vs the columnar `EventStore`.
+
+Measures, with tracemalloc, the memory held by `_build_demo_events` output and
+by the same events converted to an `EventStore`.
+
+Run from the project root:
+
+    python -m benchmarks.bench_event_memory --users 5000 --days 14
+"""
+import argparse
+import gc
+import tracemalloc
+
+from metrics_engine.events import EventStore
+from metrics_engine.metrics_engine import _build_demo_events
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=14)
+    args = parser.parse_args()
+
+    user_events, dict_bytes = _measure(
+        lambda: _build_demo_events([], num_other_users=args.users, days=args.days, seed=0)
+    )
+    n_events = sum(len(events) for events in user_events.values())
+    store, store_bytes = _measure(lambda: EventStore.from_user_events(user_events))
+
+    print(f"{n_events} events ({args.users} users x {args.days} days)")
+    print(f"{'layout':>12} {'MiB':>9} {'bytes/event':>12}")
+    for name, size in (("dict events", dict_bytes), ("EventStore", store_bytes)):
+        print(f"{name:>12} {size / 2**20:9.1f} {size / n_events:12.1f}")
+    print(f"reduction: {dict_bytes / store_bytes:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Scaling of day-sharded TES/BSS scoring from 1 to N worker processes.
+
+Builds a synthetic crowd directly as daily strain/decision dicts (generating
+and parsing events is not what is being measured) and times scoring the full
+window serially and with `score_days_parallel` at increasing worker counts.
+
+Merging the results into per-user dicts stays in the parent process, so the
+speed-up flattens well below the worker count; the report ends with the
+smallest worker count that beat the serial run (the crossover point). Worker
+counts above the usable CPUs share cores and are marked as such.
+
+Run from the project root:
+
+    python -m benchmarks.bench_parallel --users 100000 --days 14
+"""
+import argparse
+import math
+import random
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from metrics_engine.metrics_engine import _compute_TES_BSS_for_day_sorted, _day_index
+from metrics_engine.parallel import default_workers, score_days_parallel
+
+
+def synthetic_crowd(num_users: int, days: int, seed: int = 0):
+    rng = random.Random(seed)
+    today = _day_index(datetime.utcnow())
+    days_list = list(range(today - days + 1, today + 1))
+    daily_strain = defaultdict(dict)
+    daily_decision = defaultdict(dict)
+    for i in range(num_users):
+        user = f"user_{i}"
+        daily_strain[user]
+        daily_decision[user]
+        for day in days_list:
+            # Roughly one in seven user-days is idle, like the demo crowd.
+            if rng.random() < 1 / 7:
+                continue
+            strain = rng.uniform(2.0, 40.0)
+            daily_strain[user][day] = strain
+            daily_decision[user][day] = math.log1p(strain)
+    return days_list, daily_strain, daily_decision
+
+
+def _score_serial(days_list, daily_strain, daily_decision):
+    for day in days_list:
+        _compute_TES_BSS_for_day_sorted(day, daily_strain, daily_decision)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--max-workers", type=int, default=default_workers())
+    args = parser.parse_args()
+
+    days_list, daily_strain, daily_decision = synthetic_crowd(args.users, args.days)
+
+    start = time.perf_counter()
+    _score_serial(days_list, daily_strain, daily_decision)
+    serial = time.perf_counter() - start
+    print(f"{args.users} users x {args.days} days")
+    print(f"{'workers':>8} {'seconds':>9} {'speed-up':>9}")
+    print(f"{'serial':>8} {serial:9.2f} {1.0:9.2f}")
+
+    counts = {args.max_workers}
+    workers = 1
+    while workers < args.max_workers:
+        counts.add(workers)
+        workers *= 2
+
+    cpus = default_workers()
+    crossover = None
+    for workers in sorted(counts):
+        start = time.perf_counter()
+        score_days_parallel(days_list, daily_strain, daily_decision, workers=workers)
+        elapsed = time.perf_counter() - start
+        note = f"  (> {cpus} usable CPUs)" if workers > cpus else ""
+        print(f"{workers:>8} {elapsed:9.2f} {serial / elapsed:9.2f}{note}")
+        if crossover is None and elapsed < serial:
+            crossover = workers
+
+    if crossover is None:
+        print(f"no worker count beat the serial run ({cpus} usable CPUs)")
+    else:
+        print(f"crossover: {crossover} worker(s) beat the serial run ({cpus} usable CPUs)")
+
+
+if __name__ == "__main__":
+    main()
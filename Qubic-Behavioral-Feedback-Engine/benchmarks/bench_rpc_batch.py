@@ -0,0 +1,99 @@
+"""Batch balance lookup throughput against a local mock Qubic RPC.
+
+Starts a threaded HTTP server that answers /v1/balances/{id} after a fixed
+latency, then looks up the same identities three ways: one fresh
+`requests.get` per identity (the app's original pattern), `QubicRPC.balances`
+at several concurrency levels with a cold cache, and one warm-cache pass.
+
+Run from the project root:
+
+    python -m benchmarks.bench_rpc_batch --identities 2000 --latency 0.02
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+from qubic_rpc import BATCH_RESERVED_CONNECTIONS, QubicRPC  # noqa: E402
+
+
+class _MockRPC(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        body = json.dumps({"id": self.path.rsplit("/", 1)[-1], "balance": "1000"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _start_server(latency: float) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockRPC)
+    server.daemon_threads = True
+    server.request_queue_size = 128
+    server.latency = latency
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server
+
+
+def _report(name: str, n: int, seconds: float, errors: int = 0) -> None:
+    print(f"{name:>24} {seconds:9.3f} {n / seconds:12.1f} {errors:7d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--identities", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02, help="mock RPC latency per request (s)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--serial-limit", type=int, default=200,
+                        help="identities timed for the unpooled serial baseline")
+    args = parser.parse_args()
+
+    server = _start_server(args.latency)
+    host, port = server.server_address
+    endpoint = f"http://{host}:{port}"
+    identities = [f"ID{i:06d}" for i in range(args.identities)]
+
+    print(f"{args.identities} identities, mock latency {args.latency * 1000:.0f} ms")
+    print(f"{'mode':>24} {'seconds':>9} {'ids/sec':>12} {'errors':>7}")
+
+    sample = identities[: args.serial_limit]
+    start = time.perf_counter()
+    for identity in sample:
+        requests.get(f"{endpoint}/v1/balances/{identity}", timeout=8).json()
+    _report(f"serial requests.get ({len(sample)})", len(sample), time.perf_counter() - start)
+
+    for concurrency in args.concurrency:
+        # Long cache TTL so the warm pass is cached however slow the cold one was.
+        # Size the pool so the batch itself gets `concurrency` threads.
+        pool = concurrency + BATCH_RESERVED_CONNECTIONS
+        with QubicRPC(endpoint=endpoint, max_workers=pool, cache_ttls={"balance": 3600.0}) as rpc:
+            start = time.perf_counter()
+            out = rpc.balances(identities)
+            _report(f"batch x{concurrency}", len(identities), time.perf_counter() - start, len(out["errors"]))
+
+            start = time.perf_counter()
+            out = rpc.balances(identities)
+            _report(f"batch x{concurrency} (cached)", len(identities), time.perf_counter() - start,
+                    len(out["errors"]))
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Benchmark suite for the metrics engine across crowd sizes and window lengths.
+
+For every (num_other_users, days) cell of a grid this times each stage of the
+pipeline - `_build_demo_events`, `_compute_daily_strain`, the per-day TES/BSS
+scorers, `_compute_BMS`, `_compute_CFS` and `compute_metrics` end to end - and
+records wall time, tracemalloc peak memory and events/sec. Results are written
+as JSON; `--compare` checks them against an earlier report and exits non-zero
+if any stage got slower than `--threshold`.
+
+Run from the project root:
+
+    python -m benchmarks.bench_suite                      # quick grid
+    python -m benchmarks.bench_suite --grid full -o bench.json
+    python -m benchmarks.bench_suite --grid full --max-events 0   # no size cap
+    python -m benchmarks.bench_suite --compare baseline.json
+"""
+import argparse
+import gc
+import importlib.util
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from metrics_engine.metrics_engine import (
+    _build_demo_events,
+    _compute_BMS,
+    _compute_CFS,
+    _compute_daily_strain,
+    _compute_TES_BSS_for_day,
+    _compute_TES_BSS_for_day_sorted,
+    _day_iso,
+    compute_metrics,
+)
+
+GRIDS = {
+    "quick": {"users": [25, 1_000], "days": [7, 14]},
+    "full": {"users": [25, 1_000, 10_000, 100_000, 1_000_000], "days": [7, 14, 30, 90, 365]},
+}
+
+# The quadratic reference scorer is only run on crowds this small.
+QUADRATIC_MAX_USERS = 2_000
+# The demo crowd averages 3 events per user-day.
+EVENTS_PER_USER_DAY = 3
+# Cells expected to generate more events are skipped unless --max-events is
+# raised: a Python event dict costs a few hundred bytes and several stages
+# hold the crowd in memory at once.
+DEFAULT_MAX_EVENTS = 2_000_000
+
+
+def _stage(name: str, fn: Callable, events: Optional[int], memory: bool) -> Dict:
+    """Run fn; returns its result plus a timing/memory record.
+
+    Timing comes from an untraced run. With `memory`, fn runs a second time
+    under tracemalloc to record peak allocation, so tracing overhead never
+    leaks into the wall times.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    record = {"stage": name, "seconds": seconds, "peak_bytes": peak}
+    if events is not None:
+        record["events_per_sec"] = events / seconds if seconds else None
+    return result, record
+
+
+def _build_crowd(users: int, days: int, seed: int, generator: str):
+    if generator == "numpy":
+        from metrics_engine.synthetic import build_demo_store
+
+        return build_demo_store([], num_other_users=users, days=days, seed=seed)
+    return _build_demo_events([], num_other_users=users, days=days, seed=seed)
+
+
+def _pipeline_stages(users: int, days: int, seed: int, memory: bool, generator: str, records: List[Dict]) -> int:
+    """Time each pipeline stage into records; returns the crowd's event count.
+
+    The crowd and its intermediate results are locals here, so they are
+    freed when this returns, before the end-to-end stages run.
+    """
+    user_events, rec = _stage(
+        "build_demo_events" if generator == "python" else "build_demo_store",
+        lambda: _build_crowd(users, days, seed, generator),
+        None,
+        memory,
+    )
+    if generator == "python":
+        n_events = sum(len(events) for events in user_events.values())
+    else:
+        n_events = len(user_events)
+    rec["events_per_sec"] = n_events / rec["seconds"] if rec["seconds"] else None
+    records.append(rec)
+
+    days_seen = set()
+    (daily_strain, daily_decision), rec = _stage(
+        "compute_daily_strain",
+        lambda: _compute_daily_strain(user_events, days_seen),
+        n_events,
+        memory,
+    )
+    records.append(rec)
+    days_list = sorted(days_seen)[-days:]
+
+    def score(scorer):
+        by_user = {}
+        for day in days_list:
+            label = _day_iso(day)
+            for user, s in scorer(day, daily_strain, daily_decision).items():
+                by_user.setdefault(user, {})[label] = s
+        return by_user
+
+    daily_scores, rec = _stage("TES_BSS_sorted", lambda: score(_compute_TES_BSS_for_day_sorted), n_events, memory)
+    records.append(rec)
+    if users <= QUADRATIC_MAX_USERS:
+        _, rec = _stage("TES_BSS_quadratic", lambda: score(_compute_TES_BSS_for_day), n_events, memory)
+        records.append(rec)
+
+    labels = [_day_iso(day) for day in days_list]
+    BMS_scores, rec = _stage("compute_BMS", lambda: _compute_BMS(daily_scores, labels), None, memory)
+    records.append(rec)
+
+    rng = random.Random(seed)
+    BMS_history = {
+        user: {"past": info["BMS%"] + rng.uniform(-5, 5), "future": info["BMS%"] + rng.uniform(-5, 5)}
+        for user, info in BMS_scores.items()
+    }
+    _, rec = _stage("compute_CFS", lambda: _compute_CFS(BMS_history, "you"), None, memory)
+    records.append(rec)
+    return n_events
+
+
+def run_cell(users: int, days: int, seed: int, memory: bool, generator: str = "python") -> List[Dict]:
+    records = []
+    n_events = _pipeline_stages(users, days, seed, memory, generator, records)
+
+    _, rec = _stage(
+        "compute_metrics",
+        lambda: compute_metrics([], num_other_users=users, days=days, seed=seed, generator=generator),
+        n_events,
+        memory,
+    )
+    records.append(rec)
+
+    if importlib.util.find_spec("numpy") is not None:
+        _, rec = _stage(
+            "compute_metrics[numpy]",
+            lambda: compute_metrics(
+                [], num_other_users=users, days=days, seed=seed, backend="numpy", generator=generator
+            ),
+            n_events,
+            memory,
+        )
+        records.append(rec)
+
+    for rec in records:
+        rec.update(users=users, days=days, events=n_events)
+    return records
+
+
+def compare(results: List[Dict], baseline_path: str, threshold: float) -> List[str]:
+    """Describe every (users, days, stage) that is slower than baseline * threshold."""
+    with open(baseline_path) as fh:
+        baseline = json.load(fh)
+    before = {(r["users"], r["days"], r["stage"]): r["seconds"] for r in baseline["results"]}
+
+    regressions = []
+    for r in results:
+        old = before.get((r["users"], r["days"], r["stage"]))
+        if old and r["seconds"] > old * threshold:
+            regressions.append(
+                f"{r['stage']} users={r['users']} days={r['days']}: "
+                f"{old:.3f}s -> {r['seconds']:.3f}s ({r['seconds'] / old:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+    parser.add_argument("--users", type=int, nargs="+", help="override the grid's crowd sizes")
+    parser.add_argument("--days", type=int, nargs="+", help="override the grid's window lengths")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--generator", choices=("python", "numpy"), default="python",
+                        help="synthetic crowd generator (numpy is needed for the large cells)")
+    parser.add_argument("--max-events", type=int, default=DEFAULT_MAX_EVENTS,
+                        help=f"skip cells expected to generate more events than this "
+                             f"(default {DEFAULT_MAX_EVENTS:,}; 0 runs every cell)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc pass (about half the run time)")
+    parser.add_argument("-o", "--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slow-down factor counted as a regression (default 1.25)")
+    args = parser.parse_args(argv)
+
+    grid = GRIDS[args.grid]
+    results, skipped = [], []
+    for users in args.users or grid["users"]:
+        for days in args.days or grid["days"]:
+            if args.max_events and users * days * EVENTS_PER_USER_DAY > args.max_events:
+                skipped.append({"users": users, "days": days, "reason": "max-events"})
+                print(f"users={users} days={days} skipped (over --max-events)", file=sys.stderr)
+                continue
+            print(f"users={users} days={days} ...", file=sys.stderr)
+            results.extend(
+                run_cell(users, days, args.seed, memory=not args.no_memory, generator=args.generator)
+            )
+
+    report = {
+        "meta": {
+            "created": datetime.utcnow().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "grid": args.grid,
+            "generator": args.generator,
+            "memory": not args.no_memory,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
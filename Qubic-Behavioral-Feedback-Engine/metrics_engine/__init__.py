@@ -1 +1,3 @@
 from .metrics_engine import compute_metrics
+from .streaming import MetricsEngine
+from .cache import cached_compute_metrics, invalidate_metrics_cache
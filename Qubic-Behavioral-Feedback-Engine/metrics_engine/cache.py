@@ -0,0 +1,141 @@
+"""Memoized `compute_metrics` results with LRU and TTL eviction.
+
+Streamlit reruns the whole script on every widget interaction, so identical
+`compute_metrics` calls repeat constantly. `MetricsCache` keys results on a
+stable hash of the call's inputs and returns the stored dict on a hit.
+
+Cached results are shared between callers: treat them as read-only.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .metrics_engine import compute_metrics
+
+
+def metrics_key(
+    user_actions: Optional[List[Dict[str, Any]]],
+    num_other_users: int,
+    days: int,
+    seed: Optional[int],
+    **options: Any,
+) -> str:
+    """Stable hash of the `compute_metrics` inputs.
+
+    The current UTC date is part of the key because the synthetic crowd is
+    anchored to "today", so cached results roll over at midnight.
+    """
+    payload = {
+        "user_actions": user_actions or [],
+        "num_other_users": num_other_users,
+        "days": days,
+        "seed": seed,
+        "options": options,
+        "today": datetime.utcnow().date().isoformat(),
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class MetricsCache:
+    """Bounded LRU cache with an optional per-entry TTL (seconds)."""
+
+    def __init__(
+        self,
+        maxsize: int = 32,
+        ttl: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or self._clock() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def compute_metrics(
+        self,
+        user_actions: Optional[List[Dict[str, Any]]] = None,
+        num_other_users: int = 25,
+        days: int = 14,
+        seed: Optional[int] = None,
+        **options: Any,
+    ):
+        """`compute_metrics` through the cache.
+
+        Calls without a seed are random by design, so they bypass the cache,
+        as do real-data calls (`events=`), whose input is too large to hash
+        per call and may change in place.
+        """
+        if seed is None or options.get("events") is not None:
+            return compute_metrics(user_actions, num_other_users, days, seed, **options)
+
+        key = metrics_key(user_actions, num_other_users, days, seed, **options)
+        result = self.get(key)
+        if result is None:
+            result = compute_metrics(user_actions, num_other_users, days, seed, **options)
+            self.put(key, result)
+        return result
+
+
+# Process-wide cache shared by every Streamlit session.
+_default_cache = MetricsCache()
+
+
+def cached_compute_metrics(
+    user_actions: Optional[List[Dict[str, Any]]] = None,
+    num_other_users: int = 25,
+    days: int = 14,
+    seed: Optional[int] = None,
+    **options: Any,
+):
+    """`compute_metrics` memoized in the process-wide cache."""
+    return _default_cache.compute_metrics(user_actions, num_other_users, days, seed, **options)
+
+
+def invalidate_metrics_cache(key: Optional[str] = None) -> None:
+    _default_cache.invalidate(key)
+
+
+def metrics_cache_stats() -> Dict[str, int]:
+    return _default_cache.stats()
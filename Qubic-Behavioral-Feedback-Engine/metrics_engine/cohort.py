@@ -0,0 +1,100 @@
+"""Indexed cohort lookup for CFS (Crowd Future Signal).
+
+`_compute_CFS` scans every user to find the target's cohort. `CohortIndex`
+sorts users by past BMS once, so a cohort is a range query, and keeps prefix
+counts of improve/stable/decline outcomes along that order, so the CFS of any
+user is answered from two bisects and two prefix lookups.
+"""
+from typing import Dict, List
+
+from .metrics_engine import CFS_DELTA, CFS_TOLERANCE, _window_bounds
+
+_IMPROVE, _STABLE, _DECLINE = 0, 1, 2
+
+
+class CohortIndex:
+    """Past-BMS index over a `BMS_history` mapping of user -> {"past", "future"}."""
+
+    def __init__(
+        self,
+        BMS_history: Dict[str, Dict[str, float]],
+        delta: float = CFS_DELTA,
+        tolerance: float = CFS_TOLERANCE,
+    ):
+        self.delta = delta
+        self.tolerance = tolerance
+        self._first_user = next(iter(BMS_history), None)
+
+        ordered = sorted(BMS_history.items(), key=lambda item: item[1]["past"])
+        self._users: List[str] = [user for user, _ in ordered]
+        self._past: List[float] = [info["past"] for _, info in ordered]
+        self._outcome: Dict[str, int] = {}
+        self._position: Dict[str, int] = {}
+
+        # _prefix[k][c] = number of users among the first k (by past BMS)
+        # whose outcome is class c.
+        self._prefix: List[List[int]] = [[0, 0, 0]]
+        for pos, (user, info) in enumerate(ordered):
+            outcome = self._classify(info["future"] - info["past"])
+            self._outcome[user] = outcome
+            self._position[user] = pos
+            counts = list(self._prefix[-1])
+            counts[outcome] += 1
+            self._prefix.append(counts)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def _classify(self, diff: float) -> int:
+        if diff > self.tolerance:
+            return _IMPROVE
+        if diff < -self.tolerance:
+            return _DECLINE
+        return _STABLE
+
+    def _bounds(self, target_user: str):
+        return _window_bounds(self._past, self._past[self._position[target_user]], self.delta)
+
+    def cohort(self, target_user: str) -> List[str]:
+        """Users (excluding the target) whose past BMS is within `delta`."""
+        lo, hi = self._bounds(target_user)
+        return [u for u in self._users[lo:hi] if u != target_user]
+
+    def cfs(self, target_user: str = "you") -> Dict:
+        """Same result as `_compute_CFS(BMS_history, target_user)`."""
+        if target_user not in self._position:
+            if self._first_user is None:
+                return {}
+            target_user = self._first_user
+        return self._cfs_for(target_user)
+
+    def cfs_all(self) -> Dict[str, Dict]:
+        """CFS for every indexed user at once, O(U log U) overall."""
+        return {user: self._cfs_for(user) for user in self._users}
+
+    def _cfs_for(self, target_user: str) -> Dict:
+        lo, hi = self._bounds(target_user)
+        counts = [self._prefix[hi][c] - self._prefix[lo][c] for c in range(3)]
+        counts[self._outcome[target_user]] -= 1
+
+        n = sum(counts)
+        if not n:
+            return {
+                "target_user": target_user,
+                "cohort_size": 0,
+                "Improve%": 0.0,
+                "Stable%": 0.0,
+                "Decline%": 0.0,
+            }
+        return {
+            "target_user": target_user,
+            "cohort_size": n,
+            "Improve%": (counts[_IMPROVE] / n) * 100.0,
+            "Stable%": (counts[_STABLE] / n) * 100.0,
+            "Decline%": (counts[_DECLINE] / n) * 100.0,
+        }
+
+
+def compute_CFS_batch(BMS_history: Dict[str, Dict[str, float]]) -> Dict[str, Dict]:
+    """CFS for every user in `BMS_history`, keyed by user."""
+    return CohortIndex(BMS_history).cfs_all()
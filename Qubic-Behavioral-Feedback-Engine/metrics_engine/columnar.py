@@ -0,0 +1,250 @@
+"""NumPy columnar backend for the metrics engine.
+
+Events are laid out as parallel arrays (user index, day index, action code,
+amount) and every stage is computed over a users x days grid instead of the
+nested per-user dicts used by the pure-Python path. Results are returned in
+the same shapes `compute_metrics` already produces.
+"""
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .metrics_engine import ACTION_WEIGHTS, TES_EPSILON, _day_index, _day_iso
+
+# Action codes follow ACTION_WEIGHTS order; unknown action types are appended
+# after these with the same 1.0 fallback weight the Python path uses.
+ACTION_CODES = {name: code for code, name in enumerate(ACTION_WEIGHTS)}
+
+
+def _columns_from_user_events(user_events: Dict[str, List[Dict[str, Any]]]):
+    """Flatten `_build_demo_events` output into columnar arrays.
+
+    Returns (users, day_keys, user_idx, day_idx, action_code, amount, weights)
+    where `weights[action_code]` is the strain weight of each action code.
+    """
+    users = list(user_events.keys())
+    action_codes = dict(ACTION_CODES)
+    day_codes: Dict[int, int] = {}
+
+    user_idx: List[int] = []
+    day_idx: List[int] = []
+    action_code: List[int] = []
+    amount: List[float] = []
+
+    for u, events in enumerate(user_events.values()):
+        for ev in events:
+            day = _day_index(ev["timestamp"])
+            code = day_codes.get(day)
+            if code is None:
+                code = day_codes[day] = len(day_codes)
+            action_type = ev.get("action_type", "other")
+            a_code = action_codes.get(action_type)
+            if a_code is None:
+                a_code = action_codes[action_type] = len(action_codes)
+
+            user_idx.append(u)
+            day_idx.append(code)
+            action_code.append(a_code)
+            amount.append(float(ev.get("amount", 0.0)))
+
+    weights = np.array(
+        [ACTION_WEIGHTS.get(name, 1.0) for name in action_codes], dtype=np.float64
+    )
+    return (
+        users,
+        list(day_codes),
+        np.array(user_idx, dtype=np.int64),
+        np.array(day_idx, dtype=np.int64),
+        np.array(action_code, dtype=np.int64),
+        np.array(amount, dtype=np.float64),
+        weights,
+    )
+
+
+def epoch_day_indexes(timestamps: np.ndarray) -> np.ndarray:
+    """Vectorized `_day_index` for an array of epoch-second timestamps."""
+    return np.floor_divide(timestamps, 86400).astype(np.int64)
+
+
+def _columns_from_event_store(store):
+    """Zero-copy view of an `EventStore` as columnar arrays.
+
+    Same return shape as `_columns_from_user_events`.
+    """
+    epoch_days, day_idx = np.unique(
+        epoch_day_indexes(np.frombuffer(store.timestamp, dtype=np.int64)), return_inverse=True
+    )
+    return (
+        list(store.users.values),
+        epoch_days.tolist(),
+        np.frombuffer(store.user, dtype=np.uint32).astype(np.int64),
+        day_idx.astype(np.int64),
+        np.frombuffer(store.action, dtype=np.uint16),
+        np.frombuffer(store.amount, dtype=np.float64),
+        np.array(store.action_weights(), dtype=np.float64),
+    )
+
+
+def _strain_grid(
+    n_users: int,
+    n_days: int,
+    user_idx: np.ndarray,
+    day_idx: np.ndarray,
+    action_code: np.ndarray,
+    amount: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Aggregate per-event strain into a (n_users, n_days) grid."""
+    amount_factor = 1.0 + np.log1p(np.abs(amount)) / 5.0
+    contrib = weights[action_code] * amount_factor
+    flat = np.bincount(
+        user_idx * n_days + day_idx, weights=contrib, minlength=n_users * n_days
+    )
+    return flat.reshape(n_users, n_days)
+
+
+def _window_bounds_grid(sorted_values: np.ndarray, centers: np.ndarray, radius: float):
+    """Vectorised `_window_bounds`: [lo, hi) slices with abs(v - center) <= radius.
+
+    searchsorted bounds are nudged with the exact predicate, as in the Python
+    path, so rounding of center +/- radius cannot change the counts.
+    """
+    n = len(sorted_values)
+    lo = np.searchsorted(sorted_values, centers - radius, side="left")
+    hi = np.searchsorted(sorted_values, centers + radius, side="right")
+    while True:
+        step = (lo > 0) & (np.abs(sorted_values[np.maximum(lo - 1, 0)] - centers) <= radius)
+        if not step.any():
+            break
+        lo -= step
+    while True:
+        step = (lo < n) & (np.abs(sorted_values[np.minimum(lo, n - 1)] - centers) > radius)
+        if not step.any():
+            break
+        lo += step
+    while True:
+        step = (hi < n) & (np.abs(sorted_values[np.minimum(hi, n - 1)] - centers) <= radius)
+        if not step.any():
+            break
+        hi += step
+    while True:
+        step = (hi > lo) & (np.abs(sorted_values[np.maximum(hi - 1, 0)] - centers) > radius)
+        if not step.any():
+            break
+        hi -= step
+    return lo, hi
+
+
+def _TES_BSS_grid(strain: np.ndarray, decision: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Score every (user, day) cell; columns are days, rows are users."""
+    n_users, n_days = strain.shape
+    TES = np.zeros_like(strain)
+    BSS = np.zeros_like(strain)
+    if n_users == 0:
+        return TES, BSS
+
+    sorted_decisions = np.sort(decision, axis=0)
+    sorted_strains = np.sort(strain, axis=0)
+    scale = 100.0 / n_users
+
+    for j in range(n_days):
+        if strain[:, j].sum() == 0:
+            continue
+        d_col = decision[:, j]
+        d_sorted = sorted_decisions[:, j]
+        lo, hi = _window_bounds_grid(d_sorted, d_col, TES_EPSILON)
+        TES[:, j] = (hi - lo) * scale
+        BSS[:, j] = np.searchsorted(sorted_strains[:, j], strain[:, j], side="right") * scale
+
+    return TES, BSS
+
+
+def _avg_nonzero_rows(values: np.ndarray) -> np.ndarray:
+    """Row-wise `_avg_nonzero`: mean of the positive entries, 0 if none."""
+    positive = values > 0
+    counts = positive.sum(axis=1)
+    totals = np.where(positive, values, 0.0).sum(axis=1)
+    return np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+
+
+def _BMS_grid(TES: np.ndarray, BSS: np.ndarray) -> Dict[str, np.ndarray]:
+    n_users, n_days = TES.shape
+    if n_days == 0:
+        consistency = np.zeros(n_users)
+        raw_trend = np.zeros(n_users)
+    else:
+        consistency = (BSS > 0).sum(axis=1) / n_days * 100.0
+        mid = max(1, n_days // 2)
+        past_avg = (_avg_nonzero_rows(TES[:, :mid]) + _avg_nonzero_rows(BSS[:, :mid])) / 2.0
+        recent_avg = (_avg_nonzero_rows(TES[:, mid:]) + _avg_nonzero_rows(BSS[:, mid:])) / 2.0
+        raw_trend = recent_avg - past_avg
+
+    trend = np.clip(50.0 + raw_trend, 0.0, 100.0)
+    return {
+        "Consistency%": consistency,
+        "Trend%": trend,
+        "BMS%": 0.5 * consistency + 0.5 * trend,
+    }
+
+
+def score_columns(
+    users: List[str],
+    day_keys: List[int],
+    user_idx: np.ndarray,
+    day_idx: np.ndarray,
+    action_code: np.ndarray,
+    amount: np.ndarray,
+    weights: np.ndarray,
+    days: int = 14,
+):
+    """Compute daily TES/BSS and BMS from columnar events.
+
+    `day_keys[k]` is the epoch day number (see `_day_index`) of day column k.
+    Only the most recent `days` observed days are scored, as in
+    `compute_metrics`; days are labelled YYYY-MM-DD in the output.
+    Returns (days_list, daily_scores_by_user, BMS_scores).
+    """
+    strain = _strain_grid(
+        len(users), len(day_keys), user_idx, day_idx, action_code, amount, weights
+    )
+
+    order = sorted(range(len(day_keys)), key=day_keys.__getitem__)
+    if len(order) > days:
+        order = order[-days:]
+    days_list = [_day_iso(day_keys[k]) for k in order]
+
+    strain = strain[:, order]
+    decision = np.log1p(strain)
+    TES, BSS = _TES_BSS_grid(strain, decision)
+    BMS = _BMS_grid(TES, BSS)
+
+    TES_rows = TES.tolist()
+    BSS_rows = BSS.tolist()
+    daily_scores_by_user = {
+        user: {
+            day: {"TES": t, "BSS": b}
+            for day, t, b in zip(days_list, TES_rows[u], BSS_rows[u])
+        }
+        for u, user in enumerate(users)
+    }
+
+    consistency = BMS["Consistency%"].tolist()
+    trend = BMS["Trend%"].tolist()
+    bms = BMS["BMS%"].tolist()
+    BMS_scores = {
+        user: {"Consistency%": consistency[u], "Trend%": trend[u], "BMS%": bms[u]}
+        for u, user in enumerate(users)
+    }
+    return days_list, daily_scores_by_user, BMS_scores
+
+
+def score_user_events(user_events, days: int = 14):
+    """Columnar equivalent of the scoring half of `compute_metrics`.
+
+    user_events is `_build_demo_events` output or an `EventStore`.
+    """
+    if isinstance(user_events, dict):
+        columns = _columns_from_user_events(user_events)
+    else:
+        columns = _columns_from_event_store(user_events)
+    return score_columns(*columns, days=days)
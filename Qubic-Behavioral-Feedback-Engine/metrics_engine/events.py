@@ -0,0 +1,134 @@
+"""Compact struct-of-arrays event storage.
+
+`_build_demo_events` represents every event as a five-key dict holding a
+`datetime` and repeated user/asset strings. `EventStore` keeps the same data
+as parallel typed arrays instead: interned user and asset IDs, action-type
+codes, integer epoch-second timestamps and float64 amounts (float64 rather
+than float32 so strain matches the dict path exactly).
+"""
+import calendar
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List
+
+from .metrics_engine import ACTION_WEIGHTS
+
+
+def _epoch_seconds(ts) -> int:
+    """Epoch seconds for a datetime or timestamp; naive datetimes are UTC."""
+    if isinstance(ts, datetime):
+        if ts.tzinfo is None:
+            return calendar.timegm(ts.timetuple())
+        return int(ts.timestamp())
+    if isinstance(ts, (int, float)):
+        return int(ts)
+    # Same fallback as `_day_key`: treat a missing timestamp as now.
+    return calendar.timegm(datetime.utcnow().timetuple())
+
+
+class _Interner:
+    """Bidirectional string <-> small int table."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, initial: Iterable[str] = ()):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for value in initial:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class EventStore:
+    """Append-only columnar event log.
+
+    Column `i` of every array describes event `i`. `action_types` starts with
+    the ACTION_WEIGHTS keys, so codes below len(ACTION_WEIGHTS) are the known
+    action types and `action_weights()` gives the strain weight per code.
+    """
+
+    __slots__ = ("users", "assets", "action_types", "user", "timestamp", "action", "amount", "asset")
+
+    def __init__(self):
+        self.users = _Interner()
+        self.assets = _Interner()
+        self.action_types = _Interner(ACTION_WEIGHTS)
+        self.user = array("I")
+        self.timestamp = array("q")
+        self.action = array("H")
+        self.amount = array("d")
+        self.asset = array("I")
+
+    def __len__(self) -> int:
+        return len(self.user)
+
+    def append(
+        self,
+        user_id: str,
+        timestamp,
+        action_type: str,
+        amount: float,
+        asset: str = "QUBIC",
+    ) -> None:
+        self.user.append(self.users.code(user_id))
+        self.timestamp.append(_epoch_seconds(timestamp))
+        self.action.append(self.action_types.code(action_type))
+        self.amount.append(amount)
+        self.asset.append(self.assets.code(asset))
+
+    def append_event(self, ev: Dict[str, Any]) -> None:
+        """Append one event dict in the `_build_demo_events` shape."""
+        self.append(
+            ev["user_id"],
+            ev.get("timestamp"),
+            ev.get("action_type", "other"),
+            float(ev.get("amount", 0.0)),
+            ev.get("asset", "QUBIC"),
+        )
+
+    def extend(self, events: Iterable[Dict[str, Any]]) -> None:
+        for ev in events:
+            self.append_event(ev)
+
+    @classmethod
+    def from_user_events(cls, user_events: Dict[str, List[Dict[str, Any]]]) -> "EventStore":
+        """Convert `_build_demo_events` output, keeping users with no events."""
+        store = cls()
+        for user, events in user_events.items():
+            store.users.code(user)
+            store.extend(events)
+        return store
+
+    def action_weights(self) -> List[float]:
+        """Strain weight for each action code (1.0 for unknown action types)."""
+        return [ACTION_WEIGHTS.get(name, 1.0) for name in self.action_types.values]
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Expand back into event dicts (for debugging and tables)."""
+        users = self.users.values
+        assets = self.assets.values
+        actions = self.action_types.values
+        for u, ts, a, amount, s in zip(self.user, self.timestamp, self.action, self.amount, self.asset):
+            yield {
+                "user_id": users[u],
+                "timestamp": datetime.utcfromtimestamp(ts),
+                "action_type": actions[a],
+                "amount": amount,
+                "asset": assets[s],
+            }
+
+    def nbytes(self) -> int:
+        """Approximate payload size of the column arrays."""
+        return sum(
+            col.itemsize * len(col)
+            for col in (self.user, self.timestamp, self.action, self.amount, self.asset)
+        )
@@ -0,0 +1,247 @@
+"""Streaming ingestion of JSONL / CSV event exports.
+
+Exports carry one event per line (JSONL) or row (CSV) with the fields
+user_id, timestamp, action_type, amount and asset. The readers here are
+generators: they normalize each record the way `_build_demo_events` does and
+yield it, so a file is never loaded whole. `iter_chunks` groups events into
+bounded lists, and `StrainAccumulator` folds them into per-user daily strain
+as they arrive - memory grows with users x days, not with events.
+
+    acc = aggregate_strain("events-2024-05.jsonl.gz")
+    days_list, daily_scores, BMS = acc.score(days=30)
+
+Chunks can equally be fed to `MetricsEngine.ingest_batch` or
+`EventStore.extend`.
+"""
+import csv
+import gzip
+import json
+import math
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from .metrics_engine import _day_index, _event_strain, _score_daily_strain
+
+DEFAULT_CHUNK_SIZE = 10_000
+FORMATS = ("jsonl", "csv")
+
+_SUFFIX_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl", ".csv": "csv"}
+
+
+def _parse_timestamp(value) -> datetime:
+    """Naive UTC datetime from a datetime, ISO-8601 string or epoch seconds."""
+    if isinstance(value, datetime):
+        ts = value
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.utcfromtimestamp(value)
+    elif isinstance(value, str) and value.strip():
+        text = value.strip()
+        try:
+            return datetime.utcfromtimestamp(float(text))
+        except ValueError:
+            pass
+        if text.endswith(("Z", "z")):
+            text = text[:-1] + "+00:00"
+        ts = datetime.fromisoformat(text)
+    else:
+        raise ValueError(f"missing or invalid timestamp: {value!r}")
+
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+def normalize_event(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one raw record and return it in the `_build_demo_events` shape.
+
+    user_id and timestamp are required; action_type defaults to "other"
+    (lowercased), amount to 0.0 and asset to "QUBIC". Empty CSV cells count
+    as missing. Raises ValueError for a record that cannot be used - also
+    for wrongly typed fields and out-of-range epoch timestamps.
+    """
+    try:
+        return _normalize(raw)
+    except (TypeError, OverflowError, OSError) as exc:
+        raise ValueError(f"invalid field value: {exc}") from exc
+
+
+def _normalize(raw: Dict[str, Any]) -> Dict[str, Any]:
+    user_id = str(raw.get("user_id") or "").strip()
+    if not user_id:
+        raise ValueError("missing user_id")
+
+    amount = raw.get("amount")
+    amount = float(amount) if amount not in (None, "") else 0.0
+    if not math.isfinite(amount):
+        raise ValueError(f"non-finite amount: {raw.get('amount')!r}")
+
+    return {
+        "user_id": user_id,
+        "timestamp": _parse_timestamp(raw.get("timestamp")),
+        "action_type": str(raw.get("action_type") or "other").strip().lower(),
+        "amount": amount,
+        "asset": str(raw.get("asset") or "QUBIC").strip(),
+    }
+
+
+@contextmanager
+def _open_text(source, newline: Optional[str] = None):
+    """Yield a text stream for a path (".gz" is decompressed) or pass a file object through."""
+    if hasattr(source, "read"):
+        yield source
+        return
+    path = os.fspath(source)
+    if path.endswith(".gz"):
+        fh = gzip.open(path, "rt", encoding="utf-8", newline=newline)
+    else:
+        fh = open(path, "r", encoding="utf-8", newline=newline)
+    with fh:
+        yield fh
+
+
+def _check_errors(errors: str) -> None:
+    if errors not in ("raise", "skip"):
+        raise ValueError(f"Unknown errors mode: {errors!r}")
+
+
+def iter_jsonl_events(source, errors: str = "raise") -> Iterator[Dict[str, Any]]:
+    """Yield normalized events from a JSONL file, path or open text stream.
+
+    Blank lines are ignored. errors="skip" drops malformed lines instead of
+    raising ValueError (which names the offending line).
+    """
+    _check_errors(errors)
+    with _open_text(source) as fh:
+        for lineno, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+                if not isinstance(raw, dict):
+                    raise ValueError("expected a JSON object")
+                event = normalize_event(raw)
+            except ValueError as exc:
+                if errors == "raise":
+                    raise ValueError(f"line {lineno}: {exc}") from exc
+                continue
+            yield event
+
+
+def iter_csv_events(source, errors: str = "raise") -> Iterator[Dict[str, Any]]:
+    """Yield normalized events from a CSV file with a header row.
+
+    Extra columns are ignored. errors behaves as in `iter_jsonl_events`.
+    """
+    _check_errors(errors)
+    with _open_text(source, newline="") as fh:
+        reader = csv.DictReader(fh)
+        for row in reader:
+            try:
+                event = normalize_event(row)
+            except ValueError as exc:
+                if errors == "raise":
+                    raise ValueError(f"line {reader.line_num}: {exc}") from exc
+                continue
+            yield event
+
+
+def _detect_format(source) -> str:
+    name = getattr(source, "name", source)
+    if isinstance(name, (str, os.PathLike)):
+        root, ext = os.path.splitext(os.fspath(name).lower())
+        if ext == ".gz":
+            ext = os.path.splitext(root)[1]
+        fmt = _SUFFIX_FORMATS.get(ext)
+        if fmt is not None:
+            return fmt
+    raise ValueError(f"Cannot infer event file format for {name!r}; pass fmt='jsonl' or 'csv'")
+
+
+def iter_events(source, fmt: Optional[str] = None, errors: str = "raise") -> Iterator[Dict[str, Any]]:
+    """Yield normalized events from a JSONL or CSV export.
+
+    fmt defaults to the file suffix (.jsonl/.ndjson/.json or .csv, optionally
+    followed by .gz).
+    """
+    fmt = fmt or _detect_format(source)
+    if fmt == "jsonl":
+        return iter_jsonl_events(source, errors=errors)
+    if fmt == "csv":
+        return iter_csv_events(source, errors=errors)
+    raise ValueError(f"Unknown event file format: {fmt!r}")
+
+
+def iter_chunks(events: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Group an event stream into lists of at most chunk_size events."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    it = iter(events)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class StrainAccumulator:
+    """Incremental `_compute_daily_strain` over a stream of event chunks.
+
+    Only per-user daily strain totals are kept; events are discarded once
+    added. Strain is additive, so the totals match `_compute_daily_strain`
+    on the same events however they are chunked.
+    """
+
+    def __init__(self):
+        self.daily_strain: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        self.days_seen: Set[int] = set()
+        self.events = 0
+
+    def add(self, events: Iterable[Dict[str, Any]]) -> None:
+        daily_strain = self.daily_strain
+        days_seen = self.days_seen
+        n = 0
+        for ev in events:
+            day = _day_index(ev["timestamp"])
+            daily_strain[ev["user_id"]][day] += _event_strain(ev)
+            days_seen.add(day)
+            n += 1
+        self.events += n
+
+    def daily_decision(self) -> Dict[str, Dict[int, float]]:
+        """Decision intensity log1p(strain) per user and day."""
+        daily_decision: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for user, by_day in self.daily_strain.items():
+            decisions = daily_decision[user]
+            for day, s in by_day.items():
+                decisions[day] = math.log1p(s)
+        return daily_decision
+
+    def result(self):
+        """(daily_strain, daily_decision), as returned by `_compute_daily_strain`."""
+        return self.daily_strain, self.daily_decision()
+
+    def score(self, days: int = 14, workers: int = 1):
+        """(days_list, daily_scores_by_user, BMS_scores) over the last `days` observed days."""
+        daily_strain, daily_decision = self.result()
+        return _score_daily_strain(daily_strain, daily_decision, self.days_seen, days, workers=workers)
+
+
+def aggregate_strain(
+    source,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    errors: str = "raise",
+    accumulator: Optional[StrainAccumulator] = None,
+) -> StrainAccumulator:
+    """Stream an export into a `StrainAccumulator`, chunk_size events at a time.
+
+    Pass an existing accumulator to combine several files.
+    """
+    acc = accumulator if accumulator is not None else StrainAccumulator()
+    for chunk in iter_chunks(iter_events(source, fmt=fmt, errors=errors), chunk_size):
+        acc.add(chunk)
+    return acc
@@ -0,0 +1,280 @@
+"""Behavioral event listener: tail Qubic ticks into a `MetricsEngine`.
+
+`BehavioralEventListener` polls an RPC client for the current tick, fetches
+the transfers of a set of watched identities for the ticks it has not seen
+yet, maps them to `ACTION_WEIGHTS` action types and feeds them to
+`MetricsEngine.ingest_batch`.
+
+Fetching and ingesting are decoupled by a bounded `asyncio.Queue`: when the
+engine falls behind the poller blocks instead of buffering without limit.
+After each batch the last ingested tick and the engine's state are written
+together to a checkpoint file, so a restarted listener restores the engine
+and resumes right after that tick instead of re-reading history.
+
+The client is duck-typed and synchronous (calls run in worker threads):
+
+    client.tick()                                    -> {"tick": n, ...} or {"error": ...}
+    client.transfers(identity, start_tick, end_tick) -> v2 transfers payload or {"error": ...}
+
+`app/qubic_rpc.QubicRPC` provides both.
+"""
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# How a watched identity's transfer maps onto `ACTION_WEIGHTS` types: money
+# sent is a withdrawal, money received a deposit, and a smart-contract call
+# (any non-zero inputType, e.g. a QX order) counts as a swap.
+OUTGOING_ACTION = "withdraw"
+INCOMING_ACTION = "deposit"
+CONTRACT_CALL_ACTION = "swap"
+
+POLL_INTERVAL = 2.0  # seconds between tick polls once caught up
+MAX_TICKS_PER_POLL = 1000
+QUEUE_SIZE = 64  # batches
+FETCH_CONCURRENCY = 8
+
+
+def _current_tick(payload: Dict[str, Any]) -> Optional[int]:
+    """Tick number from a /v1/tick or /v1/tick-info style payload."""
+    if "error" in payload:
+        return None
+    info = payload.get("tickInfo", payload)
+    for key in ("tick", "currentTick"):
+        if info.get(key) is not None:
+            return int(info[key])
+    return None
+
+
+def _iter_transactions(payload: Any) -> Iterator[Dict[str, Any]]:
+    """Flatten a v2 transfers payload into its transaction records.
+
+    Accepts {"transactions": [{"tickNumber", "transactions": [record, ...]}]}
+    as served by the archiver, or a plain list of records.
+    """
+    groups = payload.get("transactions", []) if isinstance(payload, dict) else payload
+    for group in groups or ():
+        if isinstance(group, dict) and "transactions" in group:
+            yield from group["transactions"]
+        else:
+            yield group
+
+
+def transfer_to_event(identity: str, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Event dict for one transaction record as seen by `identity`, or None if unrelated."""
+    tx = record.get("transaction", record)
+    source, dest = tx.get("sourceId"), tx.get("destId")
+    if identity == source:
+        action_type = CONTRACT_CALL_ACTION if int(tx.get("inputType") or 0) else OUTGOING_ACTION
+    elif identity == dest:
+        action_type = INCOMING_ACTION
+    else:
+        return None
+
+    # Archive timestamps are epoch milliseconds (as strings).
+    raw_ts = record.get("timestamp")
+    timestamp = int(raw_ts) / 1000.0 if raw_ts not in (None, "") else time.time()
+    return {
+        "user_id": identity,
+        "timestamp": timestamp,
+        "action_type": action_type,
+        "amount": float(tx.get("amount") or 0.0),
+        "asset": "QUBIC",
+        "tick": int(tx.get("tickNumber") or record.get("tickNumber") or 0),
+    }
+
+
+class TickCheckpoint:
+    """Last fully ingested tick and the engine state as of it, in one JSON file.
+
+    Writes go to a temporary file that is renamed into place, so a crash
+    leaves either the old or the new checkpoint, never a torn one - the tick
+    and the state it describes always change together.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> Optional[int]:
+        data = self._read()
+        return int(data["tick"]) if data is not None else None
+
+    def load_engine(self) -> Optional[Dict[str, Any]]:
+        """The `MetricsEngine.state()` saved with the tick, if any."""
+        data = self._read()
+        return data.get("engine") if data is not None else None
+
+    def save(self, tick: int, engine_state: Optional[Dict[str, Any]] = None) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"tick": tick, "saved_at": time.time(), "engine": engine_state}, fh)
+        os.replace(tmp_path, self.path)
+
+
+class BehavioralEventListener:
+    """Long-running poller from a Qubic RPC client into a `MetricsEngine`.
+
+    identities: wallets whose transfers are tracked.
+    checkpoint_path: where the last ingested tick and the engine's state
+        (`state()` / `load_state()`) are stored; an existing checkpoint is
+        loaded into `engine` on start. Without one the listener keeps its
+        position in memory only.
+    start_tick: first tick to read when there is no checkpoint; by default
+        the listener starts at the current tick and skips history.
+    """
+
+    def __init__(
+        self,
+        client,
+        engine,
+        identities: Iterable[str],
+        checkpoint_path: Optional[str] = None,
+        start_tick: Optional[int] = None,
+        poll_interval: float = POLL_INTERVAL,
+        max_ticks_per_poll: int = MAX_TICKS_PER_POLL,
+        queue_size: int = QUEUE_SIZE,
+        fetch_concurrency: int = FETCH_CONCURRENCY,
+    ):
+        self.client = client
+        self.engine = engine
+        self.identities = list(dict.fromkeys(identities))
+        self.checkpoint = TickCheckpoint(checkpoint_path) if checkpoint_path else None
+        self.poll_interval = poll_interval
+        self.max_ticks_per_poll = max_ticks_per_poll
+        self.queue_size = queue_size
+        self.fetch_concurrency = fetch_concurrency
+
+        saved = self.checkpoint.load() if self.checkpoint else None
+        if saved is not None:
+            engine_state = self.checkpoint.load_engine()
+            if engine_state is not None:
+                engine.load_state(engine_state)
+        # Ticks up to and including `last_tick` have been fetched (queued);
+        # `ingested_tick` trails it until the consumer catches up.
+        self.last_tick: Optional[int] = saved if saved is not None else (
+            start_tick - 1 if start_tick is not None else None
+        )
+        self.ingested_tick = self.last_tick
+        self.events_ingested = 0
+        self.errors: Deque[str] = deque(maxlen=100)  # most recent fetch failures
+        self._consumer: Optional["asyncio.Task"] = None
+
+    async def _put(self, queue: "asyncio.Queue", item) -> None:
+        """queue.put that fails instead of blocking forever once the consumer has died.
+
+        Re-raises the consumer's exception (e.g. from `ingest_batch`).
+        """
+        consumer = self._consumer
+        if consumer is None:
+            await queue.put(item)
+            return
+        if not consumer.done():
+            put = asyncio.ensure_future(queue.put(item))
+            await asyncio.wait({put, consumer}, return_when=asyncio.FIRST_COMPLETED)
+            if put.done():
+                return
+            put.cancel()
+        consumer.result()
+        raise RuntimeError("listener consumer stopped unexpectedly")
+
+    async def _call(self, fn, *args):
+        return await asyncio.to_thread(fn, *args)
+
+    async def _fetch_range(self, start: int, end: int) -> Optional[List[Dict[str, Any]]]:
+        """Events for ticks start..end across all identities, or None if any fetch failed.
+
+        A range is committed all-or-nothing, so a retry never duplicates events.
+        """
+        sem = asyncio.Semaphore(self.fetch_concurrency)
+
+        async def fetch(identity: str) -> Tuple[str, Dict[str, Any]]:
+            async with sem:
+                return identity, await self._call(self.client.transfers, identity, start, end)
+
+        results = await asyncio.gather(*(fetch(i) for i in self.identities))
+        events = []
+        for identity, payload in results:
+            if isinstance(payload, dict) and "error" in payload:
+                self.errors.append(f"{identity} ticks {start}-{end}: {payload['error']}")
+                return None
+            for record in _iter_transactions(payload):
+                ev = transfer_to_event(identity, record)
+                if ev is not None:
+                    events.append(ev)
+        events.sort(key=lambda ev: ev["tick"])
+        return events
+
+    async def poll_once(self, queue: "asyncio.Queue") -> bool:
+        """Queue the next range of ticks; returns True if more ticks are already waiting."""
+        current = _current_tick(await self._call(self.client.tick))
+        if current is None:
+            return False
+        if self.last_tick is None:
+            # No checkpoint: start from "now" rather than replaying history.
+            self.last_tick = self.ingested_tick = current - 1
+
+        start = self.last_tick + 1
+        if start > current:
+            return False
+        end = min(current, start + self.max_ticks_per_poll - 1)
+
+        events = await self._fetch_range(start, end)
+        if events is None:
+            return False
+        await self._put(queue, (end, events))  # blocks while the consumer is behind
+        self.last_tick = end
+        return end < current
+
+    async def _consume(self, queue: "asyncio.Queue") -> None:
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                end, events = item
+                self.events_ingested += self.engine.ingest_batch(events)
+                self.ingested_tick = end
+                if self.checkpoint:
+                    self.checkpoint.save(end, self.engine.state())
+            finally:
+                queue.task_done()
+
+    async def run(self, stop: Optional[asyncio.Event] = None, max_polls: Optional[int] = None) -> None:
+        """Poll until `stop` is set (or `max_polls` polls); drains the queue before returning.
+
+        If ingesting a batch fails, polling stops and the error is raised here.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        consumer = self._consumer = asyncio.create_task(self._consume(queue))
+        polls = 0
+        try:
+            while not (stop and stop.is_set()) and (max_polls is None or polls < max_polls):
+                behind = await self.poll_once(queue)
+                polls += 1
+                if not behind:
+                    if stop is None:
+                        await asyncio.sleep(self.poll_interval)
+                    else:
+                        try:
+                            await asyncio.wait_for(stop.wait(), self.poll_interval)
+                        except asyncio.TimeoutError:
+                            pass
+            await self._put(queue, None)
+            await consumer
+        finally:
+            self._consumer = None
+            if not consumer.done():
+                consumer.cancel()
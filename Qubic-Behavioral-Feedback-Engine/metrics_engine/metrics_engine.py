@@ -1,8 +1,10 @@
 import random
 import math
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Set
 
 # Action weights reflect "strain" or intensity of different behaviors.
 ACTION_WEIGHTS = {
@@ -14,17 +16,53 @@ ACTION_WEIGHTS = {
     "withdraw": 2.0,
 }
 
+# Two users' decision scores within this distance count as "similar" for TES.
+TES_EPSILON = 0.25
+
+# CFS cohort: users whose past BMS is within CFS_DELTA of the target. A cohort
+# member improved/declined if its BMS moved by more than CFS_TOLERANCE.
+CFS_DELTA = 5.0
+CFS_TOLERANCE = 3.0
+# With real events, CFS "past" BMS is taken this many days before the last day.
+CFS_LAG_DAYS = 7
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
+
+def _day_index(ts) -> int:
+    """Convert a datetime or timestamp to an epoch day number (days since 1970-01-01).
+
+    Days are UTC days: naive datetimes are taken as UTC and aware ones are
+    converted first, matching `events._epoch_seconds`. The engine buckets by
+    these integers internally; ISO strings are only produced at the output
+    boundary via `_day_iso`.
+    """
+    if isinstance(ts, datetime):
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(timezone.utc)
+        return ts.toordinal() - _EPOCH_ORDINAL
+    if isinstance(ts, (int, float)):
+        return int(ts // _SECONDS_PER_DAY)
+    # Fallback: now
+    return datetime.utcnow().toordinal() - _EPOCH_ORDINAL
+
+
+@lru_cache(maxsize=4096)
+def _day_iso(day_index: int) -> str:
+    """Epoch day number -> YYYY-MM-DD."""
+    return date.fromordinal(day_index + _EPOCH_ORDINAL).isoformat()
+
+
+def _day_from_iso(label: str) -> int:
+    """YYYY-MM-DD -> epoch day number (inverse of `_day_iso`)."""
+    return date.fromisoformat(label).toordinal() - _EPOCH_ORDINAL
+
 
 def _day_key(ts) -> str:
     """Convert a datetime or timestamp to YYYY-MM-DD string."""
-    if isinstance(ts, (int, float)):
-        dt = datetime.utcfromtimestamp(ts)
-    elif isinstance(ts, datetime):
-        dt = ts
-    else:
-        # Fallback: now
-        dt = datetime.utcnow()
-    return dt.strftime("%Y-%m-%d")
+    return _day_iso(_day_index(ts))
 
 
 def _percentile_rank(value: float, population: List[float]) -> float:
@@ -130,25 +168,68 @@ def _build_demo_events(
     return user_events
 
 
-def _compute_daily_strain(user_events: Dict[str, List[Dict[str, Any]]]):
-    """Compute daily strain and decision intensity for each user and day."""
-    daily_strain: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-    daily_decision: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+def _amount_factor(amount: float) -> float:
+    # Mild boost for larger amounts so big trades feel "heavier"
+    return 1.0 + math.log1p(abs(amount)) / 5.0
+
+
+def _event_strain(ev: Dict[str, Any]) -> float:
+    """Strain contributed by a single event."""
+    action_type = ev.get("action_type", "other")
+    amount = float(ev.get("amount", 0.0))
+
+    base_weight = ACTION_WEIGHTS.get(action_type, 1.0)
+    return base_weight * _amount_factor(amount)
+
+
+def _compute_daily_strain_store(store, days_seen: Optional[Set[int]] = None):
+    """`_compute_daily_strain` over an `EventStore`'s columns."""
+    daily_strain: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+    daily_decision: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+
+    users = store.users.values
+    weights = store.action_weights()
+    for user in users:
+        daily_strain[user]  # users without events still belong to the crowd
+
+    for u, ts, a, amount in zip(store.user, store.timestamp, store.action, store.amount):
+        daily_strain[users[u]][ts // _SECONDS_PER_DAY] += weights[a] * _amount_factor(amount)
+
+    for user in users:
+        by_day = daily_strain[user]
+        for day, s in by_day.items():
+            daily_decision[user][day] = math.log1p(s)
+        if days_seen is not None:
+            days_seen.update(by_day)
+
+    return daily_strain, daily_decision
+
+
+def _compute_daily_strain(
+    user_events: Dict[str, List[Dict[str, Any]]], days_seen: Optional[Set[int]] = None
+):
+    """Compute daily strain and decision intensity for each user and day.
+
+    Days are keyed by epoch day number (see `_day_index`). If `days_seen` is
+    given it is filled with every observed day during the same pass.
+    user_events may also be an `EventStore` (see `metrics_engine.events`).
+    """
+    if not isinstance(user_events, dict):
+        return _compute_daily_strain_store(user_events, days_seen)
+
+    daily_strain: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+    daily_decision: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
 
     for user, events in user_events.items():
+        by_day = daily_strain[user]
         for ev in events:
-            day = _day_key(ev["timestamp"])
-            action_type = ev.get("action_type", "other")
-            amount = float(ev.get("amount", 0.0))
-
-            base_weight = ACTION_WEIGHTS.get(action_type, 1.0)
-            # Mild boost for larger amounts so big trades feel "heavier"
-            amount_factor = 1.0 + math.log1p(abs(amount)) / 5.0
-            daily_strain[user][day] += base_weight * amount_factor
+            by_day[_day_index(ev["timestamp"])] += _event_strain(ev)
 
         # Decision score: smoothed transform of strain
-        for day, s in daily_strain[user].items():
+        for day, s in by_day.items():
             daily_decision[user][day] = math.log1p(s)
+        if days_seen is not None:
+            days_seen.update(by_day)
 
     return daily_strain, daily_decision
 
@@ -165,7 +246,7 @@ def _compute_TES_BSS_for_day(
     if sum(all_strains) == 0:
         return {u: {"TES": 0.0, "BSS": 0.0} for u in users}
 
-    epsilon = 0.25
+    epsilon = TES_EPSILON
     scores = {}
 
     for u in users:
@@ -181,6 +262,73 @@ def _compute_TES_BSS_for_day(
     return scores
 
 
+def _window_bounds(sorted_values: List[float], center: float, radius: float):
+    """Slice [lo, hi) of an ascending list holding values with abs(v - center) <= radius.
+
+    The bisect bounds are nudged with the exact predicate so floating-point
+    rounding of center +/- radius cannot change the result.
+    """
+    n = len(sorted_values)
+    lo = bisect_left(sorted_values, center - radius)
+    while lo > 0 and abs(sorted_values[lo - 1] - center) <= radius:
+        lo -= 1
+    while lo < n and abs(sorted_values[lo] - center) > radius:
+        lo += 1
+    hi = bisect_right(sorted_values, center + radius)
+    while hi < n and abs(sorted_values[hi] - center) <= radius:
+        hi += 1
+    while hi > lo and abs(sorted_values[hi - 1] - center) > radius:
+        hi -= 1
+    return lo, hi
+
+
+def _window_count(sorted_values: List[float], center: float, radius: float) -> int:
+    """Count values with abs(v - center) <= radius in an ascending list."""
+    lo, hi = _window_bounds(sorted_values, center, radius)
+    return hi - lo
+
+
+def _score_day_vectors(decisions: Sequence[float], strains: Sequence[float]):
+    """Sort-based TES/BSS for one day's decision and strain vectors.
+
+    Returns (TES, BSS) lists aligned with the inputs, or None when nobody was
+    active that day (every score is then 0).
+    """
+    if sum(strains) == 0:
+        return None
+
+    n = len(strains)
+    sorted_decisions = sorted(decisions)
+    sorted_strains = sorted(strains)
+    TES = [(_window_count(sorted_decisions, d_u, TES_EPSILON) / n) * 100.0 for d_u in decisions]
+    BSS = [(bisect_right(sorted_strains, s_u) / n) * 100.0 for s_u in strains]
+    return TES, BSS
+
+
+def _compute_TES_BSS_for_day_sorted(
+    day: int,
+    daily_strain: Dict[str, Dict[int, float]],
+    daily_decision: Dict[str, Dict[int, float]],
+):
+    """Sort-based equivalent of `_compute_TES_BSS_for_day`.
+
+    The day's decision and strain vectors are sorted once; TES is then a
+    window count via two binary searches and BSS a rank via bisect, so the
+    whole crowd is scored in O(U log U) instead of O(U^2).
+    """
+    users = list(daily_strain.keys())
+    all_decisions = [daily_decision[u].get(day, 0.0) for u in users]
+    all_strains = [daily_strain[u].get(day, 0.0) for u in users]
+
+    scored = _score_day_vectors(all_decisions, all_strains)
+    if scored is None:
+        return {u: {"TES": 0.0, "BSS": 0.0} for u in users}
+
+    return {
+        u: {"TES": TES, "BSS": BSS} for u, TES, BSS in zip(users, scored[0], scored[1])
+    }
+
+
 def _compute_BMS(
     daily_scores_by_user: Dict[str, Dict[str, Dict[str, float]]],
     days_list: List[str],
@@ -232,7 +380,7 @@ def _compute_CFS(
         target_user = users[0]
 
     target_past = BMS_history[target_user]["past"]
-    delta = 5.0
+    delta = CFS_DELTA
 
     cohort = [
         u
@@ -252,7 +400,7 @@ def _compute_CFS(
     improved = 0
     stable = 0
     declined = 0
-    TOL = 3.0
+    TOL = CFS_TOLERANCE
 
     for u in cohort:
         diff = BMS_history[u]["future"] - BMS_history[u]["past"]
@@ -273,15 +421,85 @@ def _compute_CFS(
     }
 
 
+def _score_user_events(user_events, days: int, workers: int = 1):
+    """Pure-Python scoring: returns (days_list, daily_scores_by_user, BMS_scores).
+
+    user_events is `_build_demo_events` output or an `EventStore`.
+
+    workers > 1 shards the per-day TES/BSS scoring across a process pool.
+    """
+    days_seen: Set[int] = set()
+    daily_strain, daily_decision = _compute_daily_strain(user_events, days_seen)
+    return _score_daily_strain(daily_strain, daily_decision, days_seen, days, workers=workers)
+
+
+def _score_daily_strain(daily_strain, daily_decision, days_seen: Set[int], days: int, workers: int = 1):
+    """Score already-aggregated strain; same return value as `_score_user_events`."""
+    days_list, daily_scores_by_user = _score_days(
+        daily_strain, daily_decision, days_seen, days, workers=workers
+    )
+    BMS_scores = _compute_BMS(daily_scores_by_user, days_list)
+    return days_list, daily_scores_by_user, BMS_scores
+
+
+def _score_days(daily_strain, daily_decision, days_seen: Set[int], days: int, workers: int = 1):
+    """Daily TES/BSS for the last `days` observed days: (days_list, daily_scores_by_user)."""
+    # Keep the most recent `days` observed days
+    all_days = sorted(days_seen)
+    if len(all_days) > days:
+        day_indexes = all_days[-days:]
+    else:
+        day_indexes = all_days
+    days_list = [_day_iso(day) for day in day_indexes]
+
+    if workers > 1:
+        from .parallel import score_days_parallel
+
+        daily_scores_by_user = score_days_parallel(
+            day_indexes, daily_strain, daily_decision, workers=workers, labels=days_list
+        )
+    else:
+        daily_scores_by_user = defaultdict(dict)
+        for day, label in zip(day_indexes, days_list):
+            scores = _compute_TES_BSS_for_day_sorted(day, daily_strain, daily_decision)
+            for user, s in scores.items():
+                daily_scores_by_user[user][label] = s
+
+    return days_list, daily_scores_by_user
+
+
 def compute_metrics(
     user_actions: Optional[List[Dict[str, Any]]] = None,
     num_other_users: int = 25,
     days: int = 14,
     seed: Optional[int] = None,
+    backend: str = "python",
+    workers: int = 1,
+    generator: str = "python",
+    events=None,
+    target_user: str = "you",
+    cfs_lag: int = CFS_LAG_DAYS,
+    snapshot_dir: Optional[str] = None,
 ):
     """High-level entry point used by the Streamlit app.
 
     user_actions: list of actions for the logged-in user in the current demo session.
+    backend: "python" (default) or "numpy" for the columnar implementation in
+        `metrics_engine.columnar`, which is much faster for large crowds.
+    workers: with the Python backend, values > 1 score days in parallel
+        across that many processes (see `metrics_engine.parallel`). The
+        NumPy backend is single-process; combining it with workers > 1
+        raises ValueError.
+    generator: "python" (default) builds the synthetic crowd with
+        `_build_demo_events`; "numpy" uses the vectorized generator in
+        `metrics_engine.synthetic` (same distribution, different draws).
+    events: real-data mode. The whole crowd's events - a user -> events dict,
+        an `EventStore`, a JSONL/CSV export path or an iterable of event
+        dicts - are scored as given: no synthetic users, no random noise.
+        CFS then compares each user's BMS with its BMS `cfs_lag` days
+        earlier, recomputed from the events or read from `snapshot_dir`
+        (see `metrics_engine.realdata`). num_other_users, seed and
+        generator are ignored.
     Returns a dict with:
         - target_user
         - days
@@ -292,32 +510,42 @@ def compute_metrics(
     if user_actions is None:
         user_actions = []
 
-    user_events = _build_demo_events(
-        user_actions, num_other_users=num_other_users, days=days, seed=seed
-    )
-    daily_strain, daily_decision = _compute_daily_strain(user_events)
-
-    # Collect all observed days and keep the most recent `days` of them
-    all_days = sorted(
-        {
-            _day_key(ev["timestamp"])
-            for events in user_events.values()
-            for ev in events
-        }
-    )
-    if len(all_days) > days:
-        days_list = all_days[-days:]
-    else:
-        days_list = all_days
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown metrics backend: {backend!r}")
+    if generator not in ("python", "numpy"):
+        raise ValueError(f"Unknown crowd generator: {generator!r}")
+    if backend == "numpy" and workers > 1:
+        raise ValueError("workers > 1 is only supported by the python backend")
+
+    if events is not None:
+        if user_actions:
+            raise ValueError("Pass the current user's actions inside events in real-data mode")
+        from .realdata import compute_observed_metrics
+
+        return compute_observed_metrics(
+            events, days=days, target_user=target_user, backend=backend, workers=workers,
+            cfs_lag=cfs_lag, snapshot_dir=snapshot_dir,
+        )
 
-    daily_scores_by_user: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+    if generator == "numpy":
+        from .synthetic import build_demo_store
+
+        user_events = build_demo_store(
+            user_actions, num_other_users=num_other_users, days=days, seed=seed
+        )
+    else:
+        user_events = _build_demo_events(
+            user_actions, num_other_users=num_other_users, days=days, seed=seed
+        )
 
-    for day in days_list:
-        scores = _compute_TES_BSS_for_day(day, daily_strain, daily_decision)
-        for user, s in scores.items():
-            daily_scores_by_user[user][day] = s
+    if backend == "numpy":
+        from .columnar import score_user_events
 
-    BMS_scores = _compute_BMS(daily_scores_by_user, days_list)
+        days_list, daily_scores_by_user, BMS_scores = score_user_events(user_events, days=days)
+    else:
+        days_list, daily_scores_by_user, BMS_scores = _score_user_events(
+            user_events, days, workers=workers
+        )
 
     # Create simple past/future BMS history with random noise
     rng = random.Random(seed)
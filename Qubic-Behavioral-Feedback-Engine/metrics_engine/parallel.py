@@ -0,0 +1,106 @@
+"""Multi-process, day-sharded TES/BSS scoring.
+
+Each day is scored independently, so the window's days are split into one
+shard per worker. Workers receive the strain/decision dicts once, when the
+pool starts (inherited without copying where the platform forks), and build
+their days' compact `array("d")` vectors themselves in a single pass over
+the users' cells. Only the per-day TES/BSS arrays travel back; the parent
+merges them into `daily_scores_by_user`.
+"""
+import multiprocessing
+import os
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .metrics_engine import _score_day_vectors
+
+# Set in each worker by `_init_worker`: (daily_strain, daily_decision).
+_crowd = None
+
+
+def _init_worker(daily_strain, daily_decision) -> None:
+    global _crowd
+    _crowd = (daily_strain, daily_decision)
+
+
+def _day_vectors(days: List[int], daily_strain, daily_decision) -> Dict[int, Tuple[array, array]]:
+    """day -> (decisions, strains) in `daily_strain` user order, for `days` only."""
+    n = len(daily_strain)
+    vectors = {day: (array("d", bytes(8 * n)), array("d", bytes(8 * n))) for day in days}
+    for i, (user, strain_by_day) in enumerate(daily_strain.items()):
+        decision_by_day = daily_decision[user]
+        for day, strain in strain_by_day.items():
+            pair = vectors.get(day)
+            if pair is not None:
+                pair[0][i] = decision_by_day.get(day, 0.0)
+                pair[1][i] = strain
+    return vectors
+
+
+def _score_day_shard(days: List[int]) -> List[Tuple[int, Optional[array], Optional[array]]]:
+    """Worker entry point: days -> [(day, TES, BSS)], None scores for an idle day."""
+    daily_strain, daily_decision = _crowd
+    out = []
+    for day, (decisions, strains) in _day_vectors(days, daily_strain, daily_decision).items():
+        scored = _score_day_vectors(decisions, strains)
+        if scored is None:
+            out.append((day, None, None))
+        else:
+            out.append((day, array("d", scored[0]), array("d", scored[1])))
+    return out
+
+
+def default_workers() -> int:
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _mp_context():
+    # Forked workers inherit the crowd instead of unpickling a copy each.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def score_days_parallel(
+    days_list: List[int],
+    daily_strain: Dict[str, Dict[int, float]],
+    daily_decision: Dict[str, Dict[int, float]],
+    workers: Optional[int] = None,
+    labels: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Score `days_list` across a process pool; returns user -> day -> scores.
+
+    workers: pool size (default: one per usable CPU), capped at the number of
+    days. labels: output key for each entry of `days_list` (defaults to the
+    day keys themselves). The result matches scoring each day with
+    `_compute_TES_BSS_for_day_sorted`.
+    """
+    workers = max(1, min(workers or default_workers(), len(days_list)))
+    users = list(daily_strain.keys())
+    label_of = dict(zip(days_list, labels if labels is not None else days_list))
+    daily_scores_by_user: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+    rows = [daily_scores_by_user[u] for u in users]
+    shards = [days_list[i::workers] for i in range(workers)]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_mp_context(),
+        initializer=_init_worker,
+        initargs=(daily_strain, daily_decision),
+    ) as pool:
+        for results in pool.map(_score_day_shard, shards):
+            for day, TES, BSS in results:
+                day = label_of[day]
+                if TES is None:
+                    for row in rows:
+                        row[day] = {"TES": 0.0, "BSS": 0.0}
+                    continue
+                for row, t, b in zip(rows, TES, BSS):
+                    row[day] = {"TES": t, "BSS": b}
+
+    return daily_scores_by_user
@@ -0,0 +1,160 @@
+"""Real-data mode for `compute_metrics`: score an observed crowd, no synthetic users.
+
+The caller supplies every user's events, so nothing is generated and nothing
+is random - the same events always give the same result. CFS compares each
+user's BMS% now ("future") with its BMS% `cfs_lag` days earlier ("past").
+Past values come from rolling the observed scores forward (the last
+days + cfs_lag observed days are scored), or, with `snapshot_dir`, from the
+per-day snapshots written by `metrics_engine.snapshot.write_snapshot`.
+"""
+import os
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .events import EventStore
+from .ingest import StrainAccumulator, iter_chunks, iter_events
+from .metrics_engine import (
+    CFS_LAG_DAYS,
+    _compute_BMS,
+    _compute_CFS,
+    _compute_daily_strain,
+    _day_from_iso,
+    _day_iso,
+    _score_days,
+)
+from .rolling import RollingBMS
+
+
+def _event_source(events, backend: str):
+    """Normalize `events` to something the chosen backend can score.
+
+    Accepts a user -> events dict, an `EventStore`, a path to a JSONL/CSV
+    export, or any iterable of event dicts. Streams are never materialized as
+    dicts: the Python backend folds them into a `StrainAccumulator`, the
+    NumPy backend packs them into an `EventStore`.
+    """
+    if isinstance(events, (dict, EventStore)):
+        return events
+    stream: Iterable[Dict[str, Any]]
+    if isinstance(events, (str, os.PathLike)):
+        stream = iter_events(events)
+    else:
+        stream = events
+
+    if backend == "numpy":
+        store = EventStore()
+        store.extend(stream)
+        return store
+    acc = StrainAccumulator()
+    for chunk in iter_chunks(stream):
+        acc.add(chunk)
+    return acc
+
+
+def _score_source(source, days: int, backend: str, workers: int):
+    """(days_list, daily_scores_by_user) for the last `days` observed days."""
+    if isinstance(source, StrainAccumulator):
+        daily_strain, daily_decision = source.result()
+        return _score_days(daily_strain, daily_decision, source.days_seen, days, workers=workers)
+
+    if backend == "numpy":
+        from .columnar import score_user_events
+
+        days_list, daily_scores_by_user, _ = score_user_events(source, days=days)
+        return days_list, daily_scores_by_user
+
+    days_seen: Set[int] = set()
+    daily_strain, daily_decision = _compute_daily_strain(source, days_seen)
+    return _score_days(daily_strain, daily_decision, days_seen, days, workers=workers)
+
+
+def past_BMS_from_scores(
+    daily_scores_by_user: Dict[str, Dict[str, Dict[str, float]]],
+    days_list: List[str],
+    window: int,
+    as_of: str,
+) -> Dict[str, float]:
+    """BMS% per user over the `window` scored days ending on or before `as_of`."""
+    past_days = [day for day in days_list if day <= as_of]
+    if not past_days:
+        return {}
+
+    rolling = RollingBMS(window=window)
+    for day in past_days[-window:]:
+        rolling.advance(
+            day,
+            {user: by_day[day] for user, by_day in daily_scores_by_user.items() if day in by_day},
+        )
+    return {user: info["BMS%"] for user, info in rolling.all_bms().items()}
+
+
+def past_BMS_from_snapshots(directory: str, as_of: str, users: Iterable[str]) -> Dict[str, float]:
+    """BMS% per user from the newest snapshot on or before `as_of`."""
+    from .snapshot import SnapshotReader
+
+    with SnapshotReader(directory) as reader:
+        candidates = [day for day in reader.days() if day <= as_of]
+        if not candidates:
+            return {}
+        snap = reader.day(candidates[-1])
+        past = {}
+        for user in users:
+            row = snap.row(user)
+            if row is not None:
+                past[user] = row["BMS"]
+    return past
+
+
+def compute_observed_metrics(
+    events,
+    days: int = 14,
+    target_user: str = "you",
+    backend: str = "python",
+    workers: int = 1,
+    cfs_lag: int = CFS_LAG_DAYS,
+    snapshot_dir: Optional[str] = None,
+):
+    """`compute_metrics` over real events; returns the same dict shape.
+
+    Users missing from the past BMS (with `snapshot_dir`: absent from the
+    snapshot) are left out of the CFS cohort.
+    """
+    if cfs_lag < 1:
+        raise ValueError("cfs_lag must be at least 1 day")
+    if backend == "numpy" and workers > 1:
+        raise ValueError("workers > 1 is only supported by the python backend")
+
+    source = _event_source(events, backend)
+    history_days = 0 if snapshot_dir else cfs_lag
+    all_days, all_scores = _score_source(source, days + history_days, backend, workers)
+
+    days_list = all_days[-days:]
+    if len(days_list) < len(all_days):
+        daily_scores_by_user = {
+            user: {day: by_day[day] for day in days_list if day in by_day}
+            for user, by_day in all_scores.items()
+        }
+    else:
+        daily_scores_by_user = all_scores
+    BMS_scores = _compute_BMS(daily_scores_by_user, days_list)
+
+    past: Dict[str, float] = {}
+    if days_list:
+        as_of = _day_iso(_day_from_iso(days_list[-1]) - cfs_lag)
+        if snapshot_dir:
+            past = past_BMS_from_snapshots(snapshot_dir, as_of, BMS_scores)
+        else:
+            past = past_BMS_from_scores(all_scores, all_days, days, as_of)
+
+    BMS_history = {
+        user: {"past": past[user], "future": info["BMS%"]}
+        for user, info in BMS_scores.items()
+        if user in past
+    }
+
+    return {
+        "target_user": target_user,
+        "days": days_list,
+        "daily_scores": daily_scores_by_user,
+        "BMS": BMS_scores,
+        "CFS": _compute_CFS(BMS_history, target_user=target_user),
+    }
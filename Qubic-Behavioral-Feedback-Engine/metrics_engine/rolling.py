@@ -0,0 +1,152 @@
+"""Sliding-window BMS with constant-time day roll-over.
+
+`_compute_BMS` rebuilds each user's TES/BSS series and re-averages both halves
+on every call. `RollingBMSWindow` keeps the "past" and "recent" halves of one
+user's window as deques with running sums and nonzero counts, so advancing a
+day appends one element, moves at most one across the midpoint and drops one
+off the end. `RollingBMS` holds a window per user and advances them together.
+"""
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+
+class _Half:
+    """One half of a window: entries plus running TES/BSS sums and counts."""
+
+    __slots__ = ("entries", "tes_sum", "tes_nonzero", "bss_sum", "bss_nonzero")
+
+    def __init__(self):
+        self.entries: Deque[Tuple[float, float]] = deque()
+        self.tes_sum = 0.0
+        self.tes_nonzero = 0
+        self.bss_sum = 0.0
+        self.bss_nonzero = 0
+
+    def _account(self, entry: Tuple[float, float], sign: int) -> None:
+        tes, bss = entry
+        if tes > 0:
+            self.tes_sum += sign * tes
+            self.tes_nonzero += sign
+        if bss > 0:
+            self.bss_sum += sign * bss
+            self.bss_nonzero += sign
+
+    def push_back(self, entry: Tuple[float, float]) -> None:
+        self.entries.append(entry)
+        self._account(entry, 1)
+
+    def push_front(self, entry: Tuple[float, float]) -> None:
+        self.entries.appendleft(entry)
+        self._account(entry, 1)
+
+    def pop_back(self) -> Tuple[float, float]:
+        entry = self.entries.pop()
+        self._account(entry, -1)
+        return entry
+
+    def pop_front(self) -> Tuple[float, float]:
+        entry = self.entries.popleft()
+        self._account(entry, -1)
+        return entry
+
+    def avg(self) -> float:
+        """(avg nonzero TES + avg nonzero BSS) / 2, as in `_compute_BMS`."""
+        tes = self.tes_sum / self.tes_nonzero if self.tes_nonzero else 0.0
+        bss = self.bss_sum / self.bss_nonzero if self.bss_nonzero else 0.0
+        return (tes + bss) / 2.0
+
+
+class RollingBMSWindow:
+    """One user's last `window` daily (TES, BSS) scores with O(1) updates."""
+
+    __slots__ = ("window", "_past", "_recent")
+
+    def __init__(self, window: int = 14):
+        if window < 1:
+            raise ValueError("window must be at least 1 day")
+        self.window = window
+        self._past = _Half()
+        self._recent = _Half()
+
+    def __len__(self) -> int:
+        return len(self._past.entries) + len(self._recent.entries)
+
+    def push(self, tes: float, bss: float) -> None:
+        """Append the newest day, dropping the oldest once the window is full."""
+        self._recent.push_back((tes, bss))
+        if len(self) > self.window:
+            if self._past.entries:
+                self._past.pop_front()
+            else:
+                self._recent.pop_front()
+        self._rebalance()
+
+    def _rebalance(self) -> None:
+        # Same split as `_compute_BMS`: the first max(1, n // 2) days are "past".
+        n = len(self)
+        mid = max(1, n // 2) if n else 0
+        while len(self._past.entries) < mid:
+            self._past.push_back(self._recent.pop_front())
+        while len(self._past.entries) > mid:
+            self._recent.push_front(self._past.pop_back())
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current Consistency%, Trend% and BMS% for this window."""
+        n = len(self)
+        if n:
+            # BSS is a percentile rank, so any BSS > 0 marks an active day.
+            active_days = self._past.bss_nonzero + self._recent.bss_nonzero
+            consistency = (active_days / n) * 100.0
+            raw_trend = self._recent.avg() - self._past.avg()
+        else:
+            consistency = 0.0
+            raw_trend = 0.0
+
+        trend = max(0.0, min(100.0, 50.0 + raw_trend))
+        return {
+            "Consistency%": consistency,
+            "Trend%": trend,
+            "BMS%": 0.5 * consistency + 0.5 * trend,
+        }
+
+
+class RollingBMS:
+    """Per-user rolling BMS windows advanced one day at a time.
+
+    Feed it each day's TES/BSS scores (e.g. `MetricsEngine.scores_for_day`)
+    in chronological order; users missing from a day get (0, 0), the same
+    default `_compute_BMS` uses.
+    """
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.days: Deque[str] = deque(maxlen=window)
+        self._windows: Dict[str, RollingBMSWindow] = {}
+
+    def advance(self, day: str, scores: Dict[str, Dict[str, float]]) -> None:
+        """Roll every user's window forward by one day."""
+        for user in scores:
+            if user not in self._windows:
+                # Back-fill the days this user was not yet tracked as zeros.
+                win = RollingBMSWindow(self.window)
+                for _ in range(len(self.days)):
+                    win.push(0.0, 0.0)
+                self._windows[user] = win
+
+        empty = {"TES": 0.0, "BSS": 0.0}
+        for user, win in self._windows.items():
+            entry = scores.get(user, empty)
+            win.push(entry["TES"], entry["BSS"])
+        self.days.append(day)
+
+    def advance_many(self, days: Iterable[str], scores_by_day: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+        for day in days:
+            self.advance(day, scores_by_day.get(day, {}))
+
+    def bms(self, user: str) -> Optional[Dict[str, float]]:
+        win = self._windows.get(user)
+        return win.snapshot() if win is not None else None
+
+    def all_bms(self) -> Dict[str, Dict[str, float]]:
+        """BMS for every tracked user, in the `_compute_BMS` output shape."""
+        return {user: win.snapshot() for user, win in self._windows.items()}
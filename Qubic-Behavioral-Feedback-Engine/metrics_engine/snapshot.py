@@ -0,0 +1,208 @@
+"""Persistent per-day metrics snapshots with memory-mapped reads.
+
+Each scored day is written to `<directory>/<YYYY-MM-DD>.qbfs`, a small binary
+file laid out as:
+
+    header   magic b"QBFS", version, column count, user count, id blob size
+    index    (n_users + 1) uint64 offsets into the id blob
+    ids      UTF-8 user IDs, sorted, concatenated
+    columns  one float64 array per column (strain, TES, BSS, BMS), n_users long
+
+`write_snapshot` only ever writes the newest day of a result - the one day
+whose BMS covers a full window - so a history of day files is built by
+snapshotting once per day, and older files are never rewritten.
+
+`SnapshotReader` memory-maps these files and binary-searches the sorted id
+index, so looking up one user's history touches a few pages per day instead
+of loading or recomputing anything.
+"""
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .metrics_engine import _day_from_iso
+
+MAGIC = b"QBFS"
+VERSION = 1
+COLUMNS = ("strain", "TES", "BSS", "BMS")
+SUFFIX = ".qbfs"
+
+_HEADER = struct.Struct("<4sHHIQ")
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_day_snapshot(
+    directory: str, day: str, rows: Dict[str, Sequence[float]]
+) -> str:
+    """Write one day's file; rows maps user -> (strain, TES, BSS, BMS).
+
+    The file is written to a temporary name and renamed into place, so
+    readers never see a half-written snapshot. Returns the file path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    users = sorted(rows)
+    encoded = [u.encode("utf-8") for u in users]
+
+    offsets = [0]
+    for raw in encoded:
+        offsets.append(offsets[-1] + len(raw))
+    blob = b"".join(encoded)
+
+    n = len(users)
+    header = _HEADER.pack(MAGIC, VERSION, len(COLUMNS), n, len(blob))
+    index = struct.pack(f"<{n + 1}Q", *offsets)
+    ids_end = _HEADER.size + len(index) + len(blob)
+    padding = b"\0" * (_aligned(ids_end) - ids_end)
+
+    path = os.path.join(directory, day + SUFFIX)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(header)
+        fh.write(index)
+        fh.write(blob)
+        fh.write(padding)
+        for c in range(len(COLUMNS)):
+            fh.write(struct.pack(f"<{n}d", *(float(rows[u][c]) for u in users)))
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_snapshot(
+    directory: str,
+    metrics: Dict,
+    daily_strain: Dict[str, Dict[int, float]],
+) -> List[str]:
+    """Persist the newest day of a `compute_metrics`-shaped result.
+
+    daily_strain: strain keyed by epoch day, as built by `_compute_daily_strain`.
+    Only the last day is written, with `metrics["BMS"]` as its BMS column:
+    earlier days of the result would only see a window cut off at its first
+    day, so their files - written when each was the newest - are left as
+    they are. Returns the written path (none for an empty result).
+    """
+    if not metrics["days"]:
+        return []
+    day = metrics["days"][-1]
+    day_index = _day_from_iso(day)
+    empty = {"TES": 0.0, "BSS": 0.0}
+    rows = {}
+    for user, by_day in metrics["daily_scores"].items():
+        s = by_day.get(day, empty)
+        strain = daily_strain.get(user, {}).get(day_index, 0.0)
+        rows[user] = (strain, s["TES"], s["BSS"], metrics["BMS"][user]["BMS%"])
+    return [write_day_snapshot(directory, day, rows)]
+
+
+class DaySnapshot:
+    """Read-only, memory-mapped view of one day's snapshot file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Truncated metrics snapshot ({size} bytes): {path}")
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, n_cols, n_users, blob_size = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION or n_cols != len(COLUMNS):
+                raise ValueError(f"Not a version {VERSION} metrics snapshot: {path}")
+
+            self.n_users = n_users
+            self._index_offset = _HEADER.size
+            self._blob_offset = self._index_offset + 8 * (n_users + 1)
+            self._columns_offset = _aligned(self._blob_offset + blob_size)
+            if size < self._columns_offset + 8 * n_users * n_cols:
+                raise ValueError(f"Truncated metrics snapshot ({size} bytes): {path}")
+        except BaseException:
+            self._mm.close()
+            raise
+
+    def __len__(self) -> int:
+        return self.n_users
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _user_at(self, i: int) -> str:
+        start, end = struct.unpack_from("<2Q", self._mm, self._index_offset + 8 * i)
+        return self._mm[self._blob_offset + start: self._blob_offset + end].decode("utf-8")
+
+    def _find(self, user: str) -> Optional[int]:
+        lo, hi = 0, self.n_users
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._user_at(mid) < user:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_users and self._user_at(lo) == user:
+            return lo
+        return None
+
+    def row(self, user: str) -> Optional[Dict[str, float]]:
+        """{"strain", "TES", "BSS", "BMS"} for `user`, or None if absent."""
+        i = self._find(user)
+        if i is None:
+            return None
+        return {
+            name: struct.unpack_from(
+                "<d", self._mm, self._columns_offset + 8 * (c * self.n_users + i)
+            )[0]
+            for c, name in enumerate(COLUMNS)
+        }
+
+    def users(self) -> Iterator[str]:
+        for i in range(self.n_users):
+            yield self._user_at(i)
+
+
+class SnapshotReader:
+    """Look up users across a directory of day snapshots.
+
+    Day files are opened (memory-mapped) lazily on first access and kept open
+    until `close()`.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._open: Dict[str, DaySnapshot] = {}
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def days(self) -> List[str]:
+        """Available days, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            name[: -len(SUFFIX)] for name in os.listdir(self.directory) if name.endswith(SUFFIX)
+        )
+
+    def day(self, day: str) -> DaySnapshot:
+        snap = self._open.get(day)
+        if snap is None:
+            snap = self._open[day] = DaySnapshot(os.path.join(self.directory, day + SUFFIX))
+        return snap
+
+    def lookup(self, day: str, user: str) -> Optional[Dict[str, float]]:
+        if day not in self._open and not os.path.exists(os.path.join(self.directory, day + SUFFIX)):
+            return None
+        return self.day(day).row(user)
+
+    def user_history(self, user: str, days: int = 14) -> List[Tuple[str, Optional[Dict[str, float]]]]:
+        """(day, row) for the most recent `days` snapshots; row is None if the user is absent."""
+        return [(day, self.day(day).row(user)) for day in self.days()[-days:]]
+
+    def close(self) -> None:
+        for snap in self._open.values():
+            snap.close()
+        self._open.clear()
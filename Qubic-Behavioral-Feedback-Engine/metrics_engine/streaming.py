@@ -0,0 +1,178 @@
+"""Incremental metrics engine for continuously arriving events.
+
+`compute_metrics` rebuilds everything from scratch on each call. `MetricsEngine`
+keeps daily strain/decision state between calls instead: each ingested event
+only touches its own (user, day) cell and marks that day dirty, and day scores
+are recomputed lazily the next time they are read.
+"""
+import math
+from bisect import insort
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .metrics_engine import (
+    _compute_BMS,
+    _compute_TES_BSS_for_day_sorted,
+    _day_from_iso,
+    _day_index,
+    _day_iso,
+    _event_strain,
+)
+from .snapshot import write_snapshot
+
+
+class MetricsEngine:
+    """Stateful TES/BSS/BMS scorer fed one event at a time.
+
+    Events are dicts with user_id, timestamp, action_type and amount, the same
+    shape `_build_demo_events` produces. Scores cover the most recent `days`
+    observed days, as in `compute_metrics`. Internally days are epoch day
+    numbers (`daily_strain` and `daily_decision` are keyed by them); the read
+    methods take and return YYYY-MM-DD labels.
+    """
+
+    def __init__(self, days: int = 14, target_user: str = "you"):
+        self.days = days
+        self.target_user = target_user
+        self.daily_strain: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        self.daily_decision: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self.events_ingested = 0
+
+        self._all_days: List[int] = []
+        self._day_set: Set[int] = set()
+        self._day_scores: Dict[int, Dict[str, Dict[str, float]]] = {}
+        # Crowd size each cached day was scored against; a new user changes
+        # every day's population, so a mismatch means the day is stale.
+        self._scored_population: Dict[int, int] = {}
+        self._dirty: Set[int] = set()
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def ingest(self, event: Dict[str, Any]) -> None:
+        """Fold one event into its (user, day) cell and mark the day dirty."""
+        user = str(event["user_id"])
+        ev = {
+            "action_type": str(event.get("action_type", "other")).lower(),
+            "amount": float(event.get("amount", 0.0)),
+        }
+        day = _day_index(event.get("timestamp"))
+
+        if day not in self._day_set:
+            self._day_set.add(day)
+            insort(self._all_days, day)
+
+        strain = self.daily_strain[user]
+        strain[day] += _event_strain(ev)
+        self.daily_decision[user][day] = math.log1p(strain[day])
+        self._dirty.add(day)
+        self.events_ingested += 1
+
+    def ingest_batch(self, events: Iterable[Dict[str, Any]]) -> int:
+        """Ingest many events; returns how many were processed."""
+        count = 0
+        for event in events:
+            self.ingest(event)
+            count += 1
+        return count
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-serializable copy of everything ingested so far (see `load_state`).
+
+        Only strain is stored: decisions are derived from it and day scores
+        are recomputed on the next read.
+        """
+        return {
+            "events_ingested": self.events_ingested,
+            "strain": {
+                user: [[day, strain] for day, strain in by_day.items()]
+                for user, by_day in self.daily_strain.items()
+            },
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace the engine's contents with a `state()` snapshot."""
+        self.daily_strain.clear()
+        self.daily_decision.clear()
+        self._day_scores.clear()
+        self._scored_population.clear()
+        self._day_set.clear()
+        for user, cells in state["strain"].items():
+            for day, strain in cells:
+                day = int(day)
+                self.daily_strain[user][day] = strain
+                self.daily_decision[user][day] = math.log1p(strain)
+                self._day_set.add(day)
+        self._all_days = sorted(self._day_set)
+        self._dirty = set(self._day_set)
+        self.events_ingested = int(state["events_ingested"])
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @property
+    def users(self) -> List[str]:
+        return list(self.daily_strain.keys())
+
+    def _window(self) -> List[int]:
+        if len(self._all_days) > self.days:
+            return self._all_days[-self.days:]
+        return list(self._all_days)
+
+    def days_list(self) -> List[str]:
+        """The most recent `days` observed days, oldest first."""
+        return [_day_iso(day) for day in self._window()]
+
+    def scores_for_day(self, day: str) -> Dict[str, Dict[str, float]]:
+        """TES/BSS for every user on `day` (YYYY-MM-DD), rescoring only if stale."""
+        return self._scores_for_index(_day_from_iso(day))
+
+    def _scores_for_index(self, day: int) -> Dict[str, Dict[str, float]]:
+        population = len(self.daily_strain)
+        if day in self._dirty or self._scored_population.get(day) != population:
+            self._day_scores[day] = _compute_TES_BSS_for_day_sorted(
+                day, self.daily_strain, self.daily_decision
+            )
+            self._scored_population[day] = population
+            self._dirty.discard(day)
+        return self._day_scores[day]
+
+    def user_scores(self, user: str) -> Dict[str, Dict[str, float]]:
+        """{day: {"TES", "BSS"}} for one user across the current window."""
+        empty = {"TES": 0.0, "BSS": 0.0}
+        return {
+            _day_iso(day): self._scores_for_index(day).get(user, empty)
+            for day in self._window()
+        }
+
+    def bms(self, user: Optional[str] = None) -> Dict[str, float]:
+        """BMS for one user (default: the target user) over the current window."""
+        user = self.target_user if user is None else user
+        days_list = self.days_list()
+        return _compute_BMS({user: self.user_scores(user)}, days_list)[user]
+
+    def daily_scores(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """user -> day -> {"TES", "BSS"} for every user, like `compute_metrics`."""
+        by_user: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+        for day in self._window():
+            label = _day_iso(day)
+            for user, s in self._scores_for_index(day).items():
+                by_user[user][label] = s
+        return by_user
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current results in the `compute_metrics` shape (without CFS)."""
+        daily_scores_by_user = self.daily_scores()
+        days_list = self.days_list()
+        return {
+            "target_user": self.target_user,
+            "days": days_list,
+            "daily_scores": daily_scores_by_user,
+            "BMS": _compute_BMS(daily_scores_by_user, days_list),
+        }
+
+    def write_snapshot(self, directory: str) -> List[str]:
+        """Persist the newest day of the current window (see `metrics_engine.snapshot`)."""
+        return write_snapshot(directory, self.metrics(), self.daily_strain)
@@ -0,0 +1,169 @@
+"""Vectorized synthetic crowd generator for demos and load tests.
+
+Produces the same distributional shape as `_build_demo_events` - per
+user-day action counts uniform on 0..6 (0..4 for the current user's
+history), a uniform time of day, a uniform action type and a uniform amount
+(5..200, or 5..150 for the current user) - but draws whole blocks of users at
+once from a NumPy `Generator` instead of calling `random` per event.
+
+The crowd is drawn in fixed blocks of STREAM_BLOCK_USERS users, each from
+its own Philox generator keyed by (seed, block index) via `SeedSequence`,
+so a user's events do not depend on how the caller chunks the crowd.
+
+`iter_crowd_chunks` streams the crowd in fixed-size blocks of users so
+memory stays bounded; `build_demo_store` materializes the demo crowd as an
+`EventStore` that every scoring path accepts. Output is reproducible for a
+given (seed, now), whatever chunk_users is.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .events import EventStore
+from .metrics_engine import ACTION_WEIGHTS, _SECONDS_PER_DAY, _day_index
+
+_N_ACTIONS = len(ACTION_WEIGHTS)
+# Users per independent random stream; fixed so chunking cannot change draws.
+STREAM_BLOCK_USERS = 4096
+# SeedSequence spawn keys: (crowd, block index) and the current user's history.
+_CROWD_STREAM = 0
+_YOU_STREAM = 1
+
+
+def _rng(seed: int, *spawn_key: int) -> np.random.Generator:
+    """Philox generator for one stream of `seed`."""
+    return np.random.Generator(np.random.Philox(np.random.SeedSequence(seed, spawn_key=spawn_key)))
+
+
+def _draw_block(
+    rng: np.random.Generator,
+    n_users: int,
+    day_offsets: np.ndarray,
+    max_actions: int,
+    max_amount: float,
+    today: int,
+) -> Dict[str, np.ndarray]:
+    """Events for n_users x len(day_offsets) user-days.
+
+    Returns arrays keyed user (0-based within the block, ascending),
+    timestamp, action and amount.
+    """
+    counts = rng.integers(0, max_actions + 1, size=(n_users, len(day_offsets)))
+    per_cell = counts.ravel()
+    n_events = int(per_cell.sum())
+
+    cell = np.repeat(np.arange(per_cell.size), per_cell)
+    user = cell // len(day_offsets)
+    day = today - day_offsets[cell % len(day_offsets)]
+    timestamp = day * _SECONDS_PER_DAY + rng.integers(0, _SECONDS_PER_DAY, size=n_events)
+    return {
+        "user": user,
+        "timestamp": timestamp,
+        "action": rng.integers(0, _N_ACTIONS, size=n_events),
+        "amount": rng.uniform(5, max_amount, size=n_events),
+    }
+
+
+def iter_crowd_chunks(
+    num_users: int,
+    days: int = 14,
+    seed: Optional[int] = None,
+    chunk_users: int = 100_000,
+    now: Optional[datetime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the synthetic crowd `chunk_users` users at a time.
+
+    Each chunk is a dict with `first_user` (index of its first user, so user
+    k is named f"user_{k + 1}") and NumPy arrays `user` (global user index),
+    `timestamp` (epoch seconds), `action` (ACTION_WEIGHTS order code) and
+    `amount`. Each user's events depend only on (seed, k, now), not on
+    chunk_users.
+    """
+    seed = int(np.random.SeedSequence(seed).entropy)
+    today = _day_index(now or datetime.utcnow())
+    day_offsets = np.arange(days)
+    cached: Dict[int, Dict[str, np.ndarray]] = {}
+
+    def block(b: int) -> Dict[str, np.ndarray]:
+        # Consecutive chunks share at most one stream block; keep the last one.
+        if b not in cached:
+            cached.clear()
+            first = b * STREAM_BLOCK_USERS
+            n = min(STREAM_BLOCK_USERS, num_users - first)
+            cached[b] = _draw_block(_rng(seed, _CROWD_STREAM, b), n, day_offsets, 6, 200.0, today)
+            cached[b]["user"] += first
+        return cached[b]
+
+    for first in range(0, num_users, chunk_users):
+        end = min(first + chunk_users, num_users)
+        pieces = []
+        for b in range(first // STREAM_BLOCK_USERS, (end - 1) // STREAM_BLOCK_USERS + 1):
+            arrays = block(b)
+            lo, hi = np.searchsorted(arrays["user"], [first, end])
+            pieces.append({key: values[lo:hi] for key, values in arrays.items()})
+        chunk = {key: np.concatenate([p[key] for p in pieces]) for key in pieces[0]}
+        chunk["first_user"] = first
+        yield chunk
+
+
+def _append_columns(store: EventStore, user_codes, timestamp, action, amount, asset_code: int) -> None:
+    """Bulk-append encoded columns, converting to each array's item type."""
+    for col, values in (
+        (store.user, user_codes),
+        (store.timestamp, timestamp),
+        (store.action, action),
+        (store.amount, amount),
+        (store.asset, np.full(len(amount), asset_code)),
+    ):
+        col.frombytes(np.ascontiguousarray(values, dtype=col.typecode).tobytes())
+
+
+def build_demo_store(
+    user_actions: List[Dict[str, Any]],
+    num_other_users: int = 25,
+    days: int = 14,
+    seed: Optional[int] = None,
+    chunk_users: int = 100_000,
+) -> EventStore:
+    """Vectorized counterpart of `_build_demo_events`, returned as an `EventStore`.
+
+    Users are interned as "you" followed by user_1..user_N.
+    """
+    now = datetime.utcnow()
+    seed = int(np.random.SeedSequence(seed).entropy)
+    today = _day_index(now)
+    store = EventStore()
+    you = store.users.code("you")
+    asset = store.assets.code("QUBIC")
+
+    # Current user actions (treated as today)
+    for act in user_actions:
+        ts = act.get("timestamp") or now
+        if not isinstance(ts, datetime):
+            ts = now
+        store.append(
+            "you",
+            ts,
+            str(act.get("action_type", "other")).lower(),
+            float(act.get("amount", 0.0)),
+            str(act.get("asset", "QUBIC")),
+        )
+
+    # Some history for the current user so momentum makes sense
+    if days > 1:
+        history = _draw_block(_rng(seed, _YOU_STREAM), 1, np.arange(1, days), 4, 150.0, today)
+        _append_columns(
+            store, np.full(len(history["amount"]), you), history["timestamp"],
+            history["action"], history["amount"], asset,
+        )
+
+    for i in range(num_other_users):
+        store.users.code(f"user_{i + 1}")
+    # "you" is code 0, so user k (0-based) is code k + 1.
+    chunks = iter_crowd_chunks(num_other_users, days, seed=seed, chunk_users=chunk_users, now=now)
+    for chunk in chunks:
+        _append_columns(
+            store, chunk["user"] + 1, chunk["timestamp"], chunk["action"], chunk["amount"], asset
+        )
+    return store
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Make `metrics_engine` and the app helper modules importable the same way
+# `streamlit run app/app.py` sees them, regardless of where pytest is started.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "app")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
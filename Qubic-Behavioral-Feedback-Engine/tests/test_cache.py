@@ -0,0 +1,49 @@
+from metrics_engine.cache import MetricsCache, metrics_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeat_calls_hit_the_cache():
+    cache = MetricsCache(maxsize=4)
+    actions = [{"action_type": "buy", "amount": 5}]
+    first = cache.compute_metrics(actions, num_other_users=5, days=3, seed=1)
+    again = cache.compute_metrics([dict(actions[0])], num_other_users=5, days=3, seed=1)
+    assert again is first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    other = cache.compute_metrics(actions, num_other_users=5, days=3, seed=2)
+    assert other is not first
+    assert cache.compute_metrics(actions, num_other_users=5, days=3) is not first
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_ttl_and_invalidation():
+    clock = FakeClock()
+    cache = MetricsCache(maxsize=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    clock.now = 11
+    assert cache.get("a") is None
+    cache.put("d", 4)
+    cache.invalidate("d")
+    assert cache.get("d") is None
+    cache.put("e", 5)
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_key_is_stable_and_input_sensitive():
+    actions = [{"amount": 1, "action_type": "buy"}]
+    assert metrics_key(actions, 25, 14, 3) == metrics_key([{"action_type": "buy", "amount": 1}], 25, 14, 3)
+    assert metrics_key(actions, 25, 14, 3) != metrics_key(actions, 25, 14, 3, backend="numpy")
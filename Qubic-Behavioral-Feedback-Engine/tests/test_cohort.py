@@ -0,0 +1,35 @@
+import random
+
+from metrics_engine.cohort import CohortIndex, compute_CFS_batch
+from metrics_engine.metrics_engine import _compute_CFS
+
+
+def _history(n=300, seed=4):
+    rng = random.Random(seed)
+    history = {}
+    for i in range(n):
+        # Round to whole points so many users sit exactly on the delta/tolerance edges.
+        past = float(rng.randint(20, 80))
+        history[f"user_{i}"] = {"past": past, "future": past + rng.randint(-8, 8)}
+    return history
+
+
+def test_batch_cfs_matches_linear_scan():
+    history = _history()
+    batch = compute_CFS_batch(history)
+    assert set(batch) == set(history)
+    for user in history:
+        assert batch[user] == _compute_CFS(history, target_user=user)
+
+
+def test_cohort_lookup_and_fallbacks():
+    history = _history(n=50)
+    index = CohortIndex(history)
+    target_past = history["user_7"]["past"]
+    expected = {u for u, h in history.items() if u != "user_7" and abs(h["past"] - target_past) <= 5.0}
+    assert set(index.cohort("user_7")) == expected
+
+    assert index.cfs("missing") == _compute_CFS(history, target_user="missing")
+    assert CohortIndex({}).cfs("you") == {}
+    lonely = {"you": {"past": 10.0, "future": 20.0}}
+    assert CohortIndex(lonely).cfs() == _compute_CFS(lonely)
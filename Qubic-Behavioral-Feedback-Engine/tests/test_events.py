@@ -0,0 +1,42 @@
+import pytest
+
+from metrics_engine.events import EventStore
+from metrics_engine.metrics_engine import _build_demo_events, _score_user_events
+
+
+def _demo_store():
+    actions = [{"action_type": "vote", "amount": 12.5}]
+    user_events = _build_demo_events(actions, num_other_users=20, days=10, seed=8)
+    return user_events, EventStore.from_user_events(user_events)
+
+
+def test_store_round_trips_events():
+    user_events, store = _demo_store()
+    assert len(store) == sum(len(evs) for evs in user_events.values())
+    assert store.action_weights()[store.action_types.values.index("vote")] == 1.0
+
+    original = [ev for evs in user_events.values() for ev in evs]
+    for ev, back in zip(original, store.iter_events()):
+        assert back["user_id"] == ev["user_id"]
+        assert back["timestamp"] == ev["timestamp"].replace(microsecond=0)
+        assert back["action_type"] == ev["action_type"]
+        assert back["amount"] == ev["amount"]
+
+
+def test_store_scores_like_dict_events():
+    user_events, store = _demo_store()
+    assert _score_user_events(store, 10) == _score_user_events(user_events, 10)
+
+
+def test_numpy_backend_reads_store_columns():
+    pytest.importorskip("numpy")
+    from metrics_engine.columnar import score_user_events
+
+    user_events, store = _demo_store()
+    days_list, daily_scores, BMS = score_user_events(store, days=10)
+    expected_days, expected_scores, expected_BMS = _score_user_events(user_events, 10)
+    assert days_list == expected_days
+    for user, info in expected_BMS.items():
+        assert BMS[user] == pytest.approx(info)
+        for day, scores in expected_scores[user].items():
+            assert daily_scores[user][day] == pytest.approx(scores)
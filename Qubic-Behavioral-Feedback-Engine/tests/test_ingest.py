@@ -0,0 +1,113 @@
+import csv
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+from metrics_engine.ingest import (
+    aggregate_strain,
+    iter_chunks,
+    iter_csv_events,
+    iter_events,
+    iter_jsonl_events,
+    normalize_event,
+)
+from metrics_engine.metrics_engine import _build_demo_events, _compute_daily_strain, _score_user_events
+
+FIELDS = ("user_id", "timestamp", "action_type", "amount", "asset")
+
+
+def _demo_rows():
+    user_events = _build_demo_events([], num_other_users=15, days=7, seed=13)
+    rows = [
+        {**ev, "timestamp": ev["timestamp"].isoformat()}
+        for events in user_events.values()
+        for ev in events
+    ]
+    return user_events, rows
+
+
+def test_normalize_event_defaults_and_timestamps():
+    ev = normalize_event({"user_id": " alice ", "timestamp": "2024-05-01T23:30:00+02:00", "action_type": "BUY"})
+    assert ev == {
+        "user_id": "alice",
+        "timestamp": datetime(2024, 5, 1, 21, 30),
+        "action_type": "buy",
+        "amount": 0.0,
+        "asset": "QUBIC",
+    }
+    assert normalize_event({"user_id": "a", "timestamp": "1714608000"})["timestamp"] == datetime(2024, 5, 2)
+    assert normalize_event({"user_id": "a", "timestamp": "2024-05-02T00:00:00Z"})["timestamp"] == datetime(2024, 5, 2)
+
+    for bad in ({"timestamp": "2024-05-01"}, {"user_id": "a"}, {"user_id": "a", "timestamp": "2024-05-01", "amount": "nan"}):
+        with pytest.raises(ValueError):
+            normalize_event(bad)
+
+
+def test_jsonl_stream_matches_in_memory_strain(tmp_path):
+    user_events, rows = _demo_rows()
+    path = tmp_path / "events.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row) + "\n")
+
+    acc = aggregate_strain(path, chunk_size=37)
+    assert acc.events == len(rows)
+    expected_strain, expected_decision = _compute_daily_strain(user_events)
+    strain, decision = acc.result()
+    assert strain == expected_strain
+    assert decision == expected_decision
+    assert acc.score(days=7) == _score_user_events(user_events, 7)
+
+
+def test_csv_errors_raise_or_skip(tmp_path):
+    path = tmp_path / "events.csv"
+    with open(path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerow({"user_id": "a", "timestamp": "2024-05-01T10:00:00", "action_type": "stake", "amount": "10"})
+        writer.writerow({"user_id": "", "timestamp": "2024-05-01T11:00:00"})
+        writer.writerow({"user_id": "b", "timestamp": "2024-05-02T09:00:00", "amount": ""})
+
+    with pytest.raises(ValueError, match="line 3"):
+        list(iter_csv_events(path))
+    events = list(iter_events(path, errors="skip"))
+    assert [ev["user_id"] for ev in events] == ["a", "b"]
+    assert events[1]["action_type"] == "other"
+
+
+
+@pytest.mark.parametrize("bad", [
+    {"user_id": "x", "timestamp": "2024-05-01T10:00:00", "amount": [1]},
+    {"user_id": "x", "timestamp": 1e20},
+    {"user_id": "x", "timestamp": {"when": "today"}},
+])
+def test_jsonl_mistyped_fields_raise_or_skip(tmp_path, bad):
+    path = tmp_path / "events.jsonl"
+    rows = [{"user_id": "a", "timestamp": "2024-05-01T10:00:00"}, bad, {"user_id": "b", "timestamp": 1714557600}]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_jsonl_events(path))
+    assert [ev["user_id"] for ev in iter_jsonl_events(path, errors="skip")] == ["a", "b"]
+
+
+def test_csv_out_of_range_timestamp_raises_or_skips(tmp_path):
+    path = tmp_path / "events.csv"
+    with open(path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerow({"user_id": "a", "timestamp": "1e20"})
+        writer.writerow({"user_id": "b", "timestamp": "2024-05-02T09:00:00"})
+
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_csv_events(path))
+    assert [ev["user_id"] for ev in iter_csv_events(path, errors="skip")] == ["b"]
+
+
+def test_iter_chunks_bounds_chunk_size():
+    chunks = list(iter_chunks(iter(range(10)), 4))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    with pytest.raises(ValueError):
+        next(iter_chunks([], 0))
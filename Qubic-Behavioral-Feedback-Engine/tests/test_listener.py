@@ -0,0 +1,163 @@
+import asyncio
+import threading
+
+import pytest
+
+from metrics_engine.listener import BehavioralEventListener, TickCheckpoint, transfer_to_event
+from metrics_engine.streaming import MetricsEngine
+
+DAY_MS = 86_400_000
+T0 = 1_717_200_000_000  # 2024-06-01 in epoch ms
+
+
+class FakeRPC:
+    """In-memory stand-in for `QubicRPC`: a chain of transfers by tick."""
+
+    def __init__(self, transfers, tick):
+        self.transfers_by_tick = transfers
+        self.current = tick
+        self.calls = []
+        self.fail_once = set()
+        self.lock = threading.Lock()
+
+    def tick(self):
+        return {"tickInfo": {"tick": self.current}}
+
+    def transfers(self, identity, start_tick, end_tick):
+        with self.lock:
+            self.calls.append((identity, start_tick, end_tick))
+            if identity in self.fail_once:
+                self.fail_once.discard(identity)
+                return {"error": "boom"}
+        groups = []
+        for tick in range(start_tick, end_tick + 1):
+            records = [
+                r for r in self.transfers_by_tick.get(tick, [])
+                if identity in (r["transaction"]["sourceId"], r["transaction"]["destId"])
+            ]
+            if records:
+                groups.append({"tickNumber": tick, "identity": identity, "transactions": records})
+        return {"transactions": groups}
+
+
+def _record(tick, source, dest, amount, input_type=0, day=0):
+    return {
+        "transaction": {
+            "sourceId": source, "destId": dest, "amount": str(amount),
+            "tickNumber": tick, "inputType": input_type,
+        },
+        "timestamp": str(T0 + day * DAY_MS + tick),
+        "moneyFlew": True,
+    }
+
+
+def _chain():
+    return {
+        101: [_record(101, "ALICE", "BOB", 50)],
+        102: [_record(102, "BOB", "QX", 10, input_type=6)],
+        105: [_record(105, "CAROL", "ALICE", 5, day=1)],
+        108: [_record(108, "ALICE", "DAVE", 7, day=1)],
+    }
+
+
+def _run(listener, polls):
+    asyncio.run(listener.run(max_polls=polls))
+
+
+def test_transfer_mapping():
+    rec = _record(1, "ALICE", "QX", 3, input_type=1)
+    assert transfer_to_event("ALICE", rec)["action_type"] == "swap"
+    assert transfer_to_event("QX", rec)["action_type"] == "deposit"
+    assert transfer_to_event("BOB", rec) is None
+    assert transfer_to_event("ALICE", _record(1, "ALICE", "BOB", 3))["action_type"] == "withdraw"
+
+
+def test_listener_ingests_and_checkpoints(tmp_path):
+    client = FakeRPC(_chain(), tick=105)
+    engine = MetricsEngine(days=7)
+    path = str(tmp_path / "listener.json")
+    listener = BehavioralEventListener(
+        client, engine, ["ALICE", "BOB"], checkpoint_path=path, start_tick=100,
+        poll_interval=0, max_ticks_per_poll=3,
+    )
+    _run(listener, polls=3)
+
+    # 100-102, 103-105, then caught up.
+    assert listener.ingested_tick == 105
+    assert TickCheckpoint(path).load() == 105
+    # ALICE: withdraw@101, deposit@105; BOB: deposit@101, swap@102.
+    assert engine.events_ingested == listener.events_ingested == 4
+    assert set(engine.users) == {"ALICE", "BOB"}
+
+    # A restarted listener restores the engine and resumes after the
+    # checkpoint instead of re-reading.
+    client.current = 110
+    client.calls.clear()
+    engine2 = MetricsEngine(days=7)
+    restarted = BehavioralEventListener(client, engine2, ["ALICE", "BOB"], checkpoint_path=path, poll_interval=0)
+    assert engine2.metrics() == engine.metrics()
+    _run(restarted, polls=1)
+    assert {start for _, start, _ in client.calls} == {106}
+    assert restarted.events_ingested == 1
+    assert engine2.events_ingested == 5
+    assert TickCheckpoint(path).load() == 110
+
+    # Same result as one listener that never restarted.
+    client.calls.clear()
+    uninterrupted = MetricsEngine(days=7)
+    _run(BehavioralEventListener(client, uninterrupted, ["ALICE", "BOB"], start_tick=100, poll_interval=0), polls=1)
+    assert engine2.metrics() == uninterrupted.metrics()
+
+
+def test_failed_range_is_retried_without_duplicates():
+    client = FakeRPC(_chain(), tick=102)
+    client.fail_once.add("BOB")
+    engine = MetricsEngine(days=7)
+    listener = BehavioralEventListener(client, engine, ["ALICE", "BOB"], start_tick=101, poll_interval=0)
+    _run(listener, polls=2)
+    assert len(listener.errors) == 1
+    assert listener.ingested_tick == 102
+    assert engine.events_ingested == 3
+
+
+def test_backpressure_bounds_queue():
+    chain = {t: [_record(t, "ALICE", "BOB", 1)] for t in range(1, 41)}
+    client = FakeRPC(chain, tick=40)
+    engine = MetricsEngine(days=7)
+    seen = []
+    original = engine.ingest_batch
+
+    def slow_ingest(events):
+        seen.append(listener.last_tick - listener.ingested_tick)
+        return original(events)
+
+    engine.ingest_batch = slow_ingest
+    listener = BehavioralEventListener(
+        client, engine, ["ALICE"], start_tick=1, poll_interval=0, max_ticks_per_poll=1, queue_size=2,
+    )
+    _run(listener, polls=40)
+    assert listener.ingested_tick == 40
+    assert engine.events_ingested == 40
+    # The poller never ran more than queue_size (+1 in hand) batches ahead.
+    assert max(seen) <= 3
+
+
+class _FailingEngine:
+    def ingest_batch(self, events):
+        raise RuntimeError("ingest failed")
+
+
+def test_ingest_failure_stops_run():
+    client = FakeRPC({t: [_record(t, "ALICE", "BOB", 1)] for t in range(100, 200)}, tick=199)
+    listener = BehavioralEventListener(
+        client, _FailingEngine(), ["ALICE"], start_tick=100,
+        poll_interval=0, max_ticks_per_poll=1, queue_size=1,
+    )
+
+    async def run():
+        await asyncio.wait_for(listener.run(max_polls=50), timeout=5)
+
+    with pytest.raises(RuntimeError, match="ingest failed"):
+        asyncio.run(run())
+    assert listener.events_ingested == 0
+    assert listener.ingested_tick == 99
@@ -0,0 +1,118 @@
+import pytest
+
+from metrics_engine.metrics_engine import (
+    _build_demo_events,
+    _compute_daily_strain,
+    _compute_TES_BSS_for_day,
+    _compute_TES_BSS_for_day_sorted,
+    _day_from_iso,
+    _day_index,
+    _day_iso,
+    _day_key,
+    _score_day_vectors,
+    compute_metrics,
+)
+
+
+def _demo_inputs(num_other_users=60, days=14, seed=7):
+    user_events = _build_demo_events([], num_other_users=num_other_users, days=days, seed=seed)
+    days_seen = set()
+    daily_strain, daily_decision = _compute_daily_strain(user_events, days_seen)
+    return daily_strain, daily_decision, sorted(days_seen)
+
+
+def test_sorted_TES_BSS_matches_quadratic_scan():
+    daily_strain, daily_decision, all_days = _demo_inputs()
+    for day in all_days:
+        expected = _compute_TES_BSS_for_day(day, daily_strain, daily_decision)
+        actual = _compute_TES_BSS_for_day_sorted(day, daily_strain, daily_decision)
+        assert actual == expected
+
+
+def test_sorted_TES_BSS_handles_ties_and_empty_days():
+    daily_strain = {"a": {"d": 1.0}, "b": {"d": 1.0}, "c": {}, "d": {"d": 3.0}}
+    daily_decision = {"a": {"d": 0.5}, "b": {"d": 0.75}, "c": {}, "d": {"d": 0.25}}
+    assert _compute_TES_BSS_for_day_sorted("d", daily_strain, daily_decision) == (
+        _compute_TES_BSS_for_day("d", daily_strain, daily_decision)
+    )
+    assert _compute_TES_BSS_for_day_sorted("other", daily_strain, daily_decision) == {
+        u: {"TES": 0.0, "BSS": 0.0} for u in daily_strain
+    }
+
+
+def test_compute_metrics_shape():
+    result = compute_metrics([{"action_type": "buy", "amount": 10}], num_other_users=10, seed=1)
+    assert result["target_user"] == "you"
+    assert len(result["days"]) <= 14
+    assert set(result["BMS"]) == set(result["daily_scores"])
+    assert result["CFS"]["target_user"] == "you"
+
+
+def test_numpy_backend_matches_python_backend():
+    pytest.importorskip("numpy")
+    actions = [{"action_type": "stake", "amount": 40}, {"action_type": "mint", "amount": 3}]
+    expected = compute_metrics(actions, num_other_users=40, days=10, seed=3)
+    actual = compute_metrics(actions, num_other_users=40, days=10, seed=3, backend="numpy")
+
+    assert actual["days"] == expected["days"]
+    assert set(actual["daily_scores"]) == set(expected["daily_scores"])
+    for user, by_day in expected["daily_scores"].items():
+        for day, scores in by_day.items():
+            assert actual["daily_scores"][user][day] == pytest.approx(scores)
+    for user, info in expected["BMS"].items():
+        assert actual["BMS"][user] == pytest.approx(info)
+    assert actual["CFS"] == pytest.approx(expected["CFS"])
+
+
+def test_numpy_TES_counts_values_exactly_epsilon_apart():
+    np = pytest.importorskip("numpy")
+    from metrics_engine.columnar import _TES_BSS_grid
+
+    # Pairs TES_EPSILON (0.25) apart whose float sum/difference rounds the
+    # other way, so unadjusted searchsorted bounds would drop the neighbour.
+    decisions = [0.09, 0.34, 0.26, 0.01, 0.21, 0.46, 0.5, 0.75, 0.25]
+    strains = [1.0, 2.0, 1.0, 3.0, 0.5, 1.0, 2.0, 1.0, 4.0]
+    expected_TES, expected_BSS = _score_day_vectors(decisions, strains)
+    TES, BSS = _TES_BSS_grid(np.array([strains]).T, np.array([decisions]).T)
+    assert TES[:, 0].tolist() == pytest.approx(expected_TES)
+    assert BSS[:, 0].tolist() == pytest.approx(expected_BSS)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        compute_metrics([], backend="gpu")
+
+
+def test_workers_with_numpy_backend_are_rejected():
+    with pytest.raises(ValueError, match="workers"):
+        compute_metrics([], backend="numpy", workers=2)
+    with pytest.raises(ValueError, match="workers"):
+        compute_metrics([], backend="numpy", workers=2, events={"you": []})
+
+
+def test_parallel_workers_match_serial_scoring():
+    expected = compute_metrics([], num_other_users=30, days=7, seed=9)
+    actual = compute_metrics([], num_other_users=30, days=7, seed=9, workers=2)
+    assert actual["days"] == expected["days"]
+    assert actual["daily_scores"] == expected["daily_scores"]
+    assert actual["BMS"] == expected["BMS"]
+
+
+def test_day_index_round_trips_to_iso():
+    from datetime import datetime, timezone
+
+    ts = datetime(2024, 2, 29, 23, 59, 59)
+    assert _day_iso(_day_index(ts)) == _day_key(ts) == "2024-02-29"
+    assert _day_index(ts.replace(tzinfo=timezone.utc).timestamp()) == _day_index(ts)
+    assert _day_index(-1) == -1
+    assert _day_from_iso("1970-01-02") == 1
+
+
+def test_aware_datetimes_are_bucketed_by_utc_day():
+    from datetime import datetime, timedelta, timezone
+
+    from metrics_engine.events import _epoch_seconds
+
+    ts = datetime(2024, 1, 1, 23, 0, tzinfo=timezone(timedelta(hours=-5)))
+    assert _day_key(ts) == "2024-01-02"
+    assert _day_index(ts) == _day_index(_epoch_seconds(ts))
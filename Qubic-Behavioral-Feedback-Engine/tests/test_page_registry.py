@@ -0,0 +1,78 @@
+import sys
+
+import pytest
+
+from page_registry import Page, PageRegistry, TemplateDispatch
+
+
+def _registry():
+    registry = PageRegistry()
+    for i, (section, template) in enumerate([
+        ("Entry & Auth", "login"),
+        ("XP & Stats", "simple_table"),
+        ("Entry & Auth", "register"),
+        ("XP & Stats", "xp_dashboard"),
+        ("Admin & Dev", "simple_table"),
+    ]):
+        registry.add(Page(id=f"p{i}", label=f"Page {i}", section=section, template=template, meta={}))
+    return registry
+
+
+def test_indexes_follow_registration_order():
+    registry = _registry()
+    assert len(registry) == 5
+    assert [p.id for p in registry] == ["p0", "p1", "p2", "p3", "p4"]
+    assert registry.sections() == ["Entry & Auth", "XP & Stats", "Admin & Dev"]
+    assert [p.id for p in registry.section_pages("XP & Stats")] == ["p1", "p3"]
+    assert registry.section_pages("Missing") == []
+    assert registry.get("p2").label == "Page 2"
+    assert registry.get("nope") is None
+    assert registry.get_by_label("Page 3") is registry.get("p3")
+    assert "p4" in registry and "nope" not in registry
+
+
+def test_duplicates_are_rejected():
+    registry = _registry()
+    with pytest.raises(ValueError):
+        registry.add(Page(id="p0", label="Other", section="XP & Stats", template="x"))
+    with pytest.raises(ValueError):
+        registry.add(Page(id="p9", label="Page 0", section="XP & Stats", template="x"))
+    assert len(registry) == 5
+
+
+def test_template_overrides_update_every_index():
+    registry = _registry()
+    registry.override_templates({"p1": "xp_history", "unknown": "ignored"})
+    assert registry.get("p1").template == "xp_history"
+    assert registry.section_pages("XP & Stats")[0].template == "xp_history"
+    assert registry.get_by_label("Page 1").template == "xp_history"
+
+
+def test_template_dispatch_imports_modules_on_first_lookup(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_templates"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "first.py").write_text("def tpl_one(page):\n    return 'one:' + page\n")
+    (package / "second.py").write_text("def tpl_two(page):\n    return 'two:' + page\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    dispatch = TemplateDispatch({"one": "first:tpl_one", "two": "second:tpl_two"}, package="lazy_templates")
+    assert "one" in dispatch and "missing" not in dispatch
+    assert sorted(dispatch) == ["one", "two"]
+    assert "lazy_templates.first" not in sys.modules
+
+    assert dispatch["one"]("p") == "one:p"
+    assert "lazy_templates.first" in sys.modules
+    assert "lazy_templates.second" not in sys.modules
+    assert dispatch.get("missing") is None
+
+    dispatch.update({"one": "second:tpl_two"})
+    assert dispatch["one"]("p") == "two:p"
+
+
+def test_catalog_templates_resolve():
+    pytest.importorskip("streamlit")
+    from page_catalog import TEMPLATE_DISPATCH
+
+    for key in TEMPLATE_DISPATCH:
+        assert callable(TEMPLATE_DISPATCH[key]), key
@@ -0,0 +1,216 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from qubic_rpc import BATCH_RESERVED_CONNECTIONS, CACHE_TTLS, NOT_FOUND_TTL, TICK_NOT_FOUND, QubicRPC, ResponseCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            server.peers.add(self.client_address)
+            hits = server.hits[self.path]
+
+        if self.path == "/v1/status":
+            time.sleep(server.delay)
+            self._send(200, {"circulatingSupply": 42})
+        elif self.path == "/v1/tick":
+            time.sleep(server.delay)
+            self._send(404, {"message": "not found"})
+        elif self.path == "/v1/balances/FLAKY":
+            self._send(503 if hits < 3 else 200, {"balance": "7"})
+        elif self.path == "/v1/balances/SLOW":
+            time.sleep(0.5)
+            self._send(200, {"balance": "1"})
+        elif self.path == "/v1/balances/SLOWBODY":
+            body = json.dumps({"balance": "1"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[:5])
+            self.wfile.flush()
+            time.sleep(0.5)
+            self.wfile.write(body[5:])
+        elif self.path.startswith("/v2/identities/"):
+            self._send(200, {"transactions": [], "path": self.path})
+        elif self.path.startswith("/v1/balances/"):
+            time.sleep(server.delay)
+            self._send(200, {"id": self.path.rsplit("/", 1)[1], "balance": "100"})
+        else:
+            self._send(404, {"message": "not found"})
+
+
+@pytest.fixture
+def rpc_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    # Clients that time out on purpose leave the handler writing to a closed socket.
+    server.handle_error = lambda request, client_address: None
+    server.lock = threading.Lock()
+    server.hits = {}
+    server.peers = set()
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(rpc_server):
+    host, port = rpc_server.server_address
+    with QubicRPC(endpoint=f"http://{host}:{port}", backoff=0.01) as rpc:
+        yield rpc
+
+
+def test_endpoints_and_keep_alive(client, rpc_server):
+    assert client.status() == {"circulatingSupply": 42}
+    assert client.tick() == {"error": TICK_NOT_FOUND}
+    assert client.balance("  ABC ") == {"id": "ABC", "balance": "100"}
+    assert client.balance("") == {"error": "No identity provided"}
+    # Sequential calls reuse one pooled connection.
+    assert len(rpc_server.peers) == 1
+
+
+def test_transfers_query_tick_range(client):
+    out = client.transfers("ABC", 10, 20)
+    assert out["path"] == "/v2/identities/ABC/transfers?startTick=10&endTick=20"
+    # Transfers are never served from the cache.
+    assert len(client.cache) == 0
+
+
+def test_retries_transient_errors(client, rpc_server):
+    assert client.balance("FLAKY") == {"balance": "7"}
+    assert rpc_server.hits["/v1/balances/FLAKY"] == 3
+
+
+def test_read_timeout_is_not_retried(rpc_server):
+    host, port = rpc_server.server_address
+    with QubicRPC(endpoint=f"http://{host}:{port}", timeouts={"balance": (1.0, 0.1)}) as rpc:
+        assert "error" in rpc.balance("SLOW")
+    assert rpc_server.hits["/v1/balances/SLOW"] == 1
+
+
+def test_read_timeout_in_body_is_not_retried(rpc_server):
+    host, port = rpc_server.server_address
+    with QubicRPC(endpoint=f"http://{host}:{port}", timeouts={"balance": (1.0, 0.1)}, backoff=0.01) as rpc:
+        assert "Read timed out" in rpc.balance("SLOWBODY")["error"]
+    assert rpc_server.hits["/v1/balances/SLOWBODY"] == 1
+
+
+def test_network_snapshot_runs_calls_concurrently(client, rpc_server):
+    rpc_server.delay = 0.3
+    start = time.perf_counter()
+    snapshot = client.network_snapshot()
+    elapsed = time.perf_counter() - start
+    assert snapshot == {"status": {"circulatingSupply": 42}, "tick": {"error": TICK_NOT_FOUND}}
+    assert elapsed < 0.55
+
+
+def test_unreachable_endpoint_returns_error():
+    with QubicRPC(endpoint="http://127.0.0.1:9", retries=1, backoff=0.01) as rpc:
+        assert "error" in rpc.status()
+
+
+def test_responses_are_cached_per_endpoint_ttl(client, rpc_server):
+    now = [0.0]
+    client.cache = ResponseCache(clock=lambda: now[0])
+
+    for _ in range(3):
+        assert client.status() == {"circulatingSupply": 42}
+        assert client.tick() == {"error": TICK_NOT_FOUND}
+    assert rpc_server.hits == {"/v1/status": 1, "/v1/tick": 1}
+
+    now[0] += CACHE_TTLS["status"] + 0.1
+    client.status()
+    client.tick()  # the 404 is negatively cached for much longer
+    assert rpc_server.hits == {"/v1/status": 2, "/v1/tick": 1}
+
+    now[0] += NOT_FOUND_TTL
+    client.tick()
+    assert rpc_server.hits["/v1/tick"] == 2
+
+
+def test_errors_are_not_cached(rpc_server):
+    host, port = rpc_server.server_address
+    with QubicRPC(endpoint=f"http://{host}:{port}", timeouts={"balance": (1.0, 0.1)}) as rpc:
+        assert "error" in rpc.balance("SLOW")
+        assert "error" in rpc.balance("SLOW")
+    assert rpc_server.hits["/v1/balances/SLOW"] == 2
+
+
+def test_concurrent_misses_share_one_request(client, rpc_server):
+    rpc_server.delay = 0.2
+    futures = [client.submit(client.status) for _ in range(6)]
+    assert all(f.result() == {"circulatingSupply": 42} for f in futures)
+    assert rpc_server.hits["/v1/status"] == 1
+    assert client.cache.stats()["coalesced"] == 5
+
+
+def test_batch_balances_dedupes_and_reports_errors(client, rpc_server):
+    rpc_server.delay = 0.0
+    out = client.balances(["A", " A ", "B", "", "SLOW", "B"], concurrency=4)
+    assert set(out["results"]) == {"A", "B", "SLOW"}
+    assert out["results"]["A"] == {"id": "A", "balance": "100"}
+    assert out["errors"] == {}
+    assert rpc_server.hits["/v1/balances/A"] == 1
+    assert rpc_server.hits["/v1/balances/B"] == 1
+
+    client.timeouts["balance"] = (1.0, 0.1)
+    client.balance_cache.invalidate()
+    out = client.balances(["SLOW", "C"])
+    assert list(out["results"]) == ["C"]
+    assert list(out["errors"]) == ["SLOW"]
+
+
+def test_balance_batches_do_not_evict_other_responses(rpc_server):
+    host, port = rpc_server.server_address
+    with QubicRPC(endpoint=f"http://{host}:{port}", cache=ResponseCache(maxsize=4),
+                  balance_cache=ResponseCache(maxsize=8)) as rpc:
+        rpc.status()
+        out = rpc.balances([f"ID{i}" for i in range(20)])
+        assert len(out["results"]) == 20
+        assert len(rpc.balance_cache) == 8
+        rpc.status()
+    assert rpc_server.hits["/v1/status"] == 1
+
+
+def test_batch_balances_reject_non_str_identities(client):
+    with pytest.raises(TypeError):
+        client.balances(["A", 42])
+    with pytest.raises(TypeError):
+        client.balances("ABC")
+    with pytest.raises(TypeError):
+        client.balance(b"ABC")
+    assert client.balances([None, " "]) == {"results": {}, "errors": {}}
+
+
+def test_batch_leaves_pooled_connections_free(rpc_server):
+    host, port = rpc_server.server_address
+    rpc_server.delay = 0.05
+    with QubicRPC(endpoint=f"http://{host}:{port}", max_workers=8) as rpc:
+        out = rpc.balances([f"ID{i}" for i in range(40)], concurrency=32)
+    assert len(out["results"]) == 40
+    assert len(rpc_server.peers) <= 8 - BATCH_RESERVED_CONNECTIONS
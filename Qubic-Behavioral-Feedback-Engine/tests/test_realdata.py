@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from metrics_engine import compute_metrics
+from metrics_engine.events import EventStore
+from metrics_engine.metrics_engine import _build_demo_events, _compute_daily_strain, _day_key, _score_user_events
+from metrics_engine.snapshot import write_snapshot
+
+
+def _crowd():
+    return _build_demo_events([{"action_type": "stake", "amount": 40.0}], num_other_users=30, days=21, seed=4)
+
+
+def test_real_events_are_scored_as_given():
+    user_events = _crowd()
+    result = compute_metrics(events=user_events, days=14)
+    days_list, daily_scores, BMS = _score_user_events(user_events, 14)
+
+    assert result["days"] == days_list
+    assert result["daily_scores"] == daily_scores
+    assert result["BMS"] == BMS
+    assert set(result["BMS"]) == set(user_events)
+    assert compute_metrics(events=user_events, days=14) == result
+    assert result["CFS"]["target_user"] == "you"
+    assert result["CFS"]["cohort_size"] > 0
+
+
+def test_event_sources_agree():
+    user_events = _crowd()
+    expected = compute_metrics(events=user_events, days=10)
+    flat = [ev for events in user_events.values() for ev in events]
+    assert compute_metrics(events=iter(flat), days=10) == expected
+    assert compute_metrics(events=EventStore.from_user_events(user_events), days=10) == expected
+
+
+def test_cfs_past_from_snapshots(tmp_path):
+    user_events = _crowd()
+    earlier = {
+        user: [ev for ev in events if ev["timestamp"] < datetime.utcnow() - timedelta(days=7)]
+        for user, events in user_events.items()
+    }
+    past_metrics = compute_metrics(events=earlier, days=14)
+    write_snapshot(str(tmp_path), past_metrics, _compute_daily_strain(earlier)[0])
+
+    result = compute_metrics(events=user_events, days=14, snapshot_dir=str(tmp_path))
+    assert result["BMS"] == compute_metrics(events=user_events, days=14)["BMS"]
+    assert result["CFS"]["cohort_size"] > 0
+
+
+def test_daily_snapshots_give_the_same_cfs_as_recomputing(tmp_path):
+    user_events = _crowd()
+    days = sorted({_day_key(ev["timestamp"]) for events in user_events.values() for ev in events})
+    # Snapshot once per day, as a daily job would, from the events seen so far.
+    for day in days[-10:]:
+        seen = {user: [ev for ev in events if _day_key(ev["timestamp"]) <= day] for user, events in user_events.items()}
+        write_snapshot(str(tmp_path), compute_metrics(events=seen, days=14), _compute_daily_strain(seen)[0])
+
+    from_snapshots = compute_metrics(events=user_events, days=14, snapshot_dir=str(tmp_path))
+    recomputed = compute_metrics(events=user_events, days=14)
+    assert from_snapshots["CFS"] == pytest.approx(recomputed["CFS"])
+    assert from_snapshots["CFS"]["cohort_size"] > 0
+
+
+def test_real_data_mode_rejects_mixed_inputs():
+    with pytest.raises(ValueError):
+        compute_metrics([{"action_type": "buy"}], events={})
+    with pytest.raises(ValueError):
+        compute_metrics(events={}, cfs_lag=0)
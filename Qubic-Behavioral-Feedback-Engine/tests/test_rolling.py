@@ -0,0 +1,42 @@
+import pytest
+
+from metrics_engine.metrics_engine import (
+    _build_demo_events,
+    _compute_BMS,
+    _compute_daily_strain,
+    _compute_TES_BSS_for_day_sorted,
+)
+from metrics_engine.rolling import RollingBMS, RollingBMSWindow
+
+
+def test_rolling_bms_matches_full_recompute_each_day():
+    user_events = _build_demo_events([], num_other_users=25, days=20, seed=2)
+    days_seen = set()
+    daily_strain, daily_decision = _compute_daily_strain(user_events, days_seen)
+    all_days = sorted(days_seen)
+
+    rolling = RollingBMS(window=14)
+    scores_by_day = {}
+    for i, day in enumerate(all_days):
+        scores_by_day[day] = _compute_TES_BSS_for_day_sorted(day, daily_strain, daily_decision)
+        rolling.advance(day, scores_by_day[day])
+
+        days_list = all_days[max(0, i + 1 - 14): i + 1]
+        by_user = {
+            user: {d: scores_by_day[d][user] for d in days_list} for user in daily_strain
+        }
+        expected = _compute_BMS(by_user, days_list)
+        actual = rolling.all_bms()
+        assert list(rolling.days) == days_list
+        for user, info in expected.items():
+            assert actual[user] == pytest.approx(info)
+
+
+def test_window_split_follows_midpoint():
+    win = RollingBMSWindow(window=4)
+    assert win.snapshot()["BMS%"] == 25.0
+    for tes, bss in [(10, 10), (0, 0), (30, 30), (50, 50), (70, 70)]:
+        win.push(tes, bss)
+    # Window now holds days 2-5: past = [(0, 0), (30, 30)], recent = [(50, 50), (70, 70)].
+    assert len(win) == 4
+    assert win.snapshot() == {"Consistency%": 75.0, "Trend%": 80.0, "BMS%": 77.5}
@@ -0,0 +1,85 @@
+import mmap
+
+import pytest
+
+from metrics_engine import MetricsEngine
+from metrics_engine.metrics_engine import _build_demo_events, _day_from_iso, _day_key
+from metrics_engine.snapshot import DaySnapshot, SnapshotReader, write_day_snapshot
+
+
+def _engine(up_to=None):
+    user_events = _build_demo_events([], num_other_users=15, days=6, seed=12)
+    engine = MetricsEngine(days=6)
+    engine.ingest_batch(
+        ev for events in user_events.values() for ev in events
+        if up_to is None or _day_key(ev["timestamp"]) <= up_to
+    )
+    return engine
+
+
+def test_snapshot_round_trip(tmp_path):
+    engine = _engine()
+    result = engine.metrics()
+    # One snapshot per day, each written when that day was the newest.
+    written = {}
+    for day in result["days"]:
+        day_engine = _engine(up_to=day)
+        assert day_engine.write_snapshot(str(tmp_path)) == [str(tmp_path / f"{day}.qbfs")]
+        day_result = day_engine.metrics()
+        written[day] = (day_result["daily_scores"]["user_4"][day], day_result["BMS"]["user_4"]["BMS%"])
+    assert engine.write_snapshot(str(tmp_path)) == [str(tmp_path / f"{result['days'][-1]}.qbfs")]
+
+    with SnapshotReader(str(tmp_path)) as reader:
+        assert reader.days() == result["days"]
+        history = reader.user_history("user_4", days=14)
+        assert [day for day, _ in history] == result["days"]
+        for day, row in history:
+            # Each file holds the scores as known when it was written.
+            scores, BMS = written[day]
+            assert row["TES"] == scores["TES"]
+            assert row["BSS"] == scores["BSS"]
+            assert row["strain"] == engine.daily_strain["user_4"].get(_day_from_iso(day), 0.0)
+            assert row["BMS"] == pytest.approx(BMS)
+        assert history[-1][1]["BMS"] == pytest.approx(result["BMS"]["user_4"]["BMS%"])
+
+        assert reader.lookup(result["days"][0], "nobody") is None
+        assert reader.lookup("1999-01-01", "user_4") is None
+
+
+def test_day_snapshot_lookup_and_validation(tmp_path):
+    rows = {"b": (1, 2, 3, 4), "a": (5, 6, 7, 8), "ünï": (9, 10, 11, 12)}
+    path = write_day_snapshot(str(tmp_path), "2024-01-01", rows)
+    snap = DaySnapshot(path)
+    assert list(snap.users()) == sorted(rows)
+    assert snap.row("ünï") == {"strain": 9.0, "TES": 10.0, "BSS": 11.0, "BMS": 12.0}
+    assert snap.row("c") is None
+    snap.close()
+
+    bogus = tmp_path / "2024-01-02.qbfs"
+    bogus.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        DaySnapshot(str(bogus))
+
+
+def test_day_snapshot_rejects_short_files_and_closes_the_map(tmp_path, monkeypatch):
+    opened = []
+    real_mmap = mmap.mmap
+
+    def tracking_mmap(*args, **kwargs):
+        mm = real_mmap(*args, **kwargs)
+        opened.append(mm)
+        return mm
+
+    monkeypatch.setattr(mmap, "mmap", tracking_mmap)
+
+    path = write_day_snapshot(str(tmp_path), "2024-01-01", {"a": (1, 2, 3, 4), "b": (5, 6, 7, 8)})
+    data = (tmp_path / "2024-01-01.qbfs").read_bytes()
+    for name, content in [("empty", b""), ("header", data[:10]), ("columns", data[:-8])]:
+        bad = tmp_path / f"{name}.qbfs"
+        bad.write_bytes(content)
+        with pytest.raises(ValueError, match="Truncated"):
+            DaySnapshot(str(bad))
+    assert len(opened) == 1  # only the columns case got far enough to map
+    assert all(mm.closed for mm in opened)
+
+    DaySnapshot(path).close()
@@ -0,0 +1,296 @@
+import gc
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from storage import (
+    SQLiteBackend,
+    StateBackend,
+    WriteBehind,
+    authenticate,
+    get_backend,
+    load_user_state,
+    register_account,
+    save_user_state,
+)
+from user_state import ActivityDays, AttemptIndex, DerivedState, XPLedger
+
+
+def _xp_events(n, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "ts": (start + timedelta(minutes=i * 97)).isoformat(timespec="seconds"),
+            "source": rng.choice(["Test", "Daily task", "Shop"]),
+            "amount": rng.randint(1, 200),
+            "description": f"event {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _attempts(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "timestamp": f"2024-02-{1 + i % 28:02d}T10:00:00",
+            "test_id": f"t{rng.randint(0, 9)}",
+            "name": f"attempt {i}",
+            "subject": rng.choice(["Risk", "Budgeting", "General behavior"]),
+            "xp_gained": rng.randint(0, 200),
+        }
+        for i in range(n)
+    ]
+
+
+def _session_state(events, attempts, trades=(), days=()):
+    ledger = XPLedger.from_events(events)
+    return {
+        "username": "alice",
+        "email": "alice@example.com",
+        "xp": sum(e["amount"] for e in events),
+        "coins": 42,
+        "gems": 0,
+        "tests_taken": len(attempts),
+        "test_history": list(attempts),
+        "test_index": AttemptIndex.from_history(attempts),
+        "xp_ledger": ledger,
+        "xp_events": ledger.events,
+        "days_active": ActivityDays(days),
+        "daily_tasks_done": {"2024-02-01": ["read"]},
+        "token_balance": 1.5,
+        "token_trades": list(trades),
+        "ai_chat_history": [],
+        "derived": DerivedState(),
+    }
+
+
+def test_round_trip_restores_aggregates_and_recent_windows(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    events = _xp_events(700)
+    attempts = _attempts(250)
+    trades = [{"timestamp": "2024-02-01T10:00:00", "action": "buy", "amount": float(i)} for i in range(5)]
+    days = ["2024-02-01", "2024-02-02", "2024-02-04"]
+    state = _session_state(events, attempts, trades, days)
+
+    # XPLedger only keeps 500 raw events; write all 700 so the totals cover them.
+    writer = WriteBehind(backend, "alice", batch_size=10_000)
+    for e in events:
+        writer.xp_event(e)
+    for a in attempts:
+        writer.test_attempt(a)
+    for t in trades:
+        writer.token_trade(t)
+    for d in days:
+        writer.active_day(d)
+    writer.sync(state)
+    writer.flush()
+
+    loaded = load_user_state(backend, "alice")
+    expected = XPLedger.from_events(events)
+    assert loaded["xp_ledger"].by_day == expected.by_day
+    assert loaded["xp_ledger"].by_source == expected.by_source
+    assert len(loaded["xp_ledger"]) == 700
+    assert loaded["xp_ledger"].total_xp == expected.total_xp
+    assert list(loaded["xp_ledger"].events) == list(expected.events)
+    assert loaded["xp_events"] is loaded["xp_ledger"].events
+
+    index = AttemptIndex.from_history(attempts)
+    assert loaded["test_index"].latest == index.latest
+    assert loaded["test_index"].by_subject == index.by_subject
+    assert loaded["test_history"] == attempts[-200:]
+    assert backend.recent_test_attempts("alice", 1000) == attempts
+
+    assert loaded["token_trades"] == trades
+    assert list(loaded["days_active"]) == days
+    assert loaded["days_active"].best_streak() == 2
+    for field in ("email", "xp", "coins", "tests_taken", "token_balance", "daily_tasks_done"):
+        assert loaded[field] == state[field]
+    backend.close()
+
+
+def test_unknown_user_and_users_are_isolated(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    assert load_user_state(backend, "nobody") is None
+
+    save_user_state(backend, "alice", _session_state(_xp_events(3), _attempts(2)))
+    save_user_state(backend, "bob", _session_state([], []))
+    bob = load_user_state(backend, "bob")
+    assert len(bob["xp_ledger"]) == 0
+    assert bob["test_history"] == []
+    assert bob["test_index"].latest == {}
+    assert len(load_user_state(backend, "alice")["xp_ledger"]) == 3
+
+
+def test_accounts_need_the_registered_password(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    assert not authenticate(backend, "alice@example.com", "pw")
+
+    assert register_account(backend, "alice@example.com", "correct horse")
+    assert not register_account(backend, "alice@example.com", "other")
+    assert authenticate(backend, "alice@example.com", "correct horse")
+    assert not authenticate(backend, "alice@example.com", "other")
+    assert not authenticate(backend, "bob@example.com", "correct horse")
+    salt, digest = backend.credential("alice@example.com")
+    assert b"correct horse" not in digest
+
+
+def test_loaded_username_is_the_stored_display_name(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    state = _session_state([], [])
+    state["username"] = "Alice"
+    save_user_state(backend, "alice@example.com", state)
+    assert load_user_state(backend, "alice@example.com")["username"] == "Alice"
+
+
+def test_write_behind_batches_by_size_and_age(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    now = [0.0]
+    writer = WriteBehind(backend, "alice", batch_size=3, max_delay=5.0, clock=lambda: now[0], flush_timer=False)
+    events = _xp_events(4)
+
+    writer.xp_event(events[0])
+    writer.xp_event(events[1])
+    assert writer.batches_written == 0
+    assert backend.xp_totals("alice")[2] == 0
+
+    writer.active_day("2024-01-01")  # third record fills the batch
+    assert writer.batches_written == 1
+    assert len(writer) == 0
+    assert backend.xp_totals("alice")[2] == 2
+    assert backend.active_days("alice") == ["2024-01-01"]
+
+    writer.xp_event(events[2])
+    now[0] = 6.0
+    writer.xp_event(events[3])  # oldest pending record is now too old
+    assert writer.batches_written == 2
+    assert backend.xp_totals("alice")[2] == 4
+
+    assert writer.flush() == 0
+    assert writer.batches_written == 2
+
+
+def test_active_days_are_deduplicated(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    writer = WriteBehind(backend, "alice")
+    today = date(2024, 3, 1).isoformat()
+    writer.active_day(today)
+    writer.active_day(today)
+    writer.flush()
+    writer.active_day(today)
+    writer.flush()
+    assert backend.active_days("alice") == [today]
+
+
+def test_get_backend_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("QBFE_STATE_DB", "off")
+    assert get_backend() is None
+
+
+def test_state_backend_requires_every_method():
+    with pytest.raises(TypeError):
+        StateBackend()
+
+    class Partial(StateBackend):
+        def load_profile(self, user_id):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_save_user_state_keeps_history_beyond_ring_buffer(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    events = _xp_events(700)
+    state = _session_state([], [])
+    state["xp_ledger"] = XPLedger.from_events(events, keep_evicted=True)
+    assert len(state["xp_ledger"].events) == 500
+
+    save_user_state(backend, "alice", state)
+    by_day, by_source, count, total = backend.xp_totals("alice")
+    assert count == 700
+    assert total == sum(e["amount"] for e in events)
+    assert backend.recent_xp_events("alice", 1000) == events
+
+
+def test_concurrent_sessions_add_up_instead_of_overwriting(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    save_user_state(backend, "alice", _session_state(_xp_events(2), []))
+    start = load_user_state(backend, "alice")
+
+    # Two tabs (or replicas) load the same state and change it independently.
+    tabs = [load_user_state(backend, "alice") for _ in range(2)]
+    writers = [WriteBehind(backend, "alice", baseline=tab) for tab in tabs]
+    for tab, writer, (coins, tokens) in zip(tabs, writers, [(5, 0.25), (-3, 1.0)]):
+        event = {"ts": "2024-03-01T10:00:00", "source": "Test", "amount": 10, "description": ""}
+        tab["xp_ledger"].record(event)
+        tab["xp"] += 10
+        tab["coins"] += coins
+        tab["token_balance"] += tokens
+        writer.xp_event(event)
+        writer.sync(tab)
+    for writer in writers:
+        writer.flush()
+
+    merged = load_user_state(backend, "alice")
+    assert merged["coins"] == start["coins"] + 2
+    assert merged["token_balance"] == round(start["token_balance"] + 1.25, 2)
+    assert merged["xp"] == start["xp"] + 20 == merged["xp_ledger"].total_xp
+    assert merged["tests_taken"] == 0
+
+    writers[0].sync(tabs[0])  # unchanged since the last sync: no new delta
+    writers[0].flush()
+    assert load_user_state(backend, "alice")["coins"] == merged["coins"]
+
+
+def test_sync_stages_only_changes_and_thresholds_decide_flush(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    state = _session_state([], [])
+    save_user_state(backend, "alice", state)
+    now = [0.0]
+    writer = WriteBehind(
+        backend, "alice", batch_size=10, max_delay=5.0, clock=lambda: now[0], baseline=state, flush_timer=False,
+    )
+
+    assert writer.sync(state) is False  # a rerun that changed nothing
+    assert len(writer) == 0
+
+    state["daily_tasks_done"]["2024-02-02"] = ["quiz"]  # mutated in place
+    state["coins"] += 1
+    assert writer.sync(state) is True
+    assert writer.sync(state) is False
+    assert len(writer) == 2
+    assert writer.maybe_flush() == 0  # neither full nor old yet
+    assert backend.counters("alice")["coins"] == 42
+
+    now[0] = 6.0
+    assert writer.maybe_flush() == 2
+    assert backend.counters("alice")["coins"] == 43
+    assert load_user_state(backend, "alice")["daily_tasks_done"]["2024-02-02"] == ["quiz"]
+
+
+def test_pending_writes_are_flushed_when_the_writer_is_collected(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    writer = WriteBehind(backend, "alice")
+    writer.active_day("2024-01-01")
+    assert backend.active_days("alice") == []
+
+    del writer
+    gc.collect()
+    assert backend.active_days("alice") == ["2024-01-01"]
+
+
+def test_idle_writer_is_flushed_by_its_timer(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "state.sqlite3"))
+    writer = WriteBehind(backend, "alice", max_delay=0.05)
+    writer.active_day("2024-01-01")
+    assert backend.active_days("alice") == []
+
+    deadline = time.monotonic() + 5
+    while not backend.active_days("alice") and time.monotonic() < deadline:
+        time.sleep(0.01)  # no further calls on the writer
+    assert backend.active_days("alice") == ["2024-01-01"]
+    assert len(writer) == 0
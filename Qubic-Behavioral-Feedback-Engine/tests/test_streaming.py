@@ -0,0 +1,68 @@
+import json
+from datetime import datetime, timedelta
+
+from metrics_engine import MetricsEngine
+from metrics_engine.metrics_engine import _build_demo_events, _day_index, _score_user_events
+
+
+def _flatten(user_events):
+    return [ev for events in user_events.values() for ev in events]
+
+
+def test_engine_matches_batch_scoring():
+    user_events = _build_demo_events([], num_other_users=30, days=10, seed=5)
+    engine = MetricsEngine(days=10)
+    assert engine.ingest_batch(_flatten(user_events)) == engine.events_ingested
+
+    days_list, daily_scores, BMS = _score_user_events(user_events, 10)
+    result = engine.metrics()
+    assert result["days"] == days_list
+    assert result["daily_scores"] == daily_scores
+    assert result["BMS"] == BMS
+    assert engine.bms("user_3") == BMS["user_3"]
+
+
+def test_engine_rescores_only_dirty_days():
+    user_events = _build_demo_events([], num_other_users=20, days=7, seed=11)
+    engine = MetricsEngine(days=7)
+    engine.ingest_batch(_flatten(user_events))
+    engine.metrics()
+    assert not engine._dirty
+
+    today = datetime.utcnow()
+    engine.ingest({"user_id": "user_1", "timestamp": today, "action_type": "SWAP", "amount": 80})
+    assert engine._dirty == {_day_index(today)}
+
+    user_events["user_1"].append(
+        {"user_id": "user_1", "timestamp": today, "action_type": "swap", "amount": 80.0}
+    )
+    _, daily_scores, BMS = _score_user_events(user_events, 7)
+    assert engine.user_scores("user_1") == daily_scores["user_1"]
+    assert engine.metrics()["BMS"] == BMS
+
+
+def test_new_user_invalidates_every_day():
+    engine = MetricsEngine(days=3)
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    engine.ingest({"user_id": "a", "timestamp": yesterday, "action_type": "buy", "amount": 10})
+    assert engine.user_scores("a")[yesterday.strftime("%Y-%m-%d")]["TES"] == 100.0
+
+    engine.ingest({"user_id": "b", "timestamp": datetime.utcnow(), "action_type": "buy", "amount": 10})
+    assert engine.user_scores("a")[yesterday.strftime("%Y-%m-%d")]["TES"] == 50.0
+
+
+def test_state_round_trips_through_json():
+    events = _flatten(_build_demo_events([], num_other_users=20, days=8, seed=6))
+    half = len(events) // 2
+    engine = MetricsEngine(days=8)
+    engine.ingest_batch(events[:half])
+
+    restored = MetricsEngine(days=8)
+    restored.ingest_batch(events[half:])  # replaced by load_state
+    restored.load_state(json.loads(json.dumps(engine.state())))
+    assert restored.metrics() == engine.metrics()
+    assert restored.events_ingested == half
+
+    engine.ingest_batch(events[half:])
+    restored.ingest_batch(events[half:])
+    assert restored.metrics() == engine.metrics()
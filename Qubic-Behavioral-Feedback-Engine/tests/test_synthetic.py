@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from metrics_engine.metrics_engine import ACTION_WEIGHTS, _day_index, compute_metrics  # noqa: E402
+from metrics_engine import synthetic  # noqa: E402
+from metrics_engine.synthetic import build_demo_store, iter_crowd_chunks  # noqa: E402
+
+
+def test_chunks_are_reproducible_and_bounded():
+    now = datetime(2025, 3, 10, 12, 0, 0)
+    first = list(iter_crowd_chunks(2500, days=5, seed=3, chunk_users=1000, now=now))
+    second = list(iter_crowd_chunks(2500, days=5, seed=3, chunk_users=1000, now=now))
+    assert [c["first_user"] for c in first] == [0, 1000, 2000]
+    for a, b in zip(first, second):
+        for key in ("user", "timestamp", "action", "amount"):
+            assert np.array_equal(a[key], b[key])
+
+    chunk = first[1]
+    assert chunk["user"].min() >= 1000 and chunk["user"].max() < 2000
+    days = chunk["timestamp"] // 86400
+    assert days.min() >= _day_index(now) - 4 and days.max() == _day_index(now)
+    assert chunk["action"].max() < len(ACTION_WEIGHTS)
+    assert 5 <= chunk["amount"].min() and chunk["amount"].max() <= 200
+    # 0..6 actions per user-day averages 3.
+    assert abs(len(chunk["amount"]) / (1000 * 5) - 3.0) < 0.2
+
+
+def test_output_does_not_depend_on_chunk_users(monkeypatch):
+    # Small stream blocks so chunks start and end inside blocks.
+    monkeypatch.setattr(synthetic, "STREAM_BLOCK_USERS", 300)
+    now = datetime(2025, 3, 10, 12, 0, 0)
+
+    def crowd(chunk_users):
+        chunks = list(iter_crowd_chunks(2500, days=5, seed=3, chunk_users=chunk_users, now=now))
+        return {key: np.concatenate([c[key] for c in chunks]) for key in ("user", "timestamp", "action", "amount")}
+
+    expected = crowd(2500)
+    for chunk_users in (1, 700, 1000):
+        actual = crowd(chunk_users)
+        for key in expected:
+            assert np.array_equal(actual[key], expected[key])
+    assert not np.array_equal(
+        next(iter_crowd_chunks(10, days=5, seed=4, now=now))["amount"][:10], expected["amount"][:10]
+    )
+
+    stores = [build_demo_store([], num_other_users=300, days=5, seed=8, chunk_users=c) for c in (300, 64)]
+    assert stores[0].user == stores[1].user
+    assert stores[0].timestamp == stores[1].timestamp
+    assert stores[0].amount == stores[1].amount
+
+
+def test_demo_store_feeds_compute_metrics():
+    store = build_demo_store([{"action_type": "Buy", "amount": 25}], num_other_users=50, days=7, seed=1)
+    assert store.users.values[:2] == ["you", "user_1"]
+    assert len(store.users) == 51
+    assert store.action_types.values[store.action[0]] == "buy"
+
+    for backend in ("python", "numpy"):
+        result = compute_metrics([], num_other_users=50, days=7, seed=1, generator="numpy", backend=backend)
+        assert len(result["days"]) == 7
+        assert len(result["BMS"]) == 51
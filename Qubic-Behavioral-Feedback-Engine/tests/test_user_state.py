@@ -0,0 +1,157 @@
+import random
+from datetime import date, datetime, timedelta
+
+from user_state import ActivityDays, AttemptIndex, DerivedState, XPLedger
+
+
+def _xp_events(n, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        {
+            "ts": (start + timedelta(minutes=rng.randint(0, 60 * 24 * 30))).isoformat(timespec="seconds"),
+            "source": rng.choice(["Test", "Daily task", "Shop"]),
+            "amount": rng.randint(1, 200),
+            "description": f"event {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def test_xp_ledger_totals_survive_ring_buffer_eviction():
+    events = _xp_events(300)
+    ledger = XPLedger.from_events(events, maxlen=50)
+
+    by_day, by_source = {}, {}
+    for e in events:
+        day = e["ts"].split("T")[0]
+        by_day[day] = by_day.get(day, 0) + e["amount"]
+        by_source[e["source"]] = by_source.get(e["source"], 0) + e["amount"]
+
+    assert ledger.by_day == by_day
+    assert ledger.by_source == by_source
+    assert len(ledger) == 300
+    assert ledger.total_xp == sum(e["amount"] for e in events)
+    assert list(ledger.events) == events[-50:]
+    assert ledger.recent(3) == events[::-1][:3]
+
+
+def _reference_streak(days_active, today):
+    """The list-based `compute_streak` this structure replaced."""
+    if not days_active:
+        return 0
+    dates = sorted(date.fromisoformat(d) for d in days_active)
+    streak = 0
+    cursor = today
+    while cursor in dates:
+        streak += 1
+        cursor = cursor - timedelta(days=1)
+    return streak
+
+
+def _reference_best_streak(days_active):
+    """The list-based `compute_best_streak` this structure replaced."""
+    if not days_active:
+        return 0
+    dates_list = sorted(date.fromisoformat(d) for d in days_active)
+    best = current = 1
+    for i in range(1, len(dates_list)):
+        if dates_list[i] == dates_list[i - 1] + timedelta(days=1):
+            current += 1
+            best = max(best, current)
+        else:
+            current = 1
+    return best
+
+
+def test_activity_days_streaks_match_list_implementation():
+    rng = random.Random(3)
+    today = date(2024, 3, 31)
+    for _ in range(200):
+        days = []
+        activity = ActivityDays()
+        # Random insertion order, including days out of order and repeats.
+        for _ in range(rng.randint(0, 40)):
+            day = (today - timedelta(days=rng.randint(0, 60))).isoformat()
+            if day not in days:
+                days.append(day)
+            activity.add(day)
+
+            assert activity.current_streak(today) == _reference_streak(days, today)
+            assert activity.best_streak() == _reference_best_streak(days)
+        assert list(activity) == sorted(days)
+        if days:
+            assert activity[-1] == max(days)
+            assert days[0] in activity
+
+
+def test_activity_days_add_reports_new_days():
+    activity = ActivityDays(["2024-01-02"])
+    assert activity.add("2024-01-01") is True
+    assert activity.add("2024-01-02") is False
+    assert len(activity) == 2
+    assert activity.current_streak(date(2024, 1, 2)) == 2
+    assert activity.current_streak(date(2024, 1, 3)) == 0
+
+
+def test_derived_state_recomputes_only_after_bump():
+    derived = DerivedState()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    first = derived.get("catalog", compute, "2024-01-01")
+    assert derived.get("catalog", compute, "2024-01-01") is first
+    assert len(calls) == 1
+
+    derived.bump()
+    assert derived.get("catalog", compute, "2024-01-01") == {"n": 2}
+    # A different extra key (e.g. the next day) also misses.
+    assert derived.get("catalog", compute, "2024-01-02") == {"n": 3}
+    assert len(calls) == 3
+
+
+def test_attempt_index_matches_history_scans():
+    rng = random.Random(5)
+    history = [
+        {"test_id": f"t{rng.randint(0, 9)}", "subject": rng.choice(["Risk", "Emotion"]), "xp_gained": rng.randint(0, 200)}
+        for _ in range(500)
+    ]
+    index = AttemptIndex.from_history(history)
+
+    for test_id in {a["test_id"] for a in history}:
+        assert index.latest[test_id] is next(a for a in reversed(history) if a["test_id"] == test_id)
+    for subject, totals in index.by_subject.items():
+        runs = [a for a in history if a["subject"] == subject]
+        assert totals == {"xp": sum(a["xp_gained"] for a in runs), "tests": len(runs)}
+
+
+def test_xp_ledger_keeps_evicted_events_on_request():
+    events = _xp_events(80)
+    ledger = XPLedger.from_events(events, maxlen=50, keep_evicted=True)
+    assert len(ledger.events) == 50
+    assert ledger.all_events() == events
+
+    ledger.drop_evicted()
+    ledger.record(events[0])
+    assert ledger.evicted == []
+    assert ledger.all_events() == events[31:] + [events[0]]
+    assert XPLedger.from_events(events, maxlen=50).all_events() == events[30:]
+
+
+def test_xp_ledger_compacts_evicted_events_past_the_cap():
+    events = _xp_events(2000)
+    ledger = XPLedger.from_events(events, maxlen=50, keep_evicted=True, max_evicted=400)
+    assert len(ledger.evicted) <= 400
+    assert len(ledger.events) == 50
+
+    kept = ledger.all_events()
+    assert sum(e["amount"] for e in kept) == ledger.total_xp
+    by_day, by_source = {}, {}
+    for e in kept:
+        by_day[e["ts"][:10]] = by_day.get(e["ts"][:10], 0) + e["amount"]
+        by_source[e["source"]] = by_source.get(e["source"], 0) + e["amount"]
+    assert by_day == ledger.by_day
+    assert by_source == ledger.by_source